@@ -0,0 +1,77 @@
+"""Compares local language detection with the translation round trip it replaces.
+
+The texts are the sentences of the detector samples cut into messages of a few words,
+the remote case detects the same messages through the local mock server. Run from the
+repository root:
+
+    python benchmarks/detection.py --messages 500 --latency 0.05
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import LocalTransport, MockConfig, MockServer
+from mintrans import GoogleTranslator, LanguageDetector
+from mintrans.language_profiles import SAMPLES
+
+
+def make_messages(count: int, words: int) -> list[tuple[str, str]]:
+    messages = []
+    for language, sample in SAMPLES.items():
+        for sentence in re.split(r"(?<=[.?!])\s+", sample):
+            tokens = sentence.split()
+            for start in range(0, len(tokens), words):
+                messages.append((language, " ".join(tokens[start:start + words])))
+    return [messages[index % len(messages)] for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--words", type=int, default=6, help="words per message")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency in seconds")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages, args.words)
+    texts = [text for _, text in messages]
+    detector = LanguageDetector(trigrams=True)
+    detector.classify(texts[0])
+
+    started = time.perf_counter()
+    classified = [detector.classify(text) for text in texts]
+    local_elapsed = time.perf_counter() - started
+    answered = [(language, result) for (language, _), result in zip(messages, classified) if result is not None]
+    correct = sum(result[0] == language for language, result in answered)
+
+    with MockServer(config=MockConfig(latency=args.latency)) as server:
+        translator = GoogleTranslator()
+        translator.client = httpx.Client(transport=LocalTransport(server.port))
+        remote_texts = texts[:50]
+        started = time.perf_counter()
+        for text in remote_texts:
+            translator.detect_language(text)
+        remote_elapsed = (time.perf_counter() - started) / len(remote_texts)
+
+        translator = GoogleTranslator(detector=LanguageDetector(trigrams=True))
+        translator.client = httpx.Client(transport=LocalTransport(server.port))
+        before = server.requests.get("google", 0)
+        started = time.perf_counter()
+        translator.detect_languages(texts)
+        batch_elapsed = time.perf_counter() - started
+        batch_requests = server.requests.get("google", 0) - before
+
+    print(f"{len(texts)} messages of {args.words} words in {len(SAMPLES)} languages")
+    print(f"local:  {local_elapsed / len(texts) * 1e6:8.1f} us/message, {len(answered) / len(texts):.0%} answered, "
+          f"{correct / max(len(answered), 1):.1%} of them correct")
+    print(f"remote: {remote_elapsed * 1e3:8.1f} ms/message")
+    print(f"detect_languages: {batch_elapsed * 1e3:.1f} ms for all messages, {batch_requests} upstream requests")
+
+
+if __name__ == "__main__":
+    main()
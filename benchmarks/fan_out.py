@@ -0,0 +1,57 @@
+"""Compares translate_to_many with one translate_text call per target language.
+
+Runs against the local mock server with a fixed latency per request. Run from the
+repository root:
+
+    python benchmarks/fan_out.py --targets 30 --latency 0.05
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import LocalTransport, MockConfig, MockServer
+from mintrans import BingTranslator, GoogleTranslator
+
+LANGUAGES = [
+    "de", "fr", "es", "it", "pt", "nl", "tr", "pl", "sv", "da", "fi", "cs", "ro", "hu", "id",
+    "vi", "ru", "uk", "bg", "ja", "ko", "ar", "he", "el", "th", "hi", "bn", "fa", "ur", "ms",
+]
+TEXT = "Your order has shipped and will arrive on Tuesday."
+
+
+def measure(server: MockServer, translator_class, call) -> tuple[float, int]:
+    translator = translator_class()
+    translator.client = httpx.Client(transport=LocalTransport(server.port))
+    before = server.requests.get(translator.engine, 0)
+    started = time.perf_counter()
+    call(translator)
+    return time.perf_counter() - started, server.requests.get(translator.engine, 0) - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency in seconds")
+    args = parser.parse_args()
+    targets = LANGUAGES[:args.targets]
+
+    with MockServer(config=MockConfig(latency=args.latency)) as server:
+        for translator_class in (GoogleTranslator, BingTranslator):
+            loop_elapsed, loop_requests = measure(
+                server, translator_class, lambda translator: [translator.translate_text(TEXT, target) for target in targets]
+            )
+            many_elapsed, many_requests = measure(
+                server, translator_class, lambda translator: translator.translate_to_many(TEXT, targets)
+            )
+            print(f"{translator_class.__name__}: {len(targets)} targets")
+            print(f"  translate_text loop: {loop_elapsed * 1e3:7.1f} ms, {loop_requests} requests")
+            print(f"  translate_to_many:   {many_elapsed * 1e3:7.1f} ms, {many_requests} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Times the batchexecute response parser on large plain and chunked bodies.
+
+The formatter mintrans shipped before the chunked parser is kept here as the baseline,
+it only reads plain bodies and the first segment of every translation. Run from the
+repository root:
+
+    python benchmarks/google_parser.py --envelopes 50 --segments 40
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mock_server import google_body
+from mintrans.batchexecute import iter_entries
+from mintrans.tools import google_batch_text_response_formatter
+
+SENTENCE = "Bu, karşılaştırma için uzunca bir çeviri cümlesidir ve %20 gibi kaçışlar içerir. "
+
+
+def legacy_batch_formatter(data: str) -> dict[str, dict[str, str]]:
+    results = {}
+    for entry in json.loads(unquote(data)[5:].strip()):
+        if entry[0] != "wrb.fr" or entry[1] != "MkEWBc" or not entry[2]:
+            continue
+        cleaned_data = json.loads(entry[2])[1]
+        results[entry[-1]] = {
+            "text": cleaned_data[0][0][5][0][0],
+            "target_language": cleaned_data[1],
+            "source_language": cleaned_data[3],
+        }
+    return results
+
+
+def make_entries(envelopes: int, segments: int) -> list:
+    entries = []
+    for index in range(envelopes):
+        inner = [
+            [None, None, "en"],
+            [[[None, None, None, True, None, [[SENTENCE, None] for _ in range(segments)]]], "tr", 1, "en"],
+        ]
+        entries.append(["wrb.fr", "MkEWBc", json.dumps(inner), None, None, None, str(index + 1)])
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envelopes", type=int, default=50)
+    parser.add_argument("--segments", type=int, default=40)
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=16384, help="text chunk size of the incremental case")
+    args = parser.parse_args()
+
+    entries = make_entries(args.envelopes, args.segments)
+    trailer = [["di", 12], ["af.httprm", 11, "-1", 1]]
+    plain = google_body(entries, trailer)
+    chunked = google_body(entries, trailer, chunked=True)
+    chunks = [chunked[index:index + args.chunk_size] for index in range(0, len(chunked), args.chunk_size)]
+
+    expected = " ".join([SENTENCE] * args.segments)
+    assert google_batch_text_response_formatter(plain)["1"]["text"] == expected
+    assert google_batch_text_response_formatter(chunked)["1"]["text"] == expected
+    assert len(list(iter_entries(chunks))) == args.envelopes + len(trailer)
+
+    cases = {
+        "legacy formatter, plain": lambda: legacy_batch_formatter(plain),
+        "parser, plain": lambda: google_batch_text_response_formatter(plain),
+        "parser, chunked": lambda: google_batch_text_response_formatter(chunked),
+        "frames only, incremental": lambda: list(iter_entries(chunks)),
+    }
+    print(f"body: {len(plain) / 1024:.0f} KiB plain, {len(chunked) / 1024:.0f} KiB chunked, {args.envelopes} envelopes")
+    print(f"{'case':30} {'ms/body':>10} {'MiB/s':>8}")
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=args.number) / args.number
+        print(f"{name:30} {elapsed * 1000:10.2f} {len(plain) / elapsed / 2 ** 20:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
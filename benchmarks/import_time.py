@@ -0,0 +1,52 @@
+"""Measures the cold import cost of mintrans in fresh interpreters.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import mintrans": "import mintrans",
+    "from mintrans import RateLimitException": "from mintrans import RateLimitException",
+    "from mintrans import GoogleTranslator": "from mintrans import GoogleTranslator",
+    # Everything the package used to load up front, engines, models, httpx and pydantic.
+    "import every submodule (eager)": "import mintrans.mintrans, mintrans.router",
+}
+
+TEMPLATE = "import time; started = time.perf_counter(); {statement}; print(time.perf_counter() - started)"
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(statement=statement)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'scenario':45} {'median ms':>10} {'min ms':>10}")
+    for name, statement in SCENARIOS.items():
+        timings = measure(statement, args.runs)
+        print(f"{name:45} {statistics.median(timings) * 1000:10.2f} {min(timings) * 1000:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
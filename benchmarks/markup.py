@@ -0,0 +1,88 @@
+"""Compares translating whole HTML pages with translating only their text nodes.
+
+The pages are generated shop listings with shared navigation, repeated labels, inline
+styles and scripts. The whole-page case sends every page through translate_long_text,
+the markup case sends the distinct text nodes of all pages with translate_markups. Run
+from the repository root:
+
+    python benchmarks/markup.py --pages 5 --products 40 --engine bing
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import LocalTransport, MockServer
+from mintrans import BingTranslator, DeepLTranslator, GoogleTranslator, Metrics
+
+CLASSES = {"google": GoogleTranslator, "bing": BingTranslator, "deepl": DeepLTranslator}
+WORDS = "quality fresh handmade organic durable light classic modern soft warm compact elegant".split()
+NAVIGATION = "".join(
+    f'<li class="nav-item"><a class="nav-link" href="/{label.lower()}">{label}</a></li>'
+    for label in ("Home", "Products", "Offers", "About us", "Contact")
+)
+
+
+def make_page(page: int, products: int) -> str:
+    rng = random.Random(page)
+    cards = []
+    for index in range(products):
+        name = " ".join(rng.choice(WORDS) for _ in range(3)).capitalize()
+        cards.append(
+            f'<div class="card product-card col-md-4" data-id="{page}-{index}" style="margin: 4px; padding: 8px">'
+            f'<img src="/images/{page}-{index}.jpg" alt="" class="card-img-top" loading="lazy">'
+            f'<h3 class="card-title">{name}</h3>'
+            f'<p class="card-text">A {rng.choice(WORDS)} item for {{name}}, only <b>{rng.randint(5, 90)} EUR</b>.</p>'
+            f'<span class="badge badge-success">In stock</span>'
+            f'<button type="button" class="btn btn-primary" onclick="addToCart(\'{page}-{index}\')">Add to cart</button>'
+            f"</div>"
+        )
+    return (
+        f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Shop page {page}</title>'
+        f"<style>.card {{ border: 1px solid #ddd; }} .badge {{ font-size: 0.8em; }}</style></head>"
+        f'<body><nav class="navbar"><ul class="navbar-nav">{NAVIGATION}</ul></nav>'
+        f'<main class="container"><div class="row">{"".join(cards)}</div></main>'
+        f'<footer class="footer"><p>All prices include VAT.</p></footer>'
+        f'<script>window.dataLayer = window.dataLayer || []; function addToCart(id) {{ dataLayer.push({{id: id}}); }}</script>'
+        f"</body></html>"
+    )
+
+
+def measure(server: MockServer, translator_class, call) -> tuple[int, int]:
+    metrics = Metrics()
+    translator = translator_class(metrics=metrics)
+    translator.client = httpx.Client(transport=LocalTransport(server.port))
+    call(translator)
+    counters = metrics.snapshot()[translator.engine]["counters"]
+    return counters.get("requests", 0), counters.get("bytes_sent", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--products", type=int, default=40, help="product cards per page")
+    parser.add_argument("--engine", choices=CLASSES, default="bing")
+    args = parser.parse_args()
+    pages = [make_page(page, args.products) for page in range(args.pages)]
+    translator_class = CLASSES[args.engine]
+
+    with MockServer() as server:
+        whole_requests, whole_bytes = measure(
+            server, translator_class, lambda translator: [translator.translate_long_text(page, "de", "en") for page in pages]
+        )
+        markup_requests, markup_bytes = measure(
+            server, translator_class, lambda translator: translator.translate_markups(pages, "de", "en")
+        )
+
+    print(f"{args.pages} pages, {sum(map(len, pages)) / 1024:.0f} KiB of HTML, {args.engine}")
+    print(f"whole pages: {whole_requests:5d} requests, {whole_bytes / 1024:8.1f} KiB sent")
+    print(f"text nodes:  {markup_requests:5d} requests, {markup_bytes / 1024:8.1f} KiB sent")
+    print(f"reduction:   {whole_requests / max(markup_requests, 1):5.1f}x requests, {whole_bytes / max(markup_bytes, 1):5.1f}x bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measures writing and querying a large translation memory file.
+
+The entries are random sentences ending in a sequence number, the queries are the same
+sentences with other numbers and punctuation (template matches), with one word changed
+(fuzzy matches) and unrelated sentences (misses). Run from the repository root:
+
+    python benchmarks/memory.py --entries 200000
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mintrans.memory import MemoryEntry, TranslationMemory, write_memory_file
+
+
+def make_sentences(count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+    return [" ".join(rng.choice(words) for _ in range(6)) + f" item {index}" for index in range(count)]
+
+
+def timed(queries: list[str], memory: TranslationMemory, check) -> tuple[int, float]:
+    hits = 0
+    started = time.perf_counter()
+    for query in queries:
+        hits += check(query, memory.lookup(query, "tr", "en"))
+    return hits, (time.perf_counter() - started) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    sentences = make_sentences(args.entries)
+    entries = (MemoryEntry(f"{sentence} code{index}", f"[{sentence}] code{index}", "tr", "en", "google")
+               for index, sentence in enumerate(sentences))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memory.tm")
+        started = time.perf_counter()
+        written = write_memory_file(path, entries)
+        write_elapsed = time.perf_counter() - started
+        size = os.path.getsize(path)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+        picked = random.Random(2).sample(range(args.entries), min(args.queries, args.entries))
+        templates = [f"{sentences[index].rsplit(' ', 1)[0]} {index + 7} code{index}." for index in picked]
+        fuzzy = []
+        for index in picked:
+            words = sentences[index].split()
+            words[2] = "zzword"
+            fuzzy.append(f"{' '.join(words)} code{index}")
+        misses = [f"totally unrelated sentence number {index} here" for index in picked]
+
+        with TranslationMemory(path) as memory:
+            template_hits, template_elapsed = timed(templates, memory, lambda query, match: match is not None)
+            fuzzy_hits, fuzzy_elapsed = timed(fuzzy, memory, lambda query, match: match is not None and "zzword" in match.text)
+            miss_hits, miss_elapsed = timed(misses, memory, lambda query, match: match is not None)
+
+    print(f"write:    {written} entries in {write_elapsed:.1f} s, {size / 2 ** 20:.1f} MiB, peak rss {peak} MiB")
+    print(f"template: {template_elapsed * 1e3:6.3f} ms/lookup, {template_hits}/{len(templates)} found")
+    print(f"fuzzy:    {fuzzy_elapsed * 1e3:6.3f} ms/lookup, {fuzzy_hits}/{len(fuzzy)} found")
+    print(f"miss:     {miss_elapsed * 1e3:6.3f} ms/lookup, {miss_hits}/{len(misses)} false matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Local stand-in for the Bing, DeepL and Google endpoints used by the translators.
+
+Translations are echoed back unchanged so results can be checked. Latency, errors,
+captchas and rate limits can be injected to see how the client behaves under them.
+
+    python benchmarks/mock_server.py --port 8765 --latency 0.05 --captcha-rate 0.01
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httpx
+
+BING_PAGE = 'var params_AbusePreventionHelper = [1700000000000,"mock-token",3600000];IG:"MOCKIG";'
+
+
+class MockConfig:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        captcha_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: int = 10,):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.captcha_rate = captcha_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+
+
+class _Budget:
+    """Server side token bucket, one per engine."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def google_frame(envelope_id: str, text: str, source_language: str, target_language: str) -> list:
+    inner = [
+        [None, None, None, [[[0, [[[None, 5]]]]]]],
+        [[[None, None, None, None, None, [[text, None]]]], target_language, 1, source_language],
+    ]
+    return ["wrb.fr", "MkEWBc", json.dumps(inner), None, None, None, envelope_id]
+
+
+def google_body(entries: list, trailer: list, chunked: bool = False) -> str:
+    """Plain bodies hold one frame, chunked ones (`rt=c`) a length-prefixed frame per result."""
+    if not chunked:
+        return ")]}'\n\n" + json.dumps(entries + trailer)
+    frames = [json.dumps([entry]) for entry in entries] + [json.dumps(trailer)]
+    return ")]}'\n\n" + "".join(f"{len(frame) + 1}\n{frame}\n" for frame in frames)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without this delayed ACKs add ~40ms per call.
+    disable_nagle_algorithm = True
+    server: "MockServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body: str, content_type: str = "application/json", headers: Optional[dict] = None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", content_type)
+        self.send_header("content-length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _engine(self) -> Optional[str]:
+        path = urlsplit(self.path).path
+        if path.startswith("/translator") or path.startswith("/ttranslatev3"):
+            return "bing"
+        if path.startswith("/jsonrpc"):
+            return "deepl"
+        if path.endswith("/batchexecute"):
+            return "google"
+        return None
+
+    def _inject(self, engine: str) -> bool:
+        """Applies latency, rate limits and errors, returns True when a reply was already sent."""
+        config = self.server.config
+        self.server.count(engine)
+        if config.latency or config.jitter:
+            time.sleep(max(0.0, config.latency + random.uniform(-config.jitter, config.jitter)))
+        if config.rate_limit and not self.server.budget(engine).take():
+            self._reply(429, "{}", headers={"retry-after": "1"})
+            return True
+        if config.error_rate and random.random() < config.error_rate:
+            self._reply(500, "internal error", content_type="text/plain")
+            return True
+        return False
+
+    def do_GET(self):
+        if self._engine() != "bing":
+            return self._reply(404, "{}")
+        if self._inject("bing"):
+            return
+        self._reply(200, BING_PAGE, content_type="text/html")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("content-length", 0))).decode("utf-8")
+        engine = self._engine()
+        if engine is None:
+            return self._reply(404, "{}")
+        if self._inject(engine):
+            return
+        getattr(self, f"_{engine}")(body)
+
+    def _bing(self, body: str):
+        if self.server.config.captcha_rate and random.random() < self.server.config.captcha_rate:
+            return self._reply(200, json.dumps({"ShowCaptcha": True}))
+        form = parse_qs(body, keep_blank_values=True)
+        text = form.get("text", [""])[0]
+        if len(text) > 1000:
+            return self._reply(200, json.dumps({"statusCode": 400}))
+        source_language = form.get("fromLang", ["auto-detect"])[0]
+        self._reply(200, json.dumps([{
+            "detectedLanguage": {"language": "en" if source_language == "auto-detect" else source_language, "score": 1.0},
+            "translations": [{"text": text, "to": form.get("to", [""])[0]}],
+        }]))
+
+    def _deepl(self, body: str):
+        payload = json.loads(body)
+        lang = payload["params"]["lang"]
+        translations = [
+            {"beams": [{"sentences": [{"text": sentence["text"], "ids": [sentence["id"]]} for sentence in job["sentences"]]}]}
+            for job in payload["params"]["jobs"]
+        ]
+        self._reply(200, json.dumps({
+            "jsonrpc": "2.0",
+            "result": {
+                "translations": translations,
+                "source_lang": lang.get("source_lang_computed", "EN").upper(),
+                "target_lang": lang["target_lang"].upper(),
+            },
+        }))
+
+    def _google(self, body: str):
+        f_req = parse_qs(body).get("f.req", [""])[0] or unquote(body.partition("=")[2])
+        frames = []
+        for rpc_id, arguments, _, envelope_id in json.loads(f_req)[0]:
+            if rpc_id == "WqWDPb":
+                (encoded, mime_type), source_language, target_language = json.loads(arguments)
+                inner = [[encoded, mime_type], [["mock recognized text"], ["mock translated text"]]]
+                frames.append(["wrb.fr", "WqWDPb", json.dumps(inner), None, None, None, envelope_id])
+                continue
+            if rpc_id != "MkEWBc":
+                continue
+            (text, source_language, target_language, _), _ = json.loads(arguments)[:2]
+            frames.append(google_frame(envelope_id, text, "en" if source_language == "auto" else source_language, target_language))
+        trailer = [["di", 12], ["af.httprm", 11, "-1", 1]]
+        self._reply(200, google_body(frames, trailer, chunked="rt=c" in urlsplit(self.path).query), content_type="application/json+protobuf")
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops concurrent connects, which then retry after a second.
+    request_queue_size = 128
+
+    def __init__(self, port: int = 0, config: Optional[MockConfig] = None):
+        super().__init__(("127.0.0.1", port), MockHandler)
+        self.config = config if config is not None else MockConfig()
+        self.requests: dict[str, int] = {}
+        self._budgets: dict[str, _Budget] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def count(self, engine: str):
+        with self._lock:
+            self.requests[engine] = self.requests.get(engine, 0) + 1
+
+    def budget(self, engine: str) -> _Budget:
+        with self._lock:
+            if engine not in self._budgets:
+                self._budgets[engine] = _Budget(self.config.rate_limit, self.config.burst)
+            return self._budgets[engine]
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def _local_request(request: httpx.Request, port: int) -> httpx.Request:
+    url = request.url.copy_with(scheme="http", host="127.0.0.1", port=port)
+    return httpx.Request(request.method, url, headers=request.headers, stream=request.stream, extensions=request.extensions)
+
+
+class LocalTransport(httpx.HTTPTransport):
+    """Sends every request to the mock server whatever host it was meant for."""
+
+    def __init__(self, port: int, **kwargs):
+        super().__init__(**kwargs)
+        self.port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return super().handle_request(_local_request(request, self.port))
+
+
+class AsyncLocalTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, port: int, **kwargs):
+        super().__init__(**kwargs)
+        self.port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await super().handle_async_request(_local_request(request, self.port))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--captcha-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    args = parser.parse_args()
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.captcha_rate, args.rate_limit)
+    server = MockServer(args.port, config)
+    print(f"Mock translation server on http://127.0.0.1:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compares the per-call overhead of the validated and the fast translation models.
+
+Run from the repository root:
+
+    python benchmarks/models.py --number 20000
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from mintrans import DeepLTranslator
+from mintrans.models import TranslationRequest, TranslationRequestData, TranslationResponse, TranslationResult
+
+TEXT = "The quick brown fox jumps over the lazy dog."
+
+
+def deepl_echo(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    sentence = payload["params"]["jobs"][0]["sentences"][0]["text"]
+    return httpx.Response(200, json={
+        "result": {
+            "translations": [{"beams": [{"sentences": [{"text": sentence}]}]}],
+            "source_lang": "EN",
+            "target_lang": "TR",
+        }
+    })
+
+
+def validated_models():
+    request = TranslationRequest(text=TEXT, source_language="EN", target_language="TR")
+    return TranslationResponse(text=request.text, source_language="EN", target_language="TR").json()
+
+
+def fast_models():
+    request = TranslationRequestData(TEXT, "EN", "TR")
+    return TranslationResult(request.text, "EN", "TR").json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {
+        "models, validate=True": timeit.timeit(validated_models, number=args.number),
+        "models, validate=False": timeit.timeit(fast_models, number=args.number),
+    }
+    for validate in (True, False):
+        translator = DeepLTranslator(validate=validate)
+        translator.client = httpx.Client(transport=httpx.MockTransport(deepl_echo))
+        # Only a tenth of the calls, the mock HTTP round trip dominates anyway.
+        number = max(1, args.number // 10)
+        elapsed = timeit.timeit(lambda: translator.translate_text(TEXT, "tr", "en"), number=number)
+        results[f"translate_text, validate={validate}"] = elapsed * args.number / number
+        translator.close()
+
+    print(f"{'case':36} {'us/call':>10}")
+    for name, elapsed in results.items():
+        print(f"{name:36} {elapsed / args.number * 1e6:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compares a translator per request with one translator shared through a TranslatorPool.
+
+The per-request case is what a threaded web server does without shared translators:
+every translation opens a new connection and, on Bing, fetches a new session first.
+Run from the repository root:
+
+    python benchmarks/pool.py --engine bing --requests 400 --workers 16 --latency 0.02
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import LocalTransport, MockConfig, MockServer
+from mintrans import BingTranslator, DeepLTranslator, GoogleTranslator, TranslatorPool
+
+CLASSES = {"google": GoogleTranslator, "bing": BingTranslator, "deepl": DeepLTranslator}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=CLASSES, default="bing")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.02, help="mock server latency in seconds")
+    args = parser.parse_args()
+    translator_class = CLASSES[args.engine]
+    texts = [f"request number {index}" for index in range(args.requests)]
+
+    with MockServer(config=MockConfig(latency=args.latency)) as server:
+        def per_request(text: str):
+            with translator_class() as translator:
+                translator.client = httpx.Client(transport=LocalTransport(server.port))
+                return translator.translate_text(text, "de", "en")
+
+        before = server.requests.get(args.engine, 0)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(per_request, texts))
+        elapsed = time.perf_counter() - started
+        print(f"per request: {args.requests / elapsed:7.1f} req/s, {server.requests.get(args.engine, 0) - before} upstream requests")
+
+        translator = translator_class()
+        translator.client = httpx.Client(transport=LocalTransport(server.port))
+        before = server.requests.get(args.engine, 0)
+        started = time.perf_counter()
+        with TranslatorPool(translator, max_workers=args.workers) as pool:
+            list(pool.translate_many(texts, "de", "en"))
+        elapsed = time.perf_counter() - started
+        print(f"pool:        {args.requests / elapsed:7.1f} req/s, {server.requests.get(args.engine, 0) - before} upstream requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compares callers with translators of their own to callers sharing a TranslationServer.
+
+Every caller thread sends single translations one after the other, either straight to
+the mock endpoints with its own GoogleTranslator or through the local server, which
+batches what arrives within the window. Run from the repository root:
+
+    python benchmarks/server.py --callers 32 --requests 20 --latency 0.05 --window-ms 10
+"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import AsyncLocalTransport, LocalTransport, MockConfig, MockServer
+from mintrans import AsyncGoogleTranslator, GoogleTranslator
+from mintrans.server import TranslationClient, TranslationServer
+
+
+def run_callers(translators: list, requests: int, target_language: str) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def caller(index: int, translator):
+        own = []
+        for number in range(requests):
+            started = time.perf_counter()
+            translator.translate_text(f"caller {index} sentence {number}", target_language, "en")
+            own.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=caller, args=(index, translator)) for index, translator in enumerate(translators)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, latencies
+
+
+def report(name: str, elapsed: float, latencies: list[float], upstream: int):
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:7} {len(latencies) / elapsed:8.1f} req/s  p50 {quantiles[49] * 1e3:6.1f} ms  "
+          f"p99 {quantiles[98] * 1e3:6.1f} ms  {upstream} upstream requests")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20, help="translations per caller")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency in seconds")
+    parser.add_argument("--window-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with MockServer(config=MockConfig(latency=args.latency)) as mock:
+        translators = []
+        for _ in range(args.callers):
+            translator = GoogleTranslator(coalesce=False)
+            translator.client = httpx.Client(transport=LocalTransport(mock.port))
+            translators.append(translator)
+        before = mock.requests.get("google", 0)
+        elapsed, latencies = run_callers(translators, args.requests, "de")
+        report("direct", elapsed, latencies, mock.requests.get("google", 0) - before)
+
+        shared = AsyncGoogleTranslator()
+        shared.client = httpx.AsyncClient(transport=AsyncLocalTransport(mock.port))
+        with TranslationServer({"google": shared}, port=0, window=args.window_ms / 1000) as server:
+            clients = [TranslationClient(f"http://127.0.0.1:{server.port}") for _ in range(args.callers)]
+            for client in clients:
+                client.translate_text("warm up", "fr", "en")
+            before, batches = mock.requests.get("google", 0), server.batcher.stats["google"]["batches"]
+            elapsed, latencies = run_callers(clients, args.requests, "de")
+            report("server", elapsed, latencies, mock.requests.get("google", 0) - before)
+            print(f"batches: {server.batcher.stats['google']['batches'] - batches}")
+
+
+if __name__ == "__main__":
+    main()
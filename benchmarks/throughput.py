@@ -0,0 +1,242 @@
+"""Measures throughput, latency and memory of the translators against the local mock server.
+
+Nothing leaves the machine, so runs of different releases can be compared. Run from
+the repository root:
+
+    python benchmarks/throughput.py --requests 200 --latency 0.02 --error-rate 0.01
+    python benchmarks/throughput.py --engines google --json results.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.mock_server import AsyncLocalTransport, LocalTransport, MockConfig, MockServer
+from mintrans import (
+    AsyncBingTranslator,
+    AsyncDeepLTranslator,
+    AsyncGoogleTranslator,
+    BingTranslator,
+    DeepLTranslator,
+    GoogleTranslator,
+    MemoryCache,
+    Metrics,
+    RetryPolicy,
+)
+
+ENGINES = {
+    "bing": (BingTranslator, AsyncBingTranslator),
+    "deepl": (DeepLTranslator, AsyncDeepLTranslator),
+    "google": (GoogleTranslator, AsyncGoogleTranslator),
+}
+SCENARIOS = ("single", "batch", "async", "cached")
+
+
+def make_texts(count: int, offset: int = 0) -> list[str]:
+    return [f"Sentence number {offset + index} of the benchmark corpus." for index in range(count)]
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class Report:
+    def __init__(self, engine: str, scenario: str, texts: int, latencies: list[float], errors: int, elapsed: float, peak_memory: int):
+        self.engine = engine
+        self.scenario = scenario
+        self.texts = texts
+        self.latencies = latencies
+        self.errors = errors
+        self.elapsed = elapsed
+        self.peak_memory = peak_memory
+
+    def as_dict(self) -> dict:
+        return {
+            "engine": self.engine,
+            "scenario": self.scenario,
+            "calls": len(self.latencies) + self.errors,
+            "errors": self.errors,
+            "texts_per_s": self.texts / self.elapsed if self.elapsed else 0.0,
+            "calls_per_s": (len(self.latencies) + self.errors) / self.elapsed if self.elapsed else 0.0,
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p95_ms": percentile(self.latencies, 95) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+            "mean_ms": statistics.fmean(self.latencies) * 1000 if self.latencies else 0.0,
+            "peak_kib": self.peak_memory / 1024,
+        }
+
+
+def timed(call: Callable, latencies: list[float]) -> bool:
+    started = time.perf_counter()
+    try:
+        call()
+    except Exception:
+        return False
+    latencies.append(time.perf_counter() - started)
+    return True
+
+
+async def timed_async(call: Callable, latencies: list[float]) -> bool:
+    started = time.perf_counter()
+    try:
+        await call()
+    except Exception:
+        return False
+    latencies.append(time.perf_counter() - started)
+    return True
+
+
+class Benchmark:
+    def __init__(
+        self,
+        port: int,
+        requests: int,
+        batch_size: int,
+        concurrency: int,
+        retry_policy: RetryPolicy,
+        metrics: Optional[Metrics] = None,):
+        self.port = port
+        self.requests = requests
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+        self.trace_memory = False
+
+    def measure(self, engine: str, scenario: str, texts: int, run: Callable[[list[float]], int]) -> Report:
+        latencies: list[float] = []
+        if self.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        errors = run(latencies)
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return Report(engine, scenario, texts, latencies, errors, elapsed, peak)
+
+    def translator(self, engine: str, cache: Optional[MemoryCache] = None):
+        translator = ENGINES[engine][0](cache=cache, retry_policy=self.retry_policy, metrics=self.metrics)
+        translator.client = httpx.Client(transport=LocalTransport(self.port))
+        return translator
+
+    def async_translator(self, engine: str):
+        translator = ENGINES[engine][1](retry_policy=self.retry_policy, metrics=self.metrics)
+        translator.client = httpx.AsyncClient(
+            transport=AsyncLocalTransport(self.port, limits=httpx.Limits(max_connections=self.concurrency))
+        )
+        return translator
+
+    def single(self, engine: str) -> Report:
+        texts = make_texts(self.requests)
+        with self.translator(engine) as translator:
+            def run(latencies):
+                return sum(not timed(lambda: translator.translate_text(text, "tr", "en"), latencies) for text in texts)
+            return self.measure(engine, "single", len(texts), run)
+
+    def batch(self, engine: str) -> Report:
+        texts = make_texts(self.requests)
+        chunks = [texts[index:index + self.batch_size] for index in range(0, len(texts), self.batch_size)]
+        with self.translator(engine) as translator:
+            def run(latencies):
+                return sum(not timed(lambda: translator.translate_batch(chunk, "tr", "en"), latencies) for chunk in chunks)
+            return self.measure(engine, "batch", len(texts), run)
+
+    def async_(self, engine: str) -> Report:
+        texts = make_texts(self.requests)
+
+        async def main(latencies):
+            translator = self.async_translator(engine)
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def one(text):
+                async with semaphore:
+                    return await timed_async(lambda: translator.translate_text(text, "tr", "en"), latencies)
+
+            try:
+                results = await asyncio.gather(*(one(text) for text in texts))
+            finally:
+                await translator.aclose()
+            return results.count(False)
+
+        return self.measure(engine, "async", len(texts), lambda latencies: asyncio.run(main(latencies)))
+
+    def cached(self, engine: str) -> Report:
+        texts = make_texts(self.requests)
+        with self.translator(engine, cache=MemoryCache(max_size=self.requests)) as translator:
+            # Texts whose warm-up failed to an injected error are simply cache misses.
+            timed(lambda: translator.translate_batch(texts, "tr", "en"), [])
+
+            def run(latencies):
+                return sum(not timed(lambda: translator.translate_text(text, "tr", "en"), latencies) for text in texts)
+            return self.measure(engine, "cached", len(texts), run)
+
+    def run(self, engine: str, scenario: str, memory: bool = True) -> Report:
+        method = getattr(self, "async_" if scenario == "async" else scenario)
+        report = method(engine)
+        if memory:
+            # tracemalloc slows everything down, so memory gets a pass of its own.
+            self.trace_memory = True
+            try:
+                report.peak_memory = method(engine).peak_memory
+            finally:
+                self.trace_memory = False
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="texts translated per scenario")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.0, help="server side delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--captcha-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests per second per engine")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--metrics", action="store_true", help="print the mean time spent in each phase")
+    parser.add_argument("--json", type=Path, default=None, help="also write the results to this file")
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.captcha_rate, args.rate_limit)
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=1.0)
+    metrics = Metrics() if args.metrics else None
+    results = []
+    with MockServer(config=config) as server:
+        benchmark = Benchmark(server.port, args.requests, args.batch_size, args.concurrency, retry_policy, metrics)
+        print(f"{'engine':8} {'scenario':8} {'calls':>6} {'errors':>6} {'texts/s':>9} {'calls/s':>9} "
+              f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KiB':>9}")
+        for engine in args.engines:
+            for scenario in args.scenarios:
+                result = benchmark.run(engine, scenario, memory=not args.no_memory).as_dict()
+                results.append(result)
+                print(f"{engine:8} {scenario:8} {result['calls']:6} {result['errors']:6} {result['texts_per_s']:9.1f} "
+                      f"{result['calls_per_s']:9.1f} {result['p50_ms']:8.2f} {result['p95_ms']:8.2f} "
+                      f"{result['p99_ms']:8.2f} {result['peak_kib']:9.1f}")
+        print(f"server requests: {server.requests}")
+    if metrics is not None:
+        for engine, values in metrics.snapshot().items():
+            phases = ", ".join(f"{phase} {value['mean'] * 1e6:.0f}us" for phase, value in values["phases"].items())
+            print(f"{engine}: {phases}")
+    if args.json is not None:
+        args.json.write_text(json.dumps({"config": vars(config), "results": results}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,108 @@
-from .mintrans import *
+"""Free Bing, DeepL and Google translation wrappers.
+
+Submodules are imported on first attribute access, so `import mintrans` stays cheap
+and httpx/pydantic only load once a translator or model is actually used.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_ATTRIBUTES = {
+    "BaseTranslator": ".mintrans",
+    "AsyncBaseTranslator": ".mintrans",
+    "BingTranslator": ".mintrans",
+    "DeepLTranslator": ".mintrans",
+    "GoogleTranslator": ".mintrans",
+    "AsyncBingTranslator": ".mintrans",
+    "AsyncDeepLTranslator": ".mintrans",
+    "AsyncGoogleTranslator": ".mintrans",
+    "RateLimitException": ".exceptions",
+    "CaptchaException": ".exceptions",
+    "EngineUnavailableException": ".exceptions",
+    "TranslationRequest": ".models",
+    "TranslationResponse": ".models",
+    "DetectedLanguageResponse": ".models",
+    "FileRequest": ".models",
+    "FileResponse": ".models",
+    "TranslationRequestData": ".models",
+    "TranslationResult": ".models",
+    "BaseCache": ".cache",
+    "CacheStats": ".cache",
+    "MemoryCache": ".cache",
+    "SQLiteCache": ".cache",
+    "TieredCache": ".cache",
+    "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".ratelimit",
+    "TransportConfig": ".transport",
+    "ProxyPool": ".transport",
+    "SharedTransport": ".transport",
+    "BingSession": ".session",
+    "BingSessionManager": ".session",
+    "DocumentPipeline": ".documents",
+    "DocumentStats": ".documents",
+    "ImageData": ".images",
+    "LanguageDetector": ".detection",
+    "TranslationMemory": ".memory",
+    "MemoryEntry": ".memory",
+    "MemoryMatch": ".memory",
+    "TranslatorPool": ".pool",
+    "translate_many": ".pool",
+    "TranslationServer": ".server",
+    "TranslationClient": ".server",
+    "AsyncTranslationClient": ".server",
+    "Metrics": ".metrics",
+    "MetricsSink": ".metrics",
+    "CallbackSink": ".metrics",
+    "EngineHealth": ".router",
+    "RouterTranslator": ".router",
+    "AsyncRouterTranslator": ".router",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .cache import BaseCache, CacheStats, MemoryCache, SQLiteCache, TieredCache
+    from .detection import LanguageDetector
+    from .documents import DocumentPipeline, DocumentStats
+    from .exceptions import CaptchaException, EngineUnavailableException, RateLimitException
+    from .memory import MemoryEntry, MemoryMatch, TranslationMemory
+    from .mintrans import (
+        AsyncBaseTranslator,
+        AsyncBingTranslator,
+        AsyncDeepLTranslator,
+        AsyncGoogleTranslator,
+        BaseTranslator,
+        BingTranslator,
+        DeepLTranslator,
+        GoogleTranslator,
+    )
+    from .images import ImageData
+    from .metrics import CallbackSink, Metrics, MetricsSink
+    from .models import (
+        DetectedLanguageResponse,
+        FileRequest,
+        FileResponse,
+        TranslationRequest,
+        TranslationRequestData,
+        TranslationResponse,
+        TranslationResult,
+    )
+    from .pool import TranslatorPool, translate_many
+    from .ratelimit import RetryPolicy, TokenBucket
+    from .router import AsyncRouterTranslator, EngineHealth, RouterTranslator
+    from .server import AsyncTranslationClient, TranslationClient, TranslationServer
+    from .session import BingSession, BingSessionManager
+    from .transport import ProxyPool, SharedTransport, TransportConfig
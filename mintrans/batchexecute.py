@@ -0,0 +1,134 @@
+"""Decoder of Google `batchexecute` response bodies.
+
+A body starts with the `)]}'` XSSI guard and holds one or more JSON frames. The chunked
+form (`rt=c`) puts the length of every frame on the line before it, the plain form is a
+single frame. Every frame is a list of entries, results are `["wrb.fr", rpc_id,
+payload, ..., envelope_id]` with the payload being JSON encoded once more.
+"""
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+XSSI_PREFIX = ")]}'"
+_WHITESPACE = " \t\r\n"
+
+
+class BatchExecuteDecoder:
+    """Incremental decoder, `feed` text as it arrives and get back the entries of complete frames."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._started = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, data: str) -> list[list]:
+        if self._position:
+            # Drop what was consumed instead of slicing on every frame.
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+        self._buffer += data
+        return self._decode(final=False)
+
+    def close(self) -> list[list]:
+        """Decodes whatever is left, raises ValueError when the body ends in the middle of a frame."""
+        entries = self._decode(final=True)
+        if self._buffer[self._position:].strip(_WHITESPACE):
+            raise ValueError("Truncated batchexecute frame")
+        self._buffer, self._position = "", 0
+        return entries
+
+    def _skip_prefix(self, final: bool) -> bool:
+        if self._started:
+            return True
+        stripped = self._buffer.lstrip(_WHITESPACE)
+        if len(stripped) < len(XSSI_PREFIX) and not final and XSSI_PREFIX.startswith(stripped):
+            return False
+        self._started = True
+        if stripped.startswith(XSSI_PREFIX):
+            self._position = len(self._buffer) - len(stripped) + len(XSSI_PREFIX)
+        return True
+
+    @staticmethod
+    def _may_be_complete(buffer: str) -> bool:
+        end = len(buffer) - 1
+        while end >= 0 and buffer[end] in _WHITESPACE:
+            end -= 1
+        return end >= 0 and buffer[end] == "]"
+
+    def _decode(self, final: bool) -> list[list]:
+        if not self._skip_prefix(final):
+            return []
+        entries = []
+        buffer, length = self._buffer, len(self._buffer)
+        while True:
+            start = self._position
+            while start < length and buffer[start] in _WHITESPACE:
+                start += 1
+            if start == length:
+                break
+            frame_start, frame_length = start, None
+            if buffer[start].isdigit():
+                line_end = buffer.find("\n", start)
+                if line_end == -1:
+                    if final:
+                        raise ValueError("Truncated batchexecute frame length")
+                    break
+                frame_length = int(buffer[start:line_end])
+                frame_start = line_end + 1
+                # The length is only a hint (it counts UTF-16 units), JSON decides where the frame ends.
+                if not final and length - frame_start < frame_length - 1:
+                    break
+            elif not final and not self._may_be_complete(buffer):
+                # Unframed bodies are tried again only once a closing bracket arrived.
+                break
+            try:
+                frame, end = self._decoder.raw_decode(buffer, frame_start)
+            except json.JSONDecodeError:
+                if final or frame_length is not None and length - frame_start >= frame_length + 16:
+                    raise
+                break
+            entries.extend(frame)
+            self._position = end
+        return entries
+
+
+def iter_entries(chunks: Iterable[str]) -> Iterator[list]:
+    """Yields the entries of a body given in chunks, e.g. `response.iter_text()`."""
+    decoder = BatchExecuteDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+def decode_entries(body: str) -> list[list]:
+    decoder = BatchExecuteDecoder()
+    return decoder.feed(body) + decoder.close()
+
+
+def rpc_payloads(entries: Iterable[list], rpc_id: str) -> dict[str, Any]:
+    """Returns the decoded payloads of `rpc_id` keyed by envelope id, failed envelopes are left out."""
+    payloads = {}
+    for entry in entries:
+        if len(entry) < 3 or entry[0] != "wrb.fr" or entry[1] != rpc_id or not entry[2]:
+            continue
+        payloads[entry[-1]] = json.loads(entry[2])
+    return payloads
+
+
+def parse_translation(payload: list) -> Optional[dict[str, str]]:
+    """Reads a MkEWBc payload, the translated segments of every sentence are joined together."""
+    try:
+        translation = payload[1][0][0]
+        target_language = payload[1][1]
+        source_language = payload[1][3] if len(payload[1]) > 3 and payload[1][3] else payload[2]
+    except (IndexError, TypeError):
+        return None
+    segments = translation[5] if len(translation) > 5 else None
+    if segments:
+        separator = " " if len(translation) > 3 and translation[3] else ""
+        text = separator.join(segment[0] for segment in segments if segment and segment[0] is not None)
+    else:
+        text = translation[0]
+    if text is None:
+        return None
+    return {"text": text, "target_language": target_language, "source_language": source_language}
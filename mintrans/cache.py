@@ -0,0 +1,207 @@
+import json
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+def make_cache_key(engine: str, text: str, source_language: str, target_language: str) -> str:
+    """Builds the cache key of a translation, texts are NFC normalized.
+
+    Whitespace is kept, engines keep it in their translations and " Hello" must not be
+    answered with the translation of "Hello".
+    """
+    text = unicodedata.normalize("NFC", text)
+    return "\x1f".join((engine, source_language.lower(), target_language.lower(), text))
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def evicted(self, count: int = 1):
+        with self._lock:
+            self.evictions += count
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def __repr__(self):
+        return f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class BaseCache:
+    """Key/value store for translation results, values are JSON compatible dicts."""
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        value = self._get(key)
+        self.stats.record(value is not None)
+        return value
+
+    def set(self, key: str, value: dict[str, Any]):
+        self._set(key, value)
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: dict[str, Any]):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MemoryCache(BaseCache):
+    """Bounded in-process LRU cache with an optional TTL in seconds."""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[Optional[float], dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                self.stats.evicted()
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: dict[str, Any]):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.stats.evicted()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteCache(BaseCache):
+    """Persistent cache in a SQLite file, safe to share between worker processes."""
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None):
+        import sqlite3
+
+        super().__init__()
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._connection.commit()
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self._connection.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self._connection.commit()
+                self.stats.evicted()
+                return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: dict[str, Any]):
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO translations (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            self._connection.commit()
+
+    def purge_expired(self) -> int:
+        """Deletes expired rows and returns how many were removed."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM translations WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            )
+            self._connection.commit()
+        self.stats.evicted(cursor.rowcount)
+        return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM translations")
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class TieredCache(BaseCache):
+    """Memory LRU in front of an optional persistent cache, hits from disk warm the memory tier."""
+
+    def __init__(self, memory: Optional[MemoryCache] = None, persistent: Optional[BaseCache] = None):
+        super().__init__()
+        self.memory = memory if memory is not None else MemoryCache()
+        self.persistent = persistent
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        value = self.memory.get(key)
+        if value is None and self.persistent is not None:
+            value = self.persistent.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    def _set(self, key: str, value: dict[str, Any]):
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            self.persistent.set(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def close(self):
+        if self.persistent is not None:
+            self.persistent.close()
@@ -0,0 +1,339 @@
+"""`mintrans` console command for bulk line-by-line translation.
+
+    mintrans -t tr -e google bing -j 8 --rate 20 -o out.txt --journal job.journal 'data/*.txt'
+    cat lines.txt | mintrans -t de
+
+Lines are grouped into shards that a pool of worker processes translates, every worker
+with its own clients and its share of the rate budget. Shards are written in input
+order, each one is appended to the journal first so a rerun skips what is done.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+ENGINES = ("google", "bing", "deepl")
+
+_translator = None
+
+
+def _create_translator(
+    engines: list[str],
+    rate: Optional[float],
+    burst: int,
+    cache_path: Optional[str],
+    memory_path: Optional[str] = None,):
+    from .cache import SQLiteCache
+    from .memory import TranslationMemory
+    from .mintrans import BingTranslator, DeepLTranslator, GoogleTranslator
+    from .ratelimit import TokenBucket
+    from .router import RouterTranslator
+
+    classes = {"google": GoogleTranslator, "bing": BingTranslator, "deepl": DeepLTranslator}
+    cache = SQLiteCache(cache_path) if cache_path else None
+    # Every worker maps the same memory file, what it translates is only reused by itself.
+    memory = TranslationMemory(memory_path) if memory_path else None
+    translators = [
+        classes[engine](cache=cache, memory=memory, rate_limiter=TokenBucket(rate, burst) if rate else None)
+        for engine in engines
+    ]
+    return translators[0] if len(translators) == 1 else RouterTranslator(translators)
+
+
+def _init_worker(
+    engines: list[str],
+    rate: Optional[float],
+    burst: int,
+    cache_path: Optional[str],
+    memory_path: Optional[str] = None,):
+    global _translator
+    _translator = _create_translator(engines, rate, burst, cache_path, memory_path)
+
+
+def translate_lines(translator, lines: list[str], target_language: str, source_language: Optional[str] = None) -> list[str]:
+    """Translates lines with one batch call, blank lines are kept and long ones are split."""
+    from .tools import split_text, strip_chunk
+
+    limit = getattr(translator, "max_text_length", 1000)
+    pieces, contents = [], []
+    for line in lines:
+        chunks = [strip_chunk(chunk) for chunk in split_text(line, limit)]
+        pieces.append(chunks)
+        contents.extend(content for _, content, _ in chunks if content)
+    results = iter(translator.translate_batch(contents, target_language, source_language) if contents else [])
+    translated = []
+    for chunks in pieces:
+        parts = []
+        for leading, content, trailing in chunks:
+            if content:
+                result = next(results)
+                if getattr(result, "text", None) is None:
+                    raise ValueError(f"Line could not be translated: {result}")
+                content = result.text
+            parts.append(leading + content + trailing)
+        translated.append("".join(parts))
+    return translated
+
+
+def _translate_shard(shard: int, lines: list[str], target_language: str, source_language: Optional[str]) -> tuple[int, list[str]]:
+    return shard, translate_lines(_translator, lines, target_language, source_language)
+
+
+def expand_inputs(inputs: list[str]) -> list[str]:
+    """Resolves globs, `-` (or no input at all) stands for stdin."""
+    paths = []
+    for pattern in inputs or ["-"]:
+        if pattern == "-" or glob.escape(pattern) == pattern:
+            paths.append(pattern)
+            continue
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No file matches {pattern}")
+        paths.extend(matches)
+    return paths
+
+
+def iter_lines(paths: list[str], encoding: str = "utf-8") -> Iterator[str]:
+    for path in paths:
+        file = sys.stdin if path == "-" else open(path, encoding=encoding)
+        try:
+            for line in file:
+                yield line.rstrip("\r\n")
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+
+def iter_shards(lines: Iterator[str], shard_size: int) -> Iterator[list[str]]:
+    while True:
+        shard = list(islice(lines, shard_size))
+        if not shard:
+            return
+        yield shard
+
+
+class Journal:
+    """Append-only JSON lines file, a header with the job settings then one record per shard."""
+
+    def __init__(self, path: Path, header: dict):
+        self.path = path
+        self.header = header
+        self._file: Optional[IO[str]] = None
+
+    def check(self):
+        """Raises ValueError when the journal was written by a job with other settings."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            first = f.readline()
+        if first and json.loads(first) != self.header:
+            raise ValueError(f"Journal {self.path} belongs to another job, remove it to start over")
+
+    def replay(self) -> Iterator[list[str]]:
+        """Yields the lines of the shards done by an earlier run, a torn last record is dropped."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            if not f.readline():
+                return
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return
+                yield record["lines"]
+
+    def open(self, shards: int):
+        """Opens for appending, keeping the header and the first `shards` records only."""
+        if shards == 0 or not self.path.exists():
+            self._file = self.path.open("w", encoding="utf-8")
+            self._file.write(json.dumps(self.header) + "\n")
+            self._file.flush()
+            return
+        with self.path.open("r+", encoding="utf-8") as f:
+            for _ in range(shards + 1):
+                f.readline()
+            f.truncate(f.tell())
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def append(self, shard: int, lines: list[str]):
+        self._file.write(json.dumps({"shard": shard, "lines": lines}, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class Progress:
+    def __init__(self, stream: IO[str], total: Optional[int] = None, interval: float = 0.5, enabled: bool = True):
+        self.stream = stream
+        self.total = total
+        self.interval = interval
+        self.enabled = enabled
+        self.lines = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        self._last = 0.0
+
+    def update(self, lines: int, force: bool = False):
+        self.lines += lines
+        now = time.monotonic()
+        if not self.enabled or (not force and now - self._last < self.interval):
+            return
+        self._last = now
+        speed = (self.lines - self.skipped) / max(now - self.started, 1e-9)
+        done = f"{self.lines}/{self.total}" if self.total else str(self.lines)
+        self.stream.write(f"\r{done} lines, {speed:.1f} lines/s")
+        self.stream.flush()
+
+    def finish(self):
+        self.update(0, force=True)
+        if self.enabled:
+            self.stream.write("\n")
+
+
+def _count_lines(paths: list[str], progress: Progress):
+    """Counts the input lines on a background thread, the progress shows a total once it is known."""
+    if "-" in paths or not progress.enabled:
+        return
+
+    def count():
+        total = 0
+        try:
+            for path in paths:
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        total += block.count(b"\n")
+        except OSError:
+            return
+        progress.total = total
+
+    threading.Thread(target=count, name="mintrans-count", daemon=True).start()
+
+
+def run(args: argparse.Namespace) -> int:
+    paths = expand_inputs(args.inputs)
+    header = {
+        "inputs": [os.path.abspath(path) if path != "-" else path for path in paths],
+        "target_language": args.target,
+        "source_language": args.source,
+        "engines": args.engines,
+        "shard_size": args.shard_size,
+    }
+    journal = Journal(Path(args.journal), header) if args.journal else None
+    if journal is not None:
+        journal.check()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    progress = Progress(sys.stderr, enabled=not args.quiet)
+    _count_lines(paths, progress)
+
+    def emit(lines: list[str]):
+        output.write("".join(line + "\n" for line in lines))
+        progress.update(len(lines))
+
+    done = 0
+    if journal is not None:
+        for lines in journal.replay():
+            output.write("".join(line + "\n" for line in lines))
+            progress.lines += len(lines)
+            done += 1
+        progress.skipped = progress.lines
+        journal.open(done)
+
+    shards = iter_shards(iter_lines(paths, args.encoding), args.shard_size)
+    # Shards done by an earlier run are read and thrown away, the input order decides their ids.
+    for _ in islice(shards, done):
+        pass
+
+    workers = max(1, args.workers)
+    rate = args.rate / workers if args.rate else None
+    pending: dict[Future, int] = {}
+    finished: dict[int, list[str]] = {}
+    next_shard = done
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(args.engines, rate, args.burst, args.cache, args.memory),
+    )
+    try:
+        for shard, lines in enumerate(shards, start=done):
+            pending[executor.submit(_translate_shard, shard, lines, args.target, args.source)] = shard
+            if len(pending) >= 2 * workers:
+                next_shard = _collect(pending, finished, next_shard, emit, journal)
+        while pending:
+            next_shard = _collect(pending, finished, next_shard, emit, journal)
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted, rerun with the same journal to continue\n")
+        return 130
+    except Exception as e:
+        sys.stderr.write(f"\nTranslation failed: {e!r}\n")
+        if journal is not None:
+            sys.stderr.write(f"{next_shard} shards are journaled, rerun with the same journal to continue\n")
+        return 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        progress.finish()
+        if journal is not None:
+            journal.close()
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+    return 0
+
+
+def _collect(pending: dict, finished: dict, next_shard: int, emit, journal: Optional[Journal]) -> int:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        del pending[future]
+        shard, lines = future.result()
+        finished[shard] = lines
+    # Shards are written in input order, later ones wait for the ones before them.
+    while next_shard in finished:
+        lines = finished.pop(next_shard)
+        if journal is not None:
+            journal.append(next_shard, lines)
+        emit(lines)
+        next_shard += 1
+    return next_shard
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mintrans", description="Translate text files line by line.")
+    parser.add_argument("inputs", nargs="*", help="files or glob patterns, stdin when empty or -")
+    parser.add_argument("-t", "--target", required=True, help="target language")
+    parser.add_argument("-s", "--source", default=None, help="source language, detected when left out")
+    parser.add_argument("-e", "--engines", nargs="+", choices=ENGINES, default=["google"], help="more than one engine fails over between them")
+    parser.add_argument("-o", "--output", default=None, help="output file, stdout by default")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--shard-size", type=int, default=200, help="lines per shard")
+    parser.add_argument("--rate", type=float, default=None, help="requests per second per engine over all workers")
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--journal", default=None, help="journal file that makes the job resumable")
+    parser.add_argument("--cache", default=None, help="SQLite cache file shared by the workers")
+    parser.add_argument("--memory", default=None, help="translation memory file to reuse translations from")
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return run(args)
+    except (FileNotFoundError, ValueError) as e:
+        sys.stderr.write(f"mintrans: {e}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
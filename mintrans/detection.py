@@ -0,0 +1,277 @@
+"""Local language detection, answers the clear cases without a translation round trip.
+
+Scripts that belong to one language decide on their own. Scripts several languages are
+written in (Devanagari for Hindi, Marathi and Nepali, Bengali for Bengali and Assamese)
+only do when `languages` leaves one of them. Latin and Cyrillic texts are scored against
+letter trigram models built from `language_profiles.SAMPLES` with naive Bayes. Short,
+mixed or ambiguous texts get no local answer, the translators send those to their
+engine and remember the result.
+
+The models only know the languages of their samples and answer confidently for a
+language next to one of them (Azerbaijani as Turkish, Malay as Indonesian), so they
+are opt-in with `trigrams=True`, best together with the `languages` the texts can be in.
+"""
+import bisect
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Iterable, Iterator, Optional
+
+from .language_profiles import COMMON_WORDS, SAMPLES
+from .models import DetectedLanguageResponse
+
+# Unicode blocks by first code point. Blocks of one language map to it, shared ones to
+# a script name the text is then scored or looked at further for.
+_BLOCKS = [
+    (0x0000, 0x007F, "latin"),
+    (0x0080, 0x024F, "latin"),
+    (0x0370, 0x03FF, "el"),
+    (0x0400, 0x052F, "cyrillic"),
+    (0x0530, 0x058F, "hy"),
+    (0x0590, 0x05FF, "hebrew"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0980, 0x09FF, "bengali"),
+    (0x0A00, 0x0A7F, "pa"),
+    (0x0A80, 0x0AFF, "gu"),
+    (0x0B80, 0x0BFF, "ta"),
+    (0x0C00, 0x0C7F, "te"),
+    (0x0C80, 0x0CFF, "kn"),
+    (0x0D00, 0x0D7F, "ml"),
+    (0x0E00, 0x0E7F, "th"),
+    (0x0E80, 0x0EFF, "lo"),
+    (0x1000, 0x109F, "my"),
+    (0x10A0, 0x10FF, "ka"),
+    (0x1100, 0x11FF, "ko"),
+    (0x1200, 0x137F, "ethiopic"),
+    (0x1780, 0x17FF, "km"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x3040, 0x30FF, "ja"),
+    (0x3130, 0x318F, "ko"),
+    (0x3400, 0x4DBF, "han"),
+    (0x4E00, 0x9FFF, "han"),
+    (0xAC00, 0xD7AF, "ko"),
+]
+_BLOCK_STARTS = [start for start, _, _ in _BLOCKS]
+_MODEL_SCRIPTS = {"latin", "cyrillic"}
+# Scripts of several languages the engines translate, answered only when `languages` leaves one.
+_SHARED_SCRIPTS = {
+    "devanagari": ("hi", "mr", "ne", "sa", "mai", "doi", "bho", "gom"),
+    "bengali": ("bn", "as", "mni-Mtei"),
+    "hebrew": ("he", "yi"),
+    "ethiopic": ("am", "ti"),
+}
+# Japanese and Korean mix Han with kana or Hangul, they count as one script.
+_CJK = {"han", "ja", "ko"}
+# Letters only Persian or Urdu add to the Arabic script.
+_URDU_LETTERS = set("ٹڈڑںےۓ")
+_PERSIAN_LETTERS = set("پچژگکی")
+_WORD = re.compile(r"[^\W\d_]+")
+# Evidence is capped at this many trigrams. They overlap and are far from independent,
+# uncapped naive Bayes would be sure of itself after a couple of words.
+MAX_EVIDENCE = 24
+
+
+def _script(character: str) -> Optional[str]:
+    index = bisect.bisect_right(_BLOCK_STARTS, ord(character)) - 1
+    if index < 0:
+        return None
+    start, end, script = _BLOCKS[index]
+    return script if ord(character) <= end else None
+
+
+def iter_trigrams(text: str) -> Iterator[str]:
+    """Letter trigrams of the words of a text, words padded with a space on both sides."""
+    for word in _WORD.findall(text.lower()):
+        padded = f" {word} "
+        for index in range(len(padded) - 2):
+            yield padded[index:index + 3]
+
+
+class TrigramModel:
+    """Smoothed trigram log probabilities of the languages of one script.
+
+    Every trigram maps to a row with one value per language, the rows of a text are
+    summed column by column.
+    """
+
+    def __init__(self, samples: dict[str, str]):
+        self.languages = tuple(samples)
+        counts = [Counter(iter_trigrams(sample)) for sample in samples.values()]
+        vocabulary = set().union(*counts)
+        totals = [sum(language_counts.values()) + len(vocabulary) for language_counts in counts]
+        self.unseen = [math.log(1 / total) for total in totals]
+        self.log_probabilities = {
+            gram: [math.log((language_counts.get(gram, 0) + 1) / total) for language_counts, total in zip(counts, totals)]
+            for gram in vocabulary
+        }
+
+    def log_likelihoods(self, grams: Counter) -> list[float]:
+        rows, unseen = [], 0
+        get = self.log_probabilities.get
+        for gram, count in grams.items():
+            row = get(gram)
+            if row is None:
+                unseen += count
+            else:
+                rows.extend([row] * count)
+        rows.append([unseen * value for value in self.unseen])
+        return [sum(column) for column in zip(*rows)]
+
+
+class LanguageDetector:
+    """Remembers what the engines detected and detects the languages of clear cases locally.
+
+    Local detection returns None when it is not sure, for texts with fewer than
+    `min_length` letters, mixed scripts, scripts of several languages, or a best language
+    with a posterior under `min_confidence`. Latin and Cyrillic texts are only answered
+    with `trigrams=True`, the models only know the languages of their samples, pass
+    `languages` to narrow them down to the ones the texts can be in. `local=False` leaves
+    every text to the engines. Remembered languages are kept per engine, so one detector
+    can be shared by any number of translators and threads.
+    """
+
+    def __init__(
+        self,
+        min_length: int = 12,
+        min_confidence: float = 0.95,
+        memo_size: int = 4096,
+        samples: Optional[dict[str, str]] = None,
+        languages: Optional[Iterable[str]] = None,
+        local: bool = True,
+        trigrams: bool = False,):
+        self.min_length = min_length
+        self.min_confidence = min_confidence
+        self.memo_size = memo_size
+        self.samples = samples if samples is not None else {
+            language: f"{sample} {COMMON_WORDS.get(language, '')}" for language, sample in SAMPLES.items()
+        }
+        self.languages = set(languages) if languages is not None else None
+        if self.languages is not None:
+            self.samples = {language: sample for language, sample in self.samples.items() if language in self.languages}
+        self.local = local
+        self.trigrams = trigrams
+        self._models: Optional[dict[str, TrigramModel]] = None
+        self._memo: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_models(self) -> dict[str, TrigramModel]:
+        """One model per script of the samples, built on first use."""
+        if self._models is None:
+            with self._lock:
+                if self._models is None:
+                    by_script: dict[str, dict[str, str]] = {}
+                    for language, sample in self.samples.items():
+                        by_script.setdefault(self._dominant_script(sample)[0], {})[language] = sample
+                    self._models = {script: TrigramModel(samples) for script, samples in by_script.items()}
+        return self._models
+
+    @staticmethod
+    def _dominant_script(text: str) -> tuple[Optional[str], float, Counter]:
+        """Returns the script most letters are written in, its share and the letter counts by script."""
+        scripts: Counter = Counter()
+        for character, count in Counter(text).items():
+            if character.isalpha():
+                scripts[_script(character)] += count
+        total = sum(scripts.values())
+        if not total:
+            return None, 0.0, scripts
+        script, count = scripts.most_common(1)[0]
+        if script in _CJK:
+            count = sum(scripts[name] for name in _CJK)
+        return script, count / total, scripts
+
+    def scores(self, text: str) -> list[tuple[str, float]]:
+        """Returns `(language, posterior)` pairs of the languages of the text's script, best first."""
+        return self._rank(text, self._dominant_script(text)[0])
+
+    def _rank(self, text: str, script: Optional[str]) -> list[tuple[str, float]]:
+        model = self._get_models().get(script)
+        if model is None:
+            return []
+        grams = Counter(iter_trigrams(text))
+        evidence = sum(grams.values())
+        if not evidence:
+            return []
+        scale = min(1.0, MAX_EVIDENCE / evidence)
+        scores = model.log_likelihoods(grams)
+        best = max(scores)
+        weights = [math.exp((score - best) * scale) for score in scores]
+        total = sum(weights)
+        return sorted(zip(model.languages, (weight / total for weight in weights)), key=lambda item: -item[1])
+
+    def classify(self, text: str) -> Optional[tuple[str, float]]:
+        """Returns the language and confidence of a text when the local model is sure of it."""
+        classified = self._classify(text)
+        if classified is None or (self.languages is not None and classified[0] not in self.languages):
+            return None
+        return classified
+
+    def _classify(self, text: str) -> Optional[tuple[str, float]]:
+        script, share, scripts = self._dominant_script(text)
+        letters = sum(scripts.values())
+        if script is None or share < 0.8:
+            return None
+        # Kana and Hangul only show up in Japanese and Korean, next to any amount of Han.
+        if script == "han" or scripts.get("ja") or scripts.get("ko"):
+            if scripts.get("ja"):
+                return "ja", 1.0
+            if scripts.get("ko"):
+                return "ko", 1.0
+            return ("zh", 1.0) if letters >= self.min_length else None
+        if script == "arabic":
+            characters = set(text)
+            if characters & _URDU_LETTERS:
+                return "ur", 1.0
+            if characters & _PERSIAN_LETTERS:
+                return "fa", 1.0
+            return ("ar", 1.0) if letters >= self.min_length else None
+        if script in _SHARED_SCRIPTS:
+            candidates = [language for language in _SHARED_SCRIPTS[script] if self.languages and language in self.languages]
+            return (candidates[0], 1.0) if len(candidates) == 1 else None
+        if script not in _MODEL_SCRIPTS:
+            return script, 1.0
+        if not self.trigrams or letters < self.min_length:
+            return None
+        ranked = self._rank(text, script)
+        if not ranked or ranked[0][1] < self.min_confidence:
+            return None
+        return ranked[0]
+
+    @staticmethod
+    def _memo_key(text: str, engine: str) -> tuple[str, str]:
+        # Engines spell the same language differently, e.g. zh-CN, zh-Hans and ZH.
+        return engine, unicodedata.normalize("NFC", text).strip()
+
+    def remember(self, text: str, language: str, engine: str = ""):
+        """Keeps the language `engine` detected for a text, the oldest entries are dropped."""
+        with self._lock:
+            key = self._memo_key(text, engine)
+            self._memo[key] = language
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def recall(self, text: str, engine: str = "") -> Optional[str]:
+        with self._lock:
+            key = self._memo_key(text, engine)
+            language = self._memo.get(key)
+            if language is not None:
+                self._memo.move_to_end(key)
+            return language
+
+    def detect(self, text: str, engine: str = "") -> Optional[DetectedLanguageResponse]:
+        """Returns what `engine` answered before or a confident local detection, None when the engine has to answer."""
+        language = self.recall(text, engine)
+        if language is not None:
+            return DetectedLanguageResponse(language=language)
+        if not self.local:
+            return None
+        classified = self.classify(text)
+        if classified is None:
+            return None
+        return DetectedLanguageResponse(language=classified[0], confidence=classified[1])
+
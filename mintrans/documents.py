@@ -0,0 +1,480 @@
+"""Streaming translation of text, subtitle, gettext, JSON and HTML/XML files.
+
+Readers turn a file into a stream of pieces, either literal text copied as is or a
+`Segment` to translate. The pipeline collects a window of pieces, translates the
+distinct segments of the window in one batch, writes the window out and forgets it,
+so memory stays flat whatever the size of the file.
+"""
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Union
+
+from .tools import split_text, strip_chunk
+
+Piece = Union[str, "Segment"]
+
+FORMATS = {
+    ".txt": "text",
+    ".srt": "subtitles",
+    ".vtt": "subtitles",
+    ".po": "po",
+    ".pot": "po",
+    ".json": "json",
+    ".jsonl": "json",
+    ".html": "markup",
+    ".htm": "markup",
+    ".xhtml": "markup",
+    ".xml": "markup",
+}
+JSON_CHUNK_SIZE = 65536
+_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_JSON_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_JSON_BRACKETS = re.compile(r"[\[\]{}]")
+HASH_CHUNK_SIZE = 1024 * 1024
+_PO_KEYWORD = re.compile(r"^(msgctxt|msgid_plural|msgid|msgstr(?:\[(\d+)\])?)\s+(\".*\")\s*$")
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+class Segment:
+    """Translatable text with the literal output around it, `escape` encodes the translation."""
+
+    __slots__ = ("text", "prefix", "suffix", "escape")
+
+    def __init__(self, text: str, prefix: str = "", suffix: str = "", escape: Callable[[str], str] = _identity):
+        self.text = text
+        self.prefix = prefix
+        self.suffix = suffix
+        self.escape = escape
+
+    def render(self, translation: str) -> str:
+        return self.prefix + self.escape(translation) + self.suffix
+
+    def __repr__(self):
+        return f"Segment(text={self.text!r})"
+
+
+def _split_line_ending(line: str) -> tuple[str, str]:
+    body = line.rstrip("\r\n")
+    return body, line[len(body):]
+
+
+def _text_pieces(text: str, ending: str = "", escape: Callable[[str], str] = _identity) -> Iterator[Piece]:
+    leading, content, trailing = strip_chunk(text)
+    if content:
+        yield Segment(content, escape(leading), escape(trailing) + ending, escape)
+    else:
+        yield escape(text) + ending
+
+
+def read_text(lines: Iterable[str]) -> Iterator[Piece]:
+    """Every non-blank line is a segment."""
+    for line in lines:
+        yield from _text_pieces(*_split_line_ending(line))
+
+
+def read_subtitles(lines: Iterable[str]) -> Iterator[Piece]:
+    """SRT and WebVTT, cue text lines after a `-->` timing line are segments.
+
+    Indexes, timings, headers and NOTE/STYLE blocks have no timing line and stay as they are.
+    """
+    in_cue = False
+    for line in lines:
+        body, ending = _split_line_ending(line)
+        if not body.strip():
+            in_cue = False
+            yield line
+        elif in_cue:
+            yield from _text_pieces(body, ending)
+        else:
+            in_cue = "-->" in body
+            yield line
+
+
+def _po_unquote(value: str) -> str:
+    return json.loads(value)
+
+
+def po_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n").replace("\t", "\\t")
+
+
+def _po_entry(block: list[str]) -> Iterator[Piece]:
+    fields: dict[str, str] = {}
+    msgstr_lines: list[tuple[int, Optional[int]]] = []
+    field = None
+    for position, line in enumerate(block):
+        stripped = line.strip()
+        match = _PO_KEYWORD.match(stripped)
+        if match:
+            field = match.group(1)
+            fields[field] = fields.get(field, "") + _po_unquote(match.group(3))
+            if field.startswith("msgstr"):
+                msgstr_lines.append((position, int(match.group(2)) if match.group(2) else None))
+        elif stripped.startswith("\"") and field is not None:
+            fields[field] += _po_unquote(stripped)
+        elif not stripped.startswith("#"):
+            field = None
+    msgid = fields.get("msgid", "")
+    translated = any(value for name, value in fields.items() if name.startswith("msgstr"))
+    if not msgid or not msgstr_lines or translated:
+        # The header, obsolete and already translated entries are kept as they are.
+        yield "".join(block)
+        return
+    first_msgstr = msgstr_lines[0][0]
+    yield "".join(block[:first_msgstr])
+    for position, plural_index in msgstr_lines:
+        keyword = "msgstr" if plural_index is None else f"msgstr[{plural_index}]"
+        source = fields.get("msgid_plural", msgid) if plural_index else msgid
+        _, ending = _split_line_ending(block[position])
+        leading, content, trailing = strip_chunk(source)
+        if content:
+            yield Segment(content, f"{keyword} \"{po_escape(leading)}", f"{po_escape(trailing)}\"{ending}", po_escape)
+        else:
+            yield f"{keyword} \"{po_escape(source)}\"{ending}"
+    rest = [line for position, line in enumerate(block) if position > first_msgstr and not _is_msgstr_line(line)]
+    if rest:
+        yield "".join(rest)
+
+
+def _is_msgstr_line(line: str) -> bool:
+    stripped = line.strip()
+    return stripped.startswith("msgstr") or stripped.startswith("\"")
+
+
+def read_po(lines: Iterable[str]) -> Iterator[Piece]:
+    """Untranslated gettext entries get their `msgstr` (or `msgstr[n]`) filled from `msgid`."""
+    block: list[str] = []
+    for line in lines:
+        if line.strip():
+            block.append(line)
+            continue
+        if block:
+            yield from _po_entry(block)
+            block = []
+        yield line
+    if block:
+        yield from _po_entry(block)
+
+
+def json_escape(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def _json_value(token: str) -> Iterator[Piece]:
+    leading, content, trailing = strip_chunk(json.loads(token))
+    if not content:
+        yield token
+    else:
+        yield Segment(content, "\"" + json_escape(leading), json_escape(trailing) + "\"", json_escape)
+
+
+def read_json(file: IO[str], chunk_size: int = JSON_CHUNK_SIZE, keys: Optional[Iterable[str]] = None) -> Iterator[Piece]:
+    """String values of JSON documents or JSON lines are segments, keys and everything else stay.
+
+    With `keys` only the values of those keys are segments, strings in arrays count as
+    values of the key the array belongs to, so IDs, URLs and the like can be left out.
+    The file is scanned in chunks, documents of any size never get loaded whole.
+    """
+    buffer, position, eof = "", 0, False
+    pending = None
+    keys = frozenset(keys) if keys is not None else None
+    # The key the values of every open object or array belong to, innermost last.
+    stack: list[Optional[str]] = []
+
+    def refill():
+        nonlocal buffer, position, eof
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    def literal(text: str) -> str:
+        if keys is not None:
+            for bracket in _JSON_BRACKETS.findall(text):
+                if bracket == "{":
+                    stack.append(None)
+                elif bracket == "[":
+                    stack.append(stack[-1] if stack else None)
+                elif stack:
+                    stack.pop()
+        return text
+
+    refill()
+    while True:
+        if pending is not None:
+            # A string is a key when the next significant character is a colon.
+            end = _JSON_WHITESPACE.match(buffer, position).end()
+            if end == len(buffer) and not eof:
+                refill()
+                continue
+            if end < len(buffer) and buffer[end] == ":":
+                if keys is not None and stack:
+                    stack[-1] = json.loads(pending)
+                yield pending
+            elif keys is None or (stack and stack[-1] in keys):
+                yield from _json_value(pending)
+            else:
+                yield pending
+            pending = None
+            continue
+        quote = buffer.find("\"", position)
+        if quote == -1:
+            if position < len(buffer):
+                yield literal(buffer[position:])
+            position = len(buffer)
+            if eof:
+                return
+            refill()
+            continue
+        if quote > position:
+            yield literal(buffer[position:quote])
+        position = quote
+        match = _JSON_STRING.match(buffer, position)
+        if match is None:
+            if eof:
+                raise ValueError("Unterminated string in JSON document")
+            refill()
+            continue
+        pending = match.group()
+        position = match.end()
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    file_format = FORMATS.get(Path(path).suffix.lower())
+    if file_format is None:
+        raise ValueError(f"Unknown document format: {path}, pass file_format explicitly")
+    return file_format
+
+
+def iter_pieces(file: IO[str], file_format: str, json_keys: Optional[Iterable[str]] = None) -> Iterator[Piece]:
+    if file_format == "json":
+        return read_json(file, keys=json_keys)
+    if file_format == "markup":
+        from .markup import read_markup
+
+        return read_markup(file)
+    readers = {"text": read_text, "subtitles": read_subtitles, "po": read_po}
+    if file_format not in readers:
+        raise ValueError(f"Unknown document format: {file_format}")
+    return readers[file_format](file)
+
+
+class DocumentStats:
+    def __init__(self):
+        self.segments = 0
+        self.translated = 0
+        self.windows = 0
+        self.resumed_pieces = 0
+
+    def __repr__(self):
+        return (
+            f"DocumentStats(segments={self.segments}, translated={self.translated}, "
+            f"windows={self.windows}, resumed_pieces={self.resumed_pieces})"
+        )
+
+
+class DocumentPipeline:
+    """Translates a file window by window with any translator that has `translate_batch`.
+
+    Segments seen in the last `memo_size` translations are not sent again. With
+    `checkpoint_path` the progress is saved after every window and an interrupted run
+    continues where it stopped, the checkpoint is removed once the file is done. A
+    checkpoint of another input, engine or language pair is refused. `json_keys`
+    limits JSON files to the values of those keys, see `read_json`.
+    """
+
+    def __init__(
+        self,
+        translator,
+        target_language: str,
+        source_language: Optional[str] = None,
+        file_format: Optional[str] = None,
+        window_size: int = 200,
+        memo_size: int = 10000,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        encoding: str = "utf-8",
+        json_keys: Optional[Iterable[str]] = None,):
+        self.translator = translator
+        self.target_language = target_language
+        self.source_language = source_language
+        self.file_format = file_format
+        self.window_size = max(1, window_size)
+        self.memo_size = max(memo_size, 2 * self.window_size)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.encoding = encoding
+        self.json_keys = sorted(json_keys) if json_keys is not None else None
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._input_sha256: Optional[str] = None
+
+    def _remember(self, text: str, translation: str):
+        self._memo[text] = translation
+        self._memo.move_to_end(text)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _windows(self, pieces: Iterator[Piece], stats: DocumentStats) -> Iterator[tuple[list[Piece], list[str]]]:
+        window: list[Piece] = []
+        pending: dict[str, None] = {}
+        segments = 0
+        for piece in pieces:
+            window.append(piece)
+            if isinstance(piece, Segment):
+                stats.segments += 1
+                segments += 1
+                if piece.text in self._memo:
+                    # Touched so translations of this window outlive the ones stored next.
+                    self._memo.move_to_end(piece.text)
+                else:
+                    pending[piece.text] = None
+                if segments >= self.window_size:
+                    yield window, list(pending)
+                    window, pending, segments = [], {}, 0
+        if window:
+            yield window, list(pending)
+
+    def _units(self, texts: list[str]) -> tuple[list[list[tuple[str, str, str]]], list[str]]:
+        """Splits texts over the translator's length limit, returns the chunks per text and what to send."""
+        limit = getattr(self.translator, "max_text_length", 1000)
+        chunked, contents = [], []
+        for text in texts:
+            chunks = [strip_chunk(chunk) for chunk in split_text(text, limit)] if len(text) > limit else [("", text, "")]
+            chunked.append(chunks)
+            contents.extend(content for _, content, _ in chunks if content)
+        return chunked, contents
+
+    def _store(self, texts: list[str], chunked: list[list[tuple[str, str, str]]], results: list):
+        translations = iter(results)
+        for text, chunks in zip(texts, chunked):
+            parts = []
+            for leading, content, trailing in chunks:
+                translation = next(translations) if content else None
+                parts.append(leading + (self._result_text(translation) if content else "") + trailing)
+            self._remember(text, "".join(parts))
+
+    @staticmethod
+    def _result_text(result: Any) -> str:
+        text = getattr(result, "text", None)
+        if text is None:
+            message = result.get("errorMessage") if isinstance(result, dict) else result
+            raise ValueError(f"Segment could not be translated: {message}")
+        return text
+
+    def _render(self, window: list[Piece]) -> str:
+        return "".join(piece.render(self._memo[piece.text]) if isinstance(piece, Segment) else piece for piece in window)
+
+    @staticmethod
+    def _input_hash(input_path: Path) -> str:
+        digest = hashlib.sha256()
+        with input_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _run_fields(self, input_path: Path, input_hash: str) -> dict:
+        """What a checkpoint must match to be resumed."""
+        return {
+            "input_size": input_path.stat().st_size,
+            "input_sha256": input_hash,
+            "engine": getattr(self.translator, "engine", type(self.translator).__name__),
+            "source_language": self.source_language,
+            "target_language": self.target_language,
+            "json_keys": self.json_keys,
+        }
+
+    def _load_checkpoint(self, input_path: Path) -> tuple[dict, Optional[str]]:
+        if self.checkpoint_path is None:
+            return {}, None
+        input_hash = self._input_hash(input_path)
+        if not self.checkpoint_path.exists():
+            return {}, input_hash
+        checkpoint = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        expected = self._run_fields(input_path, input_hash)
+        if any(checkpoint.get(name) != value for name, value in expected.items()):
+            raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to another run, remove it to start over")
+        return checkpoint, input_hash
+
+    def _save_checkpoint(self, input_path: Path, input_hash: str, pieces: int, output_size: int):
+        if self.checkpoint_path is None:
+            return
+        temporary_path = self.checkpoint_path.with_name(f"{self.checkpoint_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps({
+            "input": str(input_path),
+            **self._run_fields(input_path, input_hash),
+            "pieces": pieces,
+            "output_size": output_size,
+        }), encoding="utf-8")
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def _open(self, input_path: Path, output_path: Path, stats: DocumentStats):
+        checkpoint, self._input_sha256 = self._load_checkpoint(input_path)
+        source = input_path.open("r", encoding=self.encoding, newline="")
+        pieces = iter_pieces(source, self.file_format or detect_format(input_path), self.json_keys)
+        if checkpoint and output_path.exists():
+            stats.resumed_pieces = checkpoint["pieces"]
+            output = output_path.open("r+b")
+            output.truncate(checkpoint["output_size"])
+            output.seek(checkpoint["output_size"])
+            pieces = islice(pieces, stats.resumed_pieces, None)
+        else:
+            output = output_path.open("wb")
+        return source, output, pieces
+
+    def _write(self, output: IO[bytes], input_path: Path, window: list[Piece], done: int) -> int:
+        output.write(self._render(window).encode(self.encoding))
+        if self.checkpoint_path is not None:
+            # The checkpoint must never point past what actually reached the disk.
+            output.flush()
+            os.fsync(output.fileno())
+            self._save_checkpoint(input_path, self._input_sha256, done, output.tell())
+        return done
+
+    def translate_file(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> DocumentStats:
+        input_path, output_path = Path(input_path), Path(output_path)
+        stats = DocumentStats()
+        source, output, pieces = self._open(input_path, output_path, stats)
+        done = stats.resumed_pieces
+        with source, output:
+            for window, texts in self._windows(pieces, stats):
+                if texts:
+                    chunked, contents = self._units(texts)
+                    results = self.translator.translate_batch(contents, self.target_language, self.source_language)
+                    self._store(texts, chunked, results)
+                    stats.translated += len(texts)
+                stats.windows += 1
+                done = self._write(output, input_path, window, done + len(window))
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+        return stats
+
+    async def translate_file_async(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> DocumentStats:
+        """Same as `translate_file` for async translators, file I/O stays blocking."""
+        input_path, output_path = Path(input_path), Path(output_path)
+        stats = DocumentStats()
+        source, output, pieces = self._open(input_path, output_path, stats)
+        done = stats.resumed_pieces
+        with source, output:
+            for window, texts in self._windows(pieces, stats):
+                if texts:
+                    chunked, contents = self._units(texts)
+                    results = await self.translator.translate_batch(contents, self.target_language, self.source_language)
+                    self._store(texts, chunked, results)
+                    stats.translated += len(texts)
+                stats.windows += 1
+                done = self._write(output, input_path, window, done + len(window))
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+        return stats
+
+
+def default_output_path(input_path: Union[str, Path], target_language: str) -> Path:
+    """`movie.srt` translated to Turkish goes to `movie.tr.srt`."""
+    input_path = Path(input_path)
+    return input_path.with_name(f"{input_path.stem}.{target_language}{input_path.suffix}")
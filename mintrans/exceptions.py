@@ -1,2 +1,12 @@
+from typing import Optional
+
 class RateLimitException(Exception):
+    def __init__(self, message: str = "Rate limit error!", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CaptchaException(Exception):
+    pass
+
+class EngineUnavailableException(Exception):
     pass
@@ -0,0 +1,197 @@
+import base64
+import mimetypes
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional, Union
+
+ImageSource = Union[str, Path, bytes, bytearray, memoryview]
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+# Multiple of 3 so the base64 of every chunk can simply be concatenated.
+ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+# Encoded images up to this size stay in memory, larger ones spill to a temporary file.
+SPOOL_SIZE = 8 * 1024 * 1024
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+# base64 characters that mean something else in a form body.
+_FORM_ESCAPES = ((b"+", b"%2B"), (b"/", b"%2F"), (b"=", b"%3D"))
+
+
+def sniff_mime_type(header: bytes) -> Optional[str]:
+    for signature, mime_type in _SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class ImageData:
+    """An image given as a path, bytes or a memoryview.
+
+    The data is never copied or loaded whole. It is read and encoded in chunks once, into
+    a spooled buffer that measures the `Content-Length` of the request and is streamed
+    again on every retry. `close` releases the buffer.
+    """
+
+    def __init__(self, source: ImageSource, mime_type: Optional[str] = None):
+        if isinstance(source, (str, Path)):
+            self.path: Optional[Path] = Path(source)
+            if not self.path.is_file():
+                raise FileNotFoundError(f"File not found: {self.path}")
+            self.view: Optional[memoryview] = None
+            self.size = self.path.stat().st_size
+            with self.path.open("rb") as f:
+                header = f.read(16)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self.path = None
+            self.view = memoryview(source).cast("B")
+            self.size = self.view.nbytes
+            header = bytes(self.view[:16])
+        else:
+            raise TypeError("Image must be a path, bytes or a memoryview")
+        self.mime_type = (
+            mime_type
+            or sniff_mime_type(header)
+            or (self.path is not None and mimetypes.guess_type(self.path.name)[0])
+            or "image/jpeg"
+        )
+        self._encoded: Optional[tempfile.SpooledTemporaryFile] = None
+        self._form_length: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.path.name if self.path is not None else "image"
+
+    def iter_chunks(self, chunk_size: int = ENCODE_CHUNK_SIZE) -> Iterator[Union[bytes, memoryview]]:
+        if self.view is not None:
+            for start in range(0, self.size, chunk_size):
+                yield self.view[start:start + chunk_size]
+            return
+        with self.path.open("rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def _encode(self) -> tempfile.SpooledTemporaryFile:
+        """Writes the form-escaped base64 of the image to the buffer, the first time only."""
+        with self._lock:
+            if self._encoded is None:
+                encoded_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+                for chunk in self.iter_chunks():
+                    encoded = base64.b64encode(chunk)
+                    for character, escape in _FORM_ESCAPES:
+                        encoded = encoded.replace(character, escape)
+                    encoded_file.write(encoded)
+                self._form_length = encoded_file.tell()
+                self._encoded = encoded_file
+            return self._encoded
+
+    def iter_form_base64(self, chunk_size: int = ENCODE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Base64 of the image, escaped for an `application/x-www-form-urlencoded` body."""
+        encoded_file = self._encode()
+        position = 0
+        while True:
+            # Sends of the same image may overlap, each keeps its own position.
+            with self._lock:
+                encoded_file.seek(position)
+                chunk = encoded_file.read(chunk_size)
+            if not chunk:
+                return
+            position += len(chunk)
+            yield chunk
+
+    def form_base64_length(self) -> int:
+        self._encode()
+        return self._form_length
+
+    def close(self):
+        with self._lock:
+            if self._encoded is not None:
+                self._encoded.close()
+                self._encoded = None
+                self._form_length = None
+
+    def __repr__(self):
+        return f"ImageData(name={self.name!r}, size={self.size}, mime_type={self.mime_type!r})"
+
+
+class FormBody:
+    """Form body with the image base64 streamed between a fixed prefix and suffix."""
+
+    def __init__(self, prefix: str, image: ImageData, suffix: str):
+        self.prefix = prefix.encode("ascii")
+        self.image = image
+        self.suffix = suffix.encode("ascii")
+
+    def __len__(self):
+        return len(self.prefix) + self.image.form_base64_length() + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        yield from self.image.iter_form_base64()
+        yield self.suffix
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+def iter_image_paths(directory: Union[str, Path], recursive: bool = False) -> Iterator[Path]:
+    """Image files of a directory by suffix, walked lazily directory by directory in name order."""
+    for root, directories, files in os.walk(directory):
+        directories.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            if path.suffix.lower() in IMAGE_SUFFIXES and path.is_file():
+                yield path
+        if not recursive:
+            return
+
+
+def image_output_path(output_dir: Union[str, Path], image, index: int, mime_type: str, root: Optional[Path] = None) -> Path:
+    """Where the result of `image` is saved, at its path below `root` for images of a directory."""
+    if isinstance(image, (str, Path)):
+        path = Path(image)
+        name = path.relative_to(root) if root is not None else Path(path.name)
+    else:
+        name = Path(f"image-{index}.{mime_type.rpartition('/')[2]}")
+    return Path(output_dir) / name
+
+
+def _text_leaves(node, skip: set[str]) -> Iterator[str]:
+    if isinstance(node, str):
+        if node.strip() and node.lower() not in skip:
+            yield node
+    elif isinstance(node, list):
+        for item in node:
+            yield from _text_leaves(item, skip)
+
+
+def parse_image_payload(payload: list, source_language: str, target_language: str) -> dict:
+    """Reads a WqWDPb payload: the rendered image first, then the recognized text blocks.
+
+    The blocks are returned joined by new lines as they come, language codes left out.
+    """
+    try:
+        encoded, mime_type = payload[0][0], payload[0][1]
+    except (IndexError, TypeError):
+        raise ValueError("No image in the WqWDPb result")
+    text = "\n".join(_text_leaves(payload[1:], {source_language.lower(), target_language.lower(), "auto"}))
+    return {
+        "file": base64.b64decode(encoded),
+        "mime_type": mime_type,
+        "text": text,
+        "source_language": source_language,
+        "target_language": target_language,
+    }
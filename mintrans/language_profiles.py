@@ -0,0 +1,314 @@
+"""Sample texts the local language detector builds its n-gram profiles from.
+
+Every sample is plain everyday prose heavy on function words, which are what tells
+close languages apart on short inputs. Languages written in a script of their own are
+told by the script alone and need no sample.
+"""
+
+SAMPLES = {
+    "en": (
+        "The weather was nice this morning, so we went for a walk in the park with the children. "
+        "I think that it is going to rain later and we should be back home before it gets dark. "
+        "What do you want to eat tonight? There is some bread in the kitchen and we can buy "
+        "more at the shop on the way. She said that they would come with us if they had time. "
+        "Please let me know when you are ready, because the train leaves at half past six and "
+        "we have to be there on time. This is the best book I have read in years, which is why "
+        "I would like to give it to my brother for his birthday next week."
+    ),
+    "de": (
+        "Das Wetter war heute Morgen schön, also sind wir mit den Kindern im Park spazieren gegangen. "
+        "Ich glaube, dass es später regnen wird und wir sollten vor der Dunkelheit wieder zu Hause sein. "
+        "Was möchtest du heute Abend essen? In der Küche ist noch Brot und wir können auf dem Weg "
+        "im Geschäft mehr kaufen. Sie hat gesagt, dass sie mitkommen würden, wenn sie Zeit hätten. "
+        "Bitte sag mir Bescheid, wenn du fertig bist, weil der Zug um halb sieben abfährt und wir "
+        "pünktlich sein müssen. Das ist das beste Buch, das ich seit Jahren gelesen habe, deshalb "
+        "möchte ich es meinem Bruder nächste Woche zum Geburtstag schenken. Die Straße ist groß."
+    ),
+    "fr": (
+        "Il faisait beau ce matin, alors nous sommes allés nous promener dans le parc avec les enfants. "
+        "Je pense qu'il va pleuvoir plus tard et que nous devrions être à la maison avant la nuit. "
+        "Qu'est-ce que tu veux manger ce soir ? Il y a du pain dans la cuisine et nous pouvons en "
+        "acheter au magasin sur le chemin. Elle a dit qu'ils viendraient avec nous s'ils avaient le "
+        "temps. Dis-moi quand tu es prêt, parce que le train part à six heures et demie et nous "
+        "devons être à l'heure. C'est le meilleur livre que j'ai lu depuis des années, c'est pourquoi "
+        "je voudrais l'offrir à mon frère pour son anniversaire la semaine prochaine."
+    ),
+    "es": (
+        "Esta mañana hacía buen tiempo, así que fuimos a pasear por el parque con los niños. "
+        "Creo que va a llover más tarde y que deberíamos estar en casa antes de que oscurezca. "
+        "¿Qué quieres cenar esta noche? Hay pan en la cocina y podemos comprar más en la tienda "
+        "por el camino. Ella dijo que vendrían con nosotros si tenían tiempo. Avísame cuando estés "
+        "listo, porque el tren sale a las seis y media y tenemos que llegar a la hora. Este es el "
+        "mejor libro que he leído en años, por eso me gustaría regalárselo a mi hermano para su "
+        "cumpleaños la próxima semana. Los niños están en la escuela y las niñas también."
+    ),
+    "it": (
+        "Stamattina il tempo era bello, quindi siamo andati a fare una passeggiata nel parco con i "
+        "bambini. Penso che più tardi pioverà e che dovremmo essere a casa prima che faccia buio. "
+        "Cosa vuoi mangiare stasera? C'è del pane in cucina e possiamo comprarne ancora al negozio "
+        "lungo la strada. Lei ha detto che sarebbero venuti con noi se avessero avuto tempo. "
+        "Fammi sapere quando sei pronto, perché il treno parte alle sei e mezza e dobbiamo essere "
+        "puntuali. Questo è il libro più bello che ho letto da anni, per questo vorrei regalarlo a "
+        "mio fratello per il suo compleanno la settimana prossima. Gli amici sono qui."
+    ),
+    "pt": (
+        "O tempo estava bom hoje de manhã, então fomos passear no parque com as crianças. "
+        "Acho que vai chover mais tarde e que devíamos estar em casa antes de escurecer. "
+        "O que você quer comer hoje à noite? Tem pão na cozinha e podemos comprar mais na loja "
+        "no caminho. Ela disse que eles viriam conosco se tivessem tempo. Avise-me quando estiver "
+        "pronto, porque o trem sai às seis e meia e não podemos nos atrasar. Este é o melhor livro "
+        "que li em anos, por isso gostaria de dá-lo ao meu irmão no aniversário dele na próxima "
+        "semana. As mãos não são pequenas e a informação está na nossa página."
+    ),
+    "nl": (
+        "Het weer was vanochtend mooi, dus zijn we met de kinderen in het park gaan wandelen. "
+        "Ik denk dat het later gaat regenen en dat we thuis moeten zijn voordat het donker wordt. "
+        "Wat wil je vanavond eten? Er ligt nog brood in de keuken en we kunnen onderweg meer kopen "
+        "in de winkel. Zij zei dat ze met ons mee zouden komen als ze tijd hadden. Laat me weten "
+        "wanneer je klaar bent, want de trein vertrekt om half zeven en we moeten op tijd zijn. "
+        "Dit is het beste boek dat ik in jaren heb gelezen, daarom wil ik het volgende week aan "
+        "mijn broer geven voor zijn verjaardag. Niet alleen de huizen maar ook de straten zijn oud."
+    ),
+    "tr": (
+        "Bu sabah hava güzeldi, bu yüzden çocuklarla parkta yürüyüşe çıktık. Sanırım daha sonra "
+        "yağmur yağacak ve hava kararmadan önce evde olmalıyız. Bu akşam ne yemek istersin? "
+        "Mutfakta biraz ekmek var ve yolda dükkandan daha fazlasını alabiliriz. Zamanları olursa "
+        "bizimle geleceklerini söyledi. Hazır olduğunda bana haber ver, çünkü tren altı buçukta "
+        "kalkıyor ve zamanında orada olmamız gerekiyor. Bu yıllardır okuduğum en iyi kitap, bu "
+        "yüzden gelecek hafta doğum günü için kardeşime hediye etmek istiyorum. Öğrenciler okulda "
+        "ders çalışıyorlar ve öğretmen onlara yardım ediyor. Bir şey değil, teşekkür ederim."
+    ),
+    "pl": (
+        "Dziś rano była ładna pogoda, więc poszliśmy z dziećmi na spacer do parku. Myślę, że "
+        "później będzie padać i powinniśmy być w domu, zanim zrobi się ciemno. Co chcesz zjeść "
+        "dziś wieczorem? W kuchni jest trochę chleba, a po drodze możemy kupić więcej w sklepie. "
+        "Powiedziała, że przyjdą z nami, jeśli będą mieli czas. Daj mi znać, kiedy będziesz gotowy, "
+        "bo pociąg odjeżdża o wpół do siódmej i musimy być na czas. To najlepsza książka, jaką "
+        "przeczytałem od lat, dlatego chciałbym ją dać mojemu bratu na urodziny w przyszłym "
+        "tygodniu. Jest to bardzo ważne dla nas wszystkich, że się udało."
+    ),
+    "sv": (
+        "Vädret var fint i morse, så vi gick på en promenad i parken med barnen. Jag tror att det "
+        "kommer att regna senare och att vi borde vara hemma innan det blir mörkt. Vad vill du äta "
+        "i kväll? Det finns lite bröd i köket och vi kan köpa mer i affären på vägen. Hon sa att de "
+        "skulle följa med oss om de hade tid. Säg till när du är klar, för tåget går halv sju och "
+        "vi måste vara där i tid. Det här är den bästa boken jag har läst på flera år, därför vill "
+        "jag ge den till min bror på hans födelsedag nästa vecka. Och inte bara det."
+    ),
+    "da": (
+        "Vejret var godt i morges, så vi gik en tur i parken med børnene. Jeg tror, at det vil "
+        "regne senere, og at vi burde være hjemme, før det bliver mørkt. Hvad vil du spise i aften? "
+        "Der er noget brød i køkkenet, og vi kan købe mere i butikken på vejen. Hun sagde, at de "
+        "ville komme med os, hvis de havde tid. Sig til, når du er klar, fordi toget kører halv syv, "
+        "og vi skal være der til tiden. Det her er den bedste bog, jeg har læst i mange år, derfor "
+        "vil jeg give den til min bror på hans fødselsdag i næste uge. Og ikke kun det."
+    ),
+    "fi": (
+        "Sää oli tänä aamuna kaunis, joten menimme lasten kanssa kävelylle puistoon. Luulen, että "
+        "myöhemmin sataa ja että meidän pitäisi olla kotona ennen kuin tulee pimeää. Mitä haluat "
+        "syödä tänä iltana? Keittiössä on vähän leipää ja voimme ostaa lisää kaupasta matkalla. "
+        "Hän sanoi, että he tulisivat mukaamme, jos heillä olisi aikaa. Kerro minulle, kun olet "
+        "valmis, koska juna lähtee puoli seitsemän ja meidän täytyy olla ajoissa. Tämä on paras "
+        "kirja, jonka olen lukenut vuosiin, siksi haluaisin antaa sen veljelleni syntymäpäivälahjaksi "
+        "ensi viikolla. Se ei ole niin helppoa kuin luulisi."
+    ),
+    "cs": (
+        "Dnes ráno bylo hezky, tak jsme šli s dětmi na procházku do parku. Myslím, že později bude "
+        "pršet a že bychom měli být doma, než se setmí. Co chceš dnes večer jíst? V kuchyni je trochu "
+        "chleba a cestou můžeme koupit další v obchodě. Řekla, že by šli s námi, kdyby měli čas. "
+        "Dej mi vědět, až budeš připravený, protože vlak odjíždí v půl sedmé a musíme tam být včas. "
+        "Tohle je nejlepší kniha, kterou jsem za poslední roky četl, proto bych ji rád dal svému "
+        "bratrovi k narozeninám příští týden. Je to pro nás všechny velmi důležité."
+    ),
+    "ro": (
+        "Vremea a fost frumoasă în această dimineață, așa că am mers la plimbare în parc cu copiii. "
+        "Cred că mai târziu va ploua și că ar trebui să fim acasă înainte să se întunece. Ce vrei să "
+        "mănânci în seara asta? Este puțină pâine în bucătărie și putem cumpăra mai multă de la "
+        "magazin pe drum. Ea a spus că ar veni cu noi dacă ar avea timp. Anunță-mă când ești gata, "
+        "pentru că trenul pleacă la șase și jumătate și trebuie să ajungem la timp. Aceasta este "
+        "cea mai bună carte pe care am citit-o în ultimii ani, de aceea aș vrea să i-o dau fratelui "
+        "meu de ziua lui săptămâna viitoare."
+    ),
+    "hu": (
+        "Ma reggel szép idő volt, ezért elmentünk sétálni a parkba a gyerekekkel. Azt hiszem, hogy "
+        "később esni fog, és haza kellene érnünk, mielőtt besötétedik. Mit szeretnél enni ma este? "
+        "Van egy kis kenyér a konyhában, és útközben vehetünk még a boltban. Azt mondta, hogy velünk "
+        "jönnének, ha lenne idejük. Szólj, ha készen vagy, mert a vonat fél hétkor indul, és időben "
+        "ott kell lennünk. Ez a legjobb könyv, amit évek óta olvastam, ezért szeretném odaadni a "
+        "bátyámnak a születésnapjára jövő héten. Nem is tudom, hogy miért nem szóltál előbb."
+    ),
+    "id": (
+        "Cuaca pagi ini cerah, jadi kami pergi berjalan-jalan di taman bersama anak-anak. Saya pikir "
+        "nanti akan hujan dan kita harus sudah di rumah sebelum gelap. Kamu mau makan apa malam ini? "
+        "Ada sedikit roti di dapur dan kita bisa membeli lagi di toko dalam perjalanan. Dia bilang "
+        "mereka akan ikut dengan kita kalau mereka punya waktu. Beri tahu saya kalau kamu sudah siap, "
+        "karena keretanya berangkat jam setengah tujuh dan kita harus tepat waktu. Ini adalah buku "
+        "terbaik yang pernah saya baca selama bertahun-tahun, jadi saya ingin memberikannya kepada "
+        "saudara saya untuk ulang tahunnya minggu depan."
+    ),
+    "vi": (
+        "Sáng nay thời tiết đẹp, vì vậy chúng tôi đã đi dạo trong công viên với bọn trẻ. Tôi nghĩ "
+        "rằng lát nữa trời sẽ mưa và chúng ta nên về nhà trước khi trời tối. Tối nay bạn muốn ăn gì? "
+        "Trong bếp còn một ít bánh mì và chúng ta có thể mua thêm ở cửa hàng trên đường đi. Cô ấy "
+        "nói rằng họ sẽ đi cùng chúng ta nếu họ có thời gian. Hãy cho tôi biết khi bạn sẵn sàng, "
+        "vì tàu khởi hành lúc sáu giờ rưỡi và chúng ta phải đến đúng giờ. Đây là cuốn sách hay nhất "
+        "mà tôi đã đọc trong nhiều năm, vì vậy tôi muốn tặng nó cho anh trai tôi vào tuần sau."
+    ),
+    "ru": (
+        "Сегодня утром была хорошая погода, поэтому мы пошли гулять в парк с детьми. Я думаю, что "
+        "позже пойдёт дождь и нам нужно быть дома до того, как стемнеет. Что ты хочешь съесть "
+        "сегодня вечером? На кухне есть немного хлеба, и мы можем купить ещё в магазине по дороге. "
+        "Она сказала, что они пойдут с нами, если у них будет время. Дай мне знать, когда будешь "
+        "готов, потому что поезд отходит в половине седьмого и мы должны быть вовремя. Это лучшая "
+        "книга, которую я прочитал за последние годы, поэтому я хочу подарить её брату на день "
+        "рождения на следующей неделе. Это очень важно для всех нас."
+    ),
+    "uk": (
+        "Сьогодні вранці була гарна погода, тому ми пішли гуляти в парк з дітьми. Я думаю, що "
+        "пізніше піде дощ і нам треба бути вдома до того, як стемніє. Що ти хочеш їсти сьогодні "
+        "ввечері? На кухні є трохи хліба, і ми можемо купити ще в магазині по дорозі. Вона сказала, "
+        "що вони підуть з нами, якщо у них буде час. Дай мені знати, коли будеш готовий, тому що "
+        "потяг відходить о пів на сьому і ми маємо бути вчасно. Це найкраща книжка, яку я прочитав "
+        "за останні роки, тому я хочу подарувати її братові на день народження наступного тижня. "
+        "Це дуже важливо для всіх нас, і ми їм вдячні."
+    ),
+    "bg": (
+        "Тази сутрин времето беше хубаво, затова отидохме на разходка в парка с децата. Мисля, че "
+        "по-късно ще вали и трябва да сме вкъщи, преди да се стъмни. Какво искаш да ядеш довечера? "
+        "В кухнята има малко хляб и можем да купим още от магазина по пътя. Тя каза, че ще дойдат "
+        "с нас, ако имат време. Кажи ми, когато си готов, защото влакът тръгва в шест и половина и "
+        "трябва да сме навреме. Това е най-хубавата книга, която съм чел от години, затова искам "
+        "да я подаря на брат си за рождения му ден следващата седмица. Това е много важно за нас."
+    ),
+}
+
+# The most frequent words of every language, added to its sample once more since short
+# messages are mostly made of them.
+COMMON_WORDS = {
+    "en": (
+        "the of and to a in is it you that he was for on are with as I his they be at one have "
+        "this from or had by not word but what some we can out other were all there when up use "
+        "your how said an each she which do their time if will way about many then them would "
+        "write like so these her long make thing see him two has look more day could go come did "
+        "my no most who over know than call first people may down side been now find any new work"
+    ),
+    "de": (
+        "der die und in den von zu das mit sich des auf für ist im dem nicht ein eine als auch es "
+        "an werden aus er hat dass sie nach wird bei einer um am sind noch wie einem über einen so "
+        "zum war haben nur oder aber vor zur bis mehr durch man sein wurde sei ich du wir ihr uns "
+        "euch mein dein kein keine wenn dann schon sehr hier heute gibt alle was wer wo warum jetzt"
+    ),
+    "fr": (
+        "le de un être et à il avoir ne je son que se qui ce dans en du elle au pour pas que vous "
+        "par sur faire plus dire me on mon lui nous comme mais pouvoir avec tout y aller voir en bien "
+        "où sans tu ou leur homme si deux mari moi vouloir te femme venir quand grand celui notre "
+        "devoir là jour prendre même votre rien petit encore aussi quelque dont tout mer trouver "
+        "donner temps ça peu même falloir sous parler alors est sont les des une cette très"
+    ),
+    "es": (
+        "de la que el en y a los se del las un por con no una su para es al lo como más o pero sus "
+        "le ha me si sin sobre este ya entre cuando todo esta ser son dos también fue había era muy "
+        "años hasta desde está mi porque qué sólo han yo hay vez puede todos así nos ni parte tiene "
+        "él uno donde bien tiempo mismo ese ahora cada e vida otro después te otros aunque esa eso "
+        "hace otra gobierno tan durante siempre día tanto ella tres sí dijo sido gran país según"
+    ),
+    "it": (
+        "di e il la che a per un in è del non una le si da con i al dei ma come sono alla lo anche "
+        "della più gli o ha nel questo se ci delle mi ne cui era tutto nella su essere ho quando "
+        "molto quello cosa stato perché sua fatto suo tra loro io solo hanno dopo fare ancora sempre "
+        "noi può senza già dove tu lei questa così bene me te voi mio tuo allora qui ora oggi"
+    ),
+    "pt": (
+        "de a o que e do da em um para é com não uma os no se na por mais as dos como mas foi ao ele "
+        "das tem à seu sua ou ser quando muito há nos já está eu também só pelo pela até isso ela "
+        "entre era depois sem mesmo aos ter seus quem nas me esse eles estão você tinha foram essa "
+        "num nem suas meu às minha têm numa pelos elas havia seja qual será nós tenho lhe deles "
+        "essas esses pelas este fosse dele tu te vocês vos lhes meus minhas teu tua nosso nossa"
+    ),
+    "nl": (
+        "de en van ik te dat die in een hij het niet zijn is was op aan met als voor had er maar om "
+        "hem dan zou of wat mijn men dit zo door over ze zich bij ook tot je mij uit der daar haar "
+        "naar heb hoe heeft hebben deze u want nog zal me zij nu ge geen omdat iets worden toch al "
+        "waren veel meer doen toen moet ben zonder kan hun dus alles onder ja eens hier wie werd "
+        "altijd doch wordt wezen kunnen ons zelf tegen na reeds wil kon niets uw iemand geweest"
+    ),
+    "tr": (
+        "bir ve bu da de için ile ne çok daha gibi ama o ben sen biz siz onlar var yok olan olarak "
+        "kadar sonra en mi mı mu mü değil her şey diye şimdi ya veya ki bana sana ona bize bunu "
+        "şu nasıl neden nerede zaman yıl gün iyi büyük yeni ilk son göre ise bile hem sadece tüm "
+        "hiç artık önce çünkü eğer fakat ancak olduğu oldu olur olmak etmek yapmak geldi gitti"
+    ),
+    "pl": (
+        "i w nie na się z do to że a o jak ale po co tak jest za od go jego już tylko jej może czy "
+        "przez ja mnie dla ty by tym jeszcze pan być gdy kiedy mi bo są ten ta tego było jako nas "
+        "tu które który która tej też był była sobie są tam ich nawet bardzo jednak więc jeśli gdzie "
+        "teraz dlaczego wszystko coś nic zawsze nigdy potem przed między pod nad będzie mam ma"
+    ),
+    "sv": (
+        "och i att det som en på är av för med till den har de inte om ett han men var jag sig från "
+        "vi så kan man när år säger hon under också efter eller nu sin där vid mot ska skulle kommer "
+        "ut får finns vara hade alla andra mycket än här då sedan över bara in blir upp även vad "
+        "två nya dem mig dig honom henne oss er deras hur varför aldrig alltid något ingen"
+    ),
+    "da": (
+        "og i at det er en til på som de med han af for ikke der var mig sig men et har om vi min "
+        "havde ham hun nu over da fra du ud sin dem os op man hans hvor eller hvad skal selv her "
+        "alle vil blev kunne ind når være dog noget ville jo deres efter ned skulle denne end dette "
+        "mit også under have dig anden hende mine alt meget sit sine vor mod disse hvis din nogle "
+        "hos blive mange ad bliver hendes været thi jer sådan hvorfor aldrig altid ingen"
+    ),
+    "fi": (
+        "ja on ei se että hän oli ole olla mutta kun niin jo myös vain kuin tai sen joka ovat mitä "
+        "minä sinä me te he tämä tuo nyt sitten kanssa ovat olen olet olemme jos koska vielä hyvin "
+        "paljon aina koskaan missä miksi miten mikä kuka kaikki jotain mitään ilman ennen jälkeen "
+        "mukaan tänään huomenna eilen kiitos hyvä iso uusi toinen ensimmäinen viimeinen voi täytyy"
+    ),
+    "cs": (
+        "a se na v je že to s z do o jsem jako ale za by i k jsou tak jeho ve mi pro jak už co jen "
+        "byl od být po tom které který která když také jsme jste ještě bylo byla nebo není mě ho "
+        "jsi až ani mu jí tady tam proč kde kdy nic něco vždy nikdy teď dnes zítra velmi moc všechno "
+        "každý sám jejich váš náš můj tvůj ten ta toto tento tato protože pokud však bez před"
+    ),
+    "ro": (
+        "și în de la a cu nu să pe o un care se din este că mai pentru ca dar sunt fost el ea eu tu "
+        "noi voi ei ele lui ei acest această ce cum unde când de ce foarte mult tot toate toți după "
+        "până prin fără despre între sau dacă iar deja acum azi mâine ieri aici acolo niciodată "
+        "mereu ceva nimic cineva nimeni am ai are avem aveți au fi fie era erau va vor poate trebuie"
+    ),
+    "hu": (
+        "a az és hogy nem is egy ez meg de van volt csak már még azt ha mint el ki be fel le most "
+        "itt ott mert vagy minden sem lesz kell lehet nagyon én te ő mi ti ők engem téged neki nekem "
+        "nekünk miért hol mikor hogyan mit mi ki aki ami amely amikor ahol akkor után előtt között "
+        "alatt felett mindig soha valami semmi valaki senki jó rossz új régi nagy kis sok kevés"
+    ),
+    "id": (
+        "yang dan di itu dengan untuk tidak ini dari dalam akan pada juga saya ke karena tersebut bisa "
+        "ada mereka lebih kami sudah atau kita adalah oleh anda telah hanya harus seperti jika dia "
+        "tetapi belum kamu saat masih sangat apa bagaimana mengapa di mana kapan siapa semua setiap "
+        "banyak sedikit baru lama besar kecil baik buruk sekarang hari ini besok kemarin terima kasih"
+    ),
+    "vi": (
+        "và của là có không một những được trong người cho các với này đã để khi đến từ như nhưng "
+        "tôi bạn chúng anh chị em ông bà họ nó cũng rất nhiều lại ra vào thì sẽ đang đó nào gì sao "
+        "đâu bao giờ ai tại vì nên nếu mà hay hoặc cả mọi luôn chưa bao giờ hôm nay ngày mai hôm "
+        "qua ở đây kia làm đi nói biết muốn cần phải có thể cảm ơn xin chào tốt mới lớn nhỏ"
+    ),
+    "ru": (
+        "и в не на я быть он с что а по это она этот к но они мы как из у который то за свой весь "
+        "год от так о для ты же все тот мочь вы человек такой его сказать только или ещё бы себя "
+        "один как уже до время если сам когда другой вот говорить наш мой знать стать при чтобы "
+        "дело жизнь кто первый очень два день её новый рука даже во со где там здесь почему всегда"
+    ),
+    "uk": (
+        "і в не на я бути він з що а по це вона цей до але вони ми як із у який то за свій весь рік "
+        "від так про для ти же все той могти ви людина такий його сказати тільки або ще б себе "
+        "один вже коли інший ось говорити наш мій знати стати при щоб справа життя хто перший дуже "
+        "два день її новий рука навіть де там тут чому завжди ніколи є був була було їх цього"
+    ),
+    "bg": (
+        "и в не на аз съм той с че а по това тя този към но те ние как от у който то за свой всички "
+        "година така за ти същото тези тях може вие човек такъв неговият каза само или още би "
+        "себе си един вече до време ако сам когато друг ето говори наш мой знае стана при за да "
+        "работа живот кой първи много два ден нейният нов ръка дори къде там тук защо винаги е"
+    ),
+}
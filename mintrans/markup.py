@@ -0,0 +1,321 @@
+"""Markup-aware translation of HTML, XML and templated strings.
+
+Only text nodes are translated. Tags, comments, declarations, CDATA, the contents of
+code-like elements and of elements marked `translate="no"` or `class="notranslate"`
+are copied as they are, so the structure of a document never changes. Text running
+through inline elements (`<b>`, `<a>`, `<code>`...) is one segment with the tags as
+`{_1}` tokens, so a sentence is translated as a whole. Placeholders (`{name}`, `%s`,
+`%(name)s`, `{{ var }}`, `${var}`) are sent as numbered `{1}` tokens, when an engine
+loses one the text around them is translated piece by piece instead.
+
+Text that comes back unchanged is written out as it was read, translations only get
+`&`, `<` and `>` escaped and keep the entities (`&nbsp;`, `&#39;`) of their source.
+"""
+import html
+import io
+import re
+from functools import partial
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .documents import Piece, Segment
+from .memory import TOKEN_KINDS
+from .tools import split_text, strip_chunk
+
+MARKUP_CHUNK_SIZE = 65536
+# Elements whose text is never translated, the first ones hold raw text that is not parsed.
+RAW_TEXT_ELEMENTS = frozenset({"script", "style", "textarea"})
+SKIPPED_ELEMENTS = RAW_TEXT_ELEMENTS | {"code", "pre", "kbd", "samp", "var", "noscript", "svg", "math"}
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+})
+# Elements that sit inside a sentence, their tags do not end a segment.
+INLINE_ELEMENTS = frozenset({
+    "a", "abbr", "b", "bdi", "bdo", "cite", "code", "data", "dfn", "em", "font", "i", "img", "kbd", "mark", "q",
+    "s", "samp", "small", "span", "strong", "sub", "sup", "time", "u", "var", "wbr",
+})
+# Openers and closers of markup without a name, the longest openers come first.
+_SPECIAL = (("<!--", "-->"), ("<![CDATA[", "]]>"), ("<?", ">"), ("<!", ">"))
+_TAG = re.compile(r"""<(/?)([A-Za-z][\w:.-]*)((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+# A tag cut off by the end of the buffer.
+_TAG_PREFIX = re.compile(r"""</?(?:[A-Za-z][\w:.-]*(?:[^>"']|"[^"]*"|'[^']*')*(?:"[^"]*|'[^']*)?)?\Z""")
+_NO_TRANSLATE = re.compile(r"""\btranslate\s*=\s*["']?no\b|\bclass\s*=\s*["'][^"']*\bnotranslate\b""", re.IGNORECASE)
+_LETTER = re.compile(r"[^\W\d_]")
+_PLACEHOLDER = re.compile(TOKEN_KINDS["placeholder"][0])
+_PLACEHOLDER_PARTS = re.compile(f"({TOKEN_KINDS['placeholder'][0]})")
+_MASK = re.compile(r"\{\s*(\d+)\s*\}")
+# Inline tags within a segment, a placeholder to the engines.
+_TAG_TOKEN = re.compile(r"\{_(\d+)\}")
+_TAG_TOKEN_PARTS = re.compile(r"(\{_\d+\})")
+_ENTITY = re.compile(r"&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);")
+_INCOMPLETE = -1
+
+
+def _is_translatable(text: str) -> bool:
+    """Whether a text has letters outside of its placeholders."""
+    return bool(_LETTER.search(_PLACEHOLDER.sub("", text)))
+
+
+def _render(text: str, raw: str, tags: list[str], entities: dict[int, str], translation: str) -> str:
+    """Escapes a translation and puts the inline tags back, the raw source when it is unchanged or lost a tag."""
+    if translation == text:
+        return raw
+    parts = _TAG_TOKEN.split(translation)
+    if sorted(int(index) for index in parts[1::2]) != list(range(1, len(tags) + 1)):
+        return raw
+    return "".join(
+        tags[int(part) - 1] if index % 2 else html.escape(part, quote=False).translate(entities)
+        for index, part in enumerate(parts)
+    )
+
+
+def _run_pieces(run: list[tuple[str, bool]]) -> Iterator[Piece]:
+    """Turns a run of `(raw, is_text)` items, text and inline tags, into one segment.
+
+    Tags and whitespace at either end are left out of the segment, tags within it
+    become `{_1}` tokens, consecutive ones one token.
+    """
+    if not any(is_text and _is_translatable(html.unescape(raw)) for raw, is_text in run):
+        if run:
+            yield "".join(raw for raw, _ in run)
+        return
+    if len(run) > 1 and any(is_text and _TAG_TOKEN.search(html.unescape(raw)) for raw, is_text in run):
+        # The text spells a token itself, its nodes are sent one by one.
+        for item in run:
+            yield from _run_pieces([item])
+        return
+    first = next(index for index, (raw, is_text) in enumerate(run) if is_text and raw.strip())
+    last = max(index for index, (raw, is_text) in enumerate(run) if is_text and raw.strip())
+    leading = strip_chunk(run[first][0])[0]
+    trailing = strip_chunk(run[last][0])[2]
+    items = list(run[first:last + 1])
+    items[0] = (items[0][0][len(leading):], True)
+    items[-1] = (items[-1][0][:len(items[-1][0]) - len(trailing)], True)
+    texts: list[str] = []
+    tags: list[str] = []
+    entities: dict[int, str] = {}
+    previous_tag = False
+    for raw, is_text in items:
+        if is_text:
+            texts.append(html.unescape(raw))
+            for entity in _ENTITY.findall(raw):
+                character = html.unescape(entity)
+                if len(character) == 1 and character not in "&<>":
+                    entities[ord(character)] = entity
+        elif previous_tag:
+            tags[-1] += raw
+        else:
+            tags.append(raw)
+            texts.append(f"{{_{len(tags)}}}")
+        previous_tag = not is_text
+    text = "".join(texts)
+    prefix = "".join(raw for raw, _ in run[:first]) + leading
+    suffix = trailing + "".join(raw for raw, _ in run[last + 1:])
+    raw = "".join(raw for raw, _ in items)
+    yield Segment(text, prefix, suffix, partial(_render, text, raw, tags, entities))
+
+
+def _markup_end(buffer: str, start: int, eof: bool) -> Optional[int]:
+    """End of the markup starting at `start`, `_INCOMPLETE` when it runs past the buffer, None for a literal `<`."""
+    rest = len(buffer) - start
+    for opener, closer in _SPECIAL:
+        if buffer.startswith(opener, start):
+            end = buffer.find(closer, start + len(opener))
+            return end + len(closer) if end != -1 else (None if eof else _INCOMPLETE)
+        if not eof and rest < len(opener) and opener.startswith(buffer[start:]):
+            return _INCOMPLETE
+    match = _TAG.match(buffer, start)
+    if match is not None:
+        return match.end()
+    if not eof and _TAG_PREFIX.match(buffer, start):
+        return _INCOMPLETE
+    return None
+
+
+def read_markup(file: IO[str], chunk_size: int = MARKUP_CHUNK_SIZE) -> Iterator[Piece]:
+    """Text of an HTML or XML document is segments, everything else stays as it is.
+
+    Text nodes and the inline tags between them make one segment. The file is scanned in
+    chunks, only the current run of text and inline tags is kept in memory.
+    """
+    buffer, position, scan, eof = "", 0, 0, False
+    # Open elements and whether their text is skipped.
+    stack: list[tuple[str, bool]] = []
+    skipping = 0
+    raw_end: Optional[re.Pattern] = None
+    # Text nodes (True) and inline tags (False) since the last block level markup.
+    run: list[tuple[str, bool]] = []
+
+    def refill():
+        nonlocal buffer, position, scan, eof
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        scan -= position
+        position = 0
+
+    refill()
+    while True:
+        if raw_end is not None:
+            match = raw_end.search(buffer, position)
+            if match is None and not eof:
+                refill()
+                continue
+            end = match.start() if match is not None else len(buffer)
+            if end > position:
+                yield buffer[position:end]
+            position = scan = end
+            raw_end = None
+            continue
+        start = buffer.find("<", scan)
+        if start == -1:
+            if not eof:
+                scan = len(buffer)
+                refill()
+                continue
+            if position < len(buffer):
+                run.append((buffer[position:], skipping == 0))
+            yield from _run_pieces(run)
+            return
+        end = _markup_end(buffer, start, eof)
+        if end == _INCOMPLETE:
+            scan = start
+            refill()
+            continue
+        if end is None:
+            # A `<` in the text, the text node goes on.
+            scan = start + 1
+            continue
+        if start > position:
+            run.append((buffer[position:start], skipping == 0))
+        match = _TAG.match(buffer, start, end)
+        name = match.group(2).lower() if match is not None else None
+        if name in INLINE_ELEMENTS:
+            run.append((buffer[start:end], False))
+        else:
+            yield from _run_pieces(run)
+            run = []
+            yield buffer[start:end]
+        position = scan = end
+        if match is None:
+            continue
+        closing, attributes = match.group(1), match.group(3)
+        if closing:
+            names = [open_name for open_name, _ in stack]
+            if name in names:
+                index = len(names) - 1 - names[::-1].index(name)
+                skipping -= sum(skipped for _, skipped in stack[index:])
+                del stack[index:]
+        elif name not in VOID_ELEMENTS and not attributes.rstrip().endswith("/"):
+            skipped = name in SKIPPED_ELEMENTS or bool(_NO_TRANSLATE.search(attributes))
+            stack.append((name, skipped))
+            skipping += skipped
+            if name in RAW_TEXT_ELEMENTS:
+                raw_end = re.compile(rf"</{re.escape(name)}\s*>", re.IGNORECASE)
+
+
+def iter_markup(markup: str) -> Iterator[Piece]:
+    return read_markup(io.StringIO(markup))
+
+
+def mask_placeholders(text: str, pattern: re.Pattern = _PLACEHOLDER) -> tuple[str, list[str]]:
+    """Replaces the placeholders of a text with `{1}`, `{2}`, ... and returns them in order."""
+    placeholders: list[str] = []
+
+    def replace(match: re.Match) -> str:
+        placeholders.append(match.group())
+        return f"{{{len(placeholders)}}}"
+
+    return pattern.sub(replace, text), placeholders
+
+
+def unmask_placeholders(translation: str, placeholders: list[str]) -> Optional[str]:
+    """Puts the placeholders back, None unless every token came back exactly once."""
+    seen: list[int] = []
+
+    def replace(match: re.Match) -> str:
+        index = int(match.group(1))
+        if not 1 <= index <= len(placeholders):
+            return match.group()
+        seen.append(index)
+        return placeholders[index - 1]
+
+    text = _MASK.sub(replace, translation)
+    return text if sorted(seen) == list(range(1, len(placeholders) + 1)) else None
+
+
+def _result_text(result: Any) -> str:
+    text = getattr(result, "text", None)
+    if text is None:
+        message = result.get("errorMessage") if isinstance(result, dict) else result
+        raise ValueError(f"Text node could not be translated: {message}")
+    return text
+
+
+class MarkupBatch:
+    """The distinct text nodes of some documents, prepared for one `translate_batch` call.
+
+    Send `texts`, hand the results to `store`, send what it returns (texts whose
+    placeholders did not survive, in pieces) and hand those results to `store_parts`,
+    then `render` the documents. With `placeholders=False` only the inline tag tokens
+    are masked.
+    """
+
+    def __init__(self, documents: Iterable[str], limit: int = 1000, placeholders: bool = True):
+        self.documents = [list(iter_markup(document)) for document in documents]
+        self.placeholders = placeholders
+        self.limit = limit
+        distinct = dict.fromkeys(piece.text for pieces in self.documents for piece in pieces if isinstance(piece, Segment))
+        self._masked: dict[str, tuple[str, list[str]]] = {}
+        self._chunks: dict[str, list[tuple[str, str, str]]] = {}
+        self.texts: list[str] = []
+        for text in distinct:
+            masked = mask_placeholders(text, _PLACEHOLDER if placeholders else _TAG_TOKEN)
+            self._masked[text] = masked
+            self._chunks[text] = self._split(masked[0])
+            self.texts.extend(content for _, content, _ in self._chunks[text] if content)
+        self._translations: dict[str, str] = {}
+        self._parts: dict[str, list[str]] = {}
+
+    def _split(self, text: str) -> list[tuple[str, str, str]]:
+        if len(text) <= self.limit:
+            return [("", text, "")]
+        return [strip_chunk(chunk) for chunk in split_text(text, self.limit)]
+
+    @staticmethod
+    def _join(chunks: list[tuple[str, str, str]], translations: Iterator[Any]) -> str:
+        return "".join(
+            leading + (_result_text(next(translations)) if content else "") + trailing
+            for leading, content, trailing in chunks
+        )
+
+    def store(self, results: list) -> list[str]:
+        """Keeps the translations of `texts`, returns the pieces of the texts that lost placeholders."""
+        translations = iter(results)
+        retry: list[str] = []
+        for text, (_, placeholders) in self._masked.items():
+            translation = unmask_placeholders(self._join(self._chunks[text], translations), placeholders)
+            if translation is not None:
+                self._translations[text] = translation
+                continue
+            self._parts[text] = parts = (_PLACEHOLDER_PARTS if self.placeholders else _TAG_TOKEN_PARTS).split(text)
+            retry.extend(strip_chunk(part)[1] for part in parts[::2] if _is_translatable(part))
+        return retry
+
+    def store_parts(self, results: list):
+        translations = iter(results)
+        for text, parts in self._parts.items():
+            joined = []
+            for index, part in enumerate(parts):
+                if index % 2 or not _is_translatable(part):
+                    joined.append(part)
+                else:
+                    leading, _, trailing = strip_chunk(part)
+                    joined.append(leading + _result_text(next(translations)) + trailing)
+            self._translations[text] = "".join(joined)
+        self._parts = {}
+
+    def render(self) -> list[str]:
+        return [
+            "".join(piece.render(self._translations[piece.text]) if isinstance(piece, Segment) else piece for piece in pieces)
+            for pieces in self.documents
+        ]
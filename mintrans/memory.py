@@ -0,0 +1,662 @@
+"""Translation memory, reuses stored translations of identical and near-identical segments.
+
+Segments are turned into templates: numbers, URLs, e-mail addresses and placeholders
+become typed slots and trailing sentence punctuation is set aside, so "Order 1234
+shipped." finds the translation of "Order 98 shipped!" with the number and the
+punctuation carried over. Near duplicates are found with MinHash LSH over the letter
+trigrams of the templates and only reused when every difference can be carried over
+into the stored translation as well.
+
+The memory lives in one immutable file that is memory-mapped, not loaded:
+
+    header   magic, version, counts and section offsets
+    records  engine, languages, source and target text of every entry, length prefixed
+    offsets  u64 file offset of every record
+    exact    (u64 template hash, u32 record id) pairs sorted for binary search
+    lsh      (u64 band hash, u32 record id) pairs sorted for binary search
+
+Entries added at run time are kept in memory until `save()` writes a new file. Files
+are written in one pass with the index entries sorted externally, so bulk imports of
+millions of segments run in bounded memory.
+"""
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import unicodedata
+import zlib
+from collections import Counter
+from difflib import SequenceMatcher
+from itertools import chain
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+
+MAGIC = b"MTTM"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQQQQQQ")
+HEADER_SIZE = 64
+_RECORD = struct.Struct("<BBBBII")
+_OFFSET = struct.Struct("<Q")
+# Big endian so sorting the packed bytes sorts by hash, then by record id.
+_ENTRY = struct.Struct(">QI")
+
+MINHASH_BANDS = 8
+MINHASH_ROWS = 3
+# Candidates read per LSH bucket, a hot bucket must not make a lookup slow.
+MAX_BUCKET_CANDIDATES = 64
+# Near duplicates compared character by character per lookup, most shared bands first.
+MAX_VERIFIED_CANDIDATES = 16
+_BAND = struct.Struct(f"<B{MINHASH_ROWS}Q")
+
+# Variable tokens by kind, each kind has a private use character as its slot in templates.
+TOKEN_KINDS = {
+    "url": (r"(?:https?://|www\.)[^\s<>\"']+[^\s<>\"'.,;:!?)]", "\ue000"),
+    "email": (r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+", "\ue001"),
+    "placeholder": (r"\{\{\s*\w*\s*\}\}|\{\w*\}|%\(\w+\)[sdif]|%[sdif]|\$\{\w+\}|\$\w+", "\ue002"),
+    "number": (r"(?<!\w)[-+]?\d+(?:[.,:/]\d+)*(?!\w)", "\ue003"),
+}
+_TOKEN = re.compile("|".join(f"(?P<{kind}>{pattern})" for kind, (pattern, _) in TOKEN_KINDS.items()))
+_SLOTS = {kind: slot for kind, (_, slot) in TOKEN_KINDS.items()}
+_SLOT_CHARACTERS = frozenset(_SLOTS.values())
+_SUFFIX = re.compile(r"[\s.!?;:…。！？]+$")
+_WHITESPACE = re.compile(r"\s+")
+_PIECE = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+class Template:
+    """A normalized segment with its variable tokens replaced by slots.
+
+    `key` is what segments are matched on, `tokens` the replaced values in order and
+    `suffix` the trailing punctuation left out of the key.
+    """
+
+    __slots__ = ("key", "tokens", "suffix")
+
+    def __init__(self, key: str, tokens: list[str], suffix: str):
+        self.key = key
+        self.tokens = tokens
+        self.suffix = suffix
+
+    @property
+    def slots(self) -> str:
+        return "".join(character for character in self.key if character in _SLOT_CHARACTERS)
+
+    def __repr__(self):
+        return f"Template(key={self.key!r}, tokens={self.tokens!r}, suffix={self.suffix!r})"
+
+
+def normalize_segment(text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_template(text: str) -> Template:
+    text = normalize_segment(text)
+    match = _SUFFIX.search(text)
+    suffix = match.group().strip() if match else ""
+    if match:
+        text = text[:match.start()]
+    tokens = []
+
+    def replace(token: re.Match) -> str:
+        tokens.append(token.group())
+        return _SLOTS[token.lastgroup]
+
+    return Template(_TOKEN.sub(replace, text), tokens, suffix)
+
+
+def _hash64(*parts: str) -> int:
+    return int.from_bytes(hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def exact_hash(template: Template, source_language: str, target_language: str) -> int:
+    return _hash64("exact", source_language, target_language, template.key)
+
+
+def minhash(template: Template) -> list[int]:
+    """One permutation MinHash of the letter trigrams of a template.
+
+    One CRC32 per trigram is split into `MINHASH_BANDS * MINHASH_ROWS` bins by its low
+    bits, every bin keeps its smallest value. Empty bins borrow from the next bin that
+    is not empty, with the distance mixed in.
+    """
+    size = MINHASH_BANDS * MINHASH_ROWS
+    padded = f" {template.key.casefold()} "
+    shingles = {padded[index:index + 3].encode("utf-8") for index in range(max(len(padded) - 2, 1))}
+    bins: list[Optional[int]] = [None] * size
+    for value in map(zlib.crc32, shingles):
+        index, value = value % size, value // size
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    signature = []
+    for index in range(size):
+        distance = 0
+        while bins[(index + distance) % size] is None:
+            distance += 1
+        signature.append(bins[(index + distance) % size] * size + distance)
+    return signature
+
+
+def band_hashes(template: Template, source_language: str, target_language: str) -> list[int]:
+    """MinHash LSH band keys of a template, one per band."""
+    signature = minhash(template)
+    prefix = f"band\x1f{source_language}\x1f{target_language}".encode("utf-8")
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                prefix + _BAND.pack(band, *signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]), digest_size=8
+            ).digest(),
+            "big",
+        )
+        for band in range(MINHASH_BANDS)
+    ]
+
+
+def _replace_once(text: str, old: str, new: str) -> Optional[str]:
+    """Replaces the only occurrence of `old` in `text`, words only where they stand alone."""
+    if not old:
+        return None
+    pattern = re.escape(old)
+    if old[0].isalnum() or old[0] == "_":
+        pattern = r"(?<!\w)" + pattern
+    if old[-1].isalnum() or old[-1] == "_":
+        pattern += r"(?!\w)"
+    matches = list(re.finditer(pattern, text))
+    if len(matches) != 1:
+        return None
+    return text[:matches[0].start()] + new + text[matches[0].end():]
+
+
+def _carry_edits(stored: Template, query: Template, target: str) -> Optional[str]:
+    """Applies the differences between two template keys to the stored translation.
+
+    Every changed fragment has to show up exactly once in the translation, like names,
+    codes or punctuation that are not translated. Anything else returns None.
+    """
+    stored_pieces, query_pieces = _PIECE.findall(stored.key), _PIECE.findall(query.key)
+    matcher = SequenceMatcher(None, stored_pieces, query_pieces, autojunk=False)
+    for tag, stored_start, stored_end, query_start, query_end in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        old = "".join(stored_pieces[stored_start:stored_end])
+        new = "".join(query_pieces[query_start:query_end])
+        if not old.strip() and not new.strip():
+            continue
+        if any(character in _SLOT_CHARACTERS for character in old + new):
+            return None
+        target = _replace_once(target, old.strip(), new.strip()) if old.strip() else None
+        if target is None:
+            return None
+    return target
+
+
+def _carry_tokens(stored: Template, query: Template, target: str) -> Optional[str]:
+    if stored.tokens == query.tokens:
+        return target
+    if len(set(stored.tokens)) != len(stored.tokens):
+        return None
+    spans = []
+    for old in stored.tokens:
+        pattern = re.escape(old)
+        if old[0].isalnum():
+            pattern = r"(?<![\w.,])" + pattern
+        if old[-1].isalnum():
+            pattern += r"(?![\w]|[.,]\d)"
+        matches = list(re.finditer(pattern, target))
+        if len(matches) != 1:
+            return None
+        spans.append(matches[0].span())
+    ordered = sorted(zip(spans, query.tokens))
+    previous_end = 0
+    for (start, end), _ in ordered:
+        if start < previous_end:
+            return None
+        previous_end = end
+    parts, position = [], 0
+    for (start, end), new in ordered:
+        parts.append(target[position:start])
+        parts.append(new)
+        position = end
+    parts.append(target[position:])
+    return "".join(parts)
+
+
+def _carry_suffix(stored: Template, query: Template, target: str) -> Optional[str]:
+    if stored.suffix == query.suffix:
+        return target
+    stripped = target.rstrip()
+    if stored.suffix:
+        if not stripped.endswith(stored.suffix):
+            return None
+        stripped = stripped[:-len(stored.suffix)].rstrip()
+    return stripped + query.suffix
+
+
+def adapt_translation(stored: Template, query: Template, target: str) -> Optional[str]:
+    """Turns the stored translation into one of the query, None when that is not safe."""
+    if stored.slots != query.slots:
+        return None
+    if stored.key != query.key:
+        target = _carry_edits(stored, query, target)
+        if target is None:
+            return None
+    target = _carry_tokens(stored, query, target)
+    if target is None:
+        return None
+    return _carry_suffix(stored, query, target)
+
+
+class MemoryEntry:
+    """A stored translation, `source_language` is empty when it was detected by the engine."""
+
+    __slots__ = ("source", "target", "source_language", "target_language", "engine", "detected_language")
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        engine: str = "",
+        detected_language: Optional[str] = None,):
+        self.source = source
+        self.target = target
+        self.target_language = target_language.lower()
+        self.source_language = (source_language or "").lower()
+        self.engine = engine
+        self.detected_language = (detected_language or self.source_language).lower()
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MemoryEntry":
+        return cls(
+            source=data["source"],
+            target=data["target"],
+            target_language=data["target_language"],
+            source_language=data.get("source_language"),
+            engine=data.get("engine", ""),
+            detected_language=data.get("detected_language"),
+        )
+
+    def __repr__(self):
+        return f"MemoryEntry(source={self.source!r}, target={self.target!r}, engine={self.engine!r})"
+
+
+class MemoryMatch:
+    """A translation taken from the memory, `similarity` is 1.0 for template matches."""
+
+    __slots__ = ("text", "source_language", "target_language", "engine", "similarity", "entry")
+
+    def __init__(self, text: str, entry: MemoryEntry, similarity: float):
+        self.text = text
+        self.source_language = entry.detected_language
+        self.target_language = entry.target_language
+        self.engine = entry.engine
+        self.similarity = similarity
+        self.entry = entry
+
+    def __repr__(self):
+        return f"MemoryMatch(text={self.text!r}, engine={self.engine!r}, similarity={self.similarity:.2f})"
+
+
+class _ExternalSorter:
+    """Sorts fixed-size packed entries in runs of `run_size`, spilled to temporary files."""
+
+    def __init__(self, directory: str, run_size: int = 1 << 20):
+        self.directory = directory
+        self.run_size = run_size
+        self._entries: list[bytes] = []
+        self._runs: list[IO[bytes]] = []
+        self.count = 0
+
+    def add(self, entry: bytes):
+        self._entries.append(entry)
+        self.count += 1
+        if len(self._entries) >= self.run_size:
+            self._spill()
+
+    def _spill(self):
+        self._entries.sort()
+        run = tempfile.TemporaryFile(dir=self.directory)
+        run.write(b"".join(self._entries))
+        run.seek(0)
+        self._runs.append(run)
+        self._entries = []
+
+    @staticmethod
+    def _read(run: IO[bytes]) -> Iterator[bytes]:
+        while True:
+            block = run.read(_ENTRY.size * 4096)
+            if not block:
+                return
+            for index in range(0, len(block), _ENTRY.size):
+                yield block[index:index + _ENTRY.size]
+
+    def write_sorted(self, output: IO[bytes]):
+        self._entries.sort()
+        runs = [self._read(run) for run in self._runs]
+        buffer = []
+        for entry in heapq.merge(iter(self._entries), *runs):
+            buffer.append(entry)
+            if len(buffer) >= 4096:
+                output.write(b"".join(buffer))
+                buffer = []
+        output.write(b"".join(buffer))
+        for run in self._runs:
+            run.close()
+
+
+def write_memory_file(path: Union[str, Path], entries: Iterable[MemoryEntry]) -> int:
+    """Writes entries to a new memory file, replacing `path` once complete. Returns the count."""
+    path = Path(path)
+    directory = str(path.parent)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    exact, lsh = _ExternalSorter(directory), _ExternalSorter(directory)
+    count = 0
+    with temporary_path.open("wb") as output, tempfile.TemporaryFile(dir=directory) as offsets:
+        output.write(b"\0" * HEADER_SIZE)
+        position = HEADER_SIZE
+        for entry in entries:
+            fields = [
+                value.encode("utf-8")
+                for value in (entry.engine, entry.source_language, entry.target_language, entry.detected_language, entry.source, entry.target)
+            ]
+            record = _RECORD.pack(*map(len, fields)) + b"".join(fields)
+            output.write(record)
+            offsets.write(_OFFSET.pack(position))
+            position += len(record)
+            template = make_template(entry.source)
+            exact.add(_ENTRY.pack(exact_hash(template, entry.source_language, entry.target_language), count))
+            for band in band_hashes(template, entry.source_language, entry.target_language):
+                lsh.add(_ENTRY.pack(band, count))
+            count += 1
+        offsets_offset = position
+        offsets.seek(0)
+        while True:
+            block = offsets.read(1 << 20)
+            if not block:
+                break
+            output.write(block)
+        exact_offset = offsets_offset + count * _OFFSET.size
+        exact.write_sorted(output)
+        lsh_offset = exact_offset + exact.count * _ENTRY.size
+        lsh.write_sorted(output)
+        output.seek(0)
+        output.write(_HEADER.pack(MAGIC, VERSION, count, offsets_offset, exact_offset, exact.count, lsh_offset, lsh.count))
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(temporary_path, path)
+    return count
+
+
+class MemoryFile:
+    """Read-only view of a memory file through mmap."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a translation memory file")
+        if self._map.size() < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{self.path} is not a translation memory file")
+        magic, version, *counts = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} translation memory file")
+        self.count, self._offsets, self._exact, self._exact_count, self._lsh, self._lsh_count = counts
+
+    def entry(self, record_id: int) -> MemoryEntry:
+        position = _OFFSET.unpack_from(self._map, self._offsets + record_id * _OFFSET.size)[0]
+        lengths = _RECORD.unpack_from(self._map, position)
+        position += _RECORD.size
+        values = []
+        for length in lengths:
+            values.append(self._map[position:position + length].decode("utf-8"))
+            position += length
+        engine, source_language, target_language, detected_language, source, target = values
+        return MemoryEntry(source, target, target_language, source_language, engine, detected_language)
+
+    def _search(self, offset: int, count: int, key: int, limit: Optional[int] = None) -> list[int]:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if _ENTRY.unpack_from(self._map, offset + middle * _ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        record_ids = []
+        while low < count and (limit is None or len(record_ids) < limit):
+            found, record_id = _ENTRY.unpack_from(self._map, offset + low * _ENTRY.size)
+            if found != key:
+                break
+            record_ids.append(record_id)
+            low += 1
+        return record_ids
+
+    def exact(self, key: int) -> list[int]:
+        return self._search(self._exact, self._exact_count, key)
+
+    def near(self, keys: list[int]) -> Counter:
+        """Record ids sharing a band with the keys, counted by the number of bands shared."""
+        record_ids: Counter = Counter()
+        for key in keys:
+            record_ids.update(self._search(self._lsh, self._lsh_count, key, MAX_BUCKET_CANDIDATES))
+        return record_ids
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        for record_id in range(self.count):
+            yield self.entry(record_id)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class TranslationMemory:
+    """Stores translations and finds them again for identical and near-identical segments.
+
+    `lookup` answers template matches, and near duplicates whose template similarity is
+    at least `threshold`. With `engine_specific=True` only translations of the asking
+    engine are reused. New entries stay in memory until `save()`, which writes them and
+    the entries of `path` into a new file.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        threshold: float = 0.85,
+        engine_specific: bool = False,):
+        self.path = Path(path) if path is not None else None
+        self.threshold = threshold
+        self.engine_specific = engine_specific
+        self._file: Optional[MemoryFile] = None
+        self._entries: list[MemoryEntry] = []
+        self._exact: dict[int, list[int]] = {}
+        self._bands: dict[int, list[int]] = {}
+        self._lock = threading.RLock()
+        if self.path is not None and self.path.exists():
+            self._file = MemoryFile(self.path)
+
+    def _engine_matches(self, entry: MemoryEntry, engine: Optional[str]) -> bool:
+        return not self.engine_specific or engine is None or entry.engine == engine
+
+    def _exact_candidates(self, exact_key: int) -> Iterator[MemoryEntry]:
+        """Newest entries first, those added since the file was written before the file's."""
+        with self._lock:
+            entries = [self._entries[index] for index in reversed(self._exact.get(exact_key, ()))]
+            memory_file = self._file
+        yield from entries
+        if memory_file is not None:
+            for record_id in sorted(memory_file.exact(exact_key), reverse=True):
+                yield memory_file.entry(record_id)
+
+    def _near_candidates(self, band_keys: list[int]) -> Iterator[MemoryEntry]:
+        """The `MAX_VERIFIED_CANDIDATES` entries sharing the most bands, newest first on ties."""
+        with self._lock:
+            shared = Counter(
+                index for key in band_keys for index in self._bands.get(key, ())[-MAX_BUCKET_CANDIDATES:]
+            )
+            memory_file = self._file
+        # Entries of the file rank below the newer in-memory ones with as many bands.
+        ranked = [(count, 1, index) for index, count in shared.items()]
+        if memory_file is not None:
+            ranked.extend((count, 0, record_id) for record_id, count in memory_file.near(band_keys).items())
+        for _, in_memory, index in heapq.nlargest(MAX_VERIFIED_CANDIDATES, ranked):
+            if in_memory:
+                with self._lock:
+                    yield self._entries[index]
+            else:
+                yield memory_file.entry(index)
+
+    def lookup(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        engine: Optional[str] = None,) -> Optional[MemoryMatch]:
+        """Returns a translation of `text` adapted from the memory, or None."""
+        source_language, target_language = (source_language or "").lower(), target_language.lower()
+        query = make_template(text)
+        if not query.key:
+            return None
+        exact_key = exact_hash(query, source_language, target_language)
+        for entry in self._exact_candidates(exact_key):
+            if not self._engine_matches(entry, engine):
+                continue
+            stored = make_template(entry.source)
+            if stored.key == query.key:
+                adapted = adapt_translation(stored, query, entry.target)
+                if adapted is not None:
+                    return MemoryMatch(adapted, entry, 1.0)
+        if self.threshold >= 1:
+            return None
+        best: Optional[tuple[float, MemoryEntry, Template]] = None
+        for entry in self._near_candidates(band_hashes(query, source_language, target_language)):
+            if not self._engine_matches(entry, engine):
+                continue
+            stored = make_template(entry.source)
+            matcher = SequenceMatcher(None, stored.key, query.key, autojunk=False)
+            if matcher.quick_ratio() < self.threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= self.threshold and (best is None or similarity > best[0]):
+                best = (similarity, entry, stored)
+        if best is None:
+            return None
+        similarity, entry, stored = best
+        adapted = adapt_translation(stored, query, entry.target)
+        return MemoryMatch(adapted, entry, similarity) if adapted is not None else None
+
+    def add(
+        self,
+        source: str,
+        target: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        engine: str = "",
+        detected_language: Optional[str] = None,):
+        """Stores a translation until the next `save()`."""
+        self.add_entry(MemoryEntry(source, target, target_language, source_language, engine, detected_language))
+
+    def add_entry(self, entry: MemoryEntry):
+        template = make_template(entry.source)
+        if not template.key:
+            return
+        exact_key = exact_hash(template, entry.source_language, entry.target_language)
+        band_keys = band_hashes(template, entry.source_language, entry.target_language)
+        with self._lock:
+            index = len(self._entries)
+            self._entries.append(entry)
+            self._exact.setdefault(exact_key, []).append(index)
+            for key in band_keys:
+                self._bands.setdefault(key, []).append(index)
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        with self._lock:
+            entries = list(self._entries)
+            memory_file = self._file
+        if memory_file is not None:
+            yield from memory_file
+        yield from entries
+
+    def __len__(self):
+        return len(self._entries) + (len(self._file) if self._file is not None else 0)
+
+    def save(self, path: Optional[Union[str, Path]] = None, extra: Iterable[MemoryEntry] = ()) -> int:
+        """Writes every entry, and `extra` ones, to `path` (or the memory's own path) and maps it.
+
+        Returns the number of entries written.
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("The translation memory has no path to save to")
+        with self._lock:
+            count = write_memory_file(path, chain(self, extra))
+            if self._file is not None:
+                self._file.close()
+            self.path = path
+            self._file = MemoryFile(path)
+            self._entries, self._exact, self._bands = [], {}, {}
+        return count
+
+    def import_jsonl(self, path: Union[str, Path], encoding: str = "utf-8") -> int:
+        """Adds the entries of a JSON lines file (see `MemoryEntry.to_dict`) and saves.
+
+        Entries stream straight into the new file, they are never all held in memory.
+        Returns the number of entries imported.
+        """
+        imported = 0
+
+        def read() -> Iterator[MemoryEntry]:
+            nonlocal imported
+            with open(path, encoding=encoding) as f:
+                for line in f:
+                    if line.strip():
+                        imported += 1
+                        yield MemoryEntry.from_dict(json.loads(line))
+
+        if self.path is None:
+            for entry in read():
+                self.add_entry(entry)
+        else:
+            self.save(extra=read())
+        return imported
+
+    def export_jsonl(self, path: Union[str, Path], encoding: str = "utf-8") -> int:
+        """Writes every entry as a JSON line, returns how many were written."""
+        count = 0
+        with open(path, "w", encoding=encoding) as f:
+            for entry in self:
+                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"TranslationMemory(path={str(self.path) if self.path else None!r}, entries={len(self)})"
@@ -0,0 +1,164 @@
+import bisect
+import threading
+import time
+from typing import Callable, Optional
+
+# Phases of a translation call, in the order they happen.
+PHASES = ("validate", "cache", "session", "rate_limit", "build", "network", "decode", "format")
+# Counters kept per engine, exported as `mintrans_<name>_total`.
+COUNTERS = ("requests", "retries", "captchas", "rate_limits", "errors", "cache_hits", "bytes_sent", "bytes_received", "local_detections", "coalesced", "memory_hits")
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsSink:
+    """Receives counter increments and phase timings, subclass it to forward them elsewhere."""
+
+    def count(self, engine: str, name: str, value: int = 1):
+        pass
+
+    def observe(self, engine: str, phase: str, seconds: float):
+        pass
+
+
+class CallbackSink(MetricsSink):
+    """Calls `on_count(engine, name, value)` and `on_observe(engine, phase, seconds)`."""
+
+    def __init__(
+        self,
+        on_count: Optional[Callable[[str, str, int], None]] = None,
+        on_observe: Optional[Callable[[str, str, float], None]] = None,):
+        self.on_count = on_count
+        self.on_observe = on_observe
+
+    def count(self, engine: str, name: str, value: int = 1):
+        if self.on_count is not None:
+            self.on_count(engine, name, value)
+
+    def observe(self, engine: str, phase: str, seconds: float):
+        if self.on_observe is not None:
+            self.on_observe(engine, phase, seconds)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def as_dict(self) -> dict:
+        return {"count": self.count, "sum": self.sum, "mean": self.sum / self.count if self.count else 0.0}
+
+
+class PhaseClock:
+    """Times consecutive phases of one call, each `mark` records the time since the last one."""
+
+    __slots__ = ("sink", "engine", "last")
+
+    def __init__(self, sink: MetricsSink, engine: str):
+        self.sink = sink
+        self.engine = engine
+        self.last = time.perf_counter()
+
+    def reset(self):
+        self.last = time.perf_counter()
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.sink.observe(self.engine, phase, now - self.last)
+        self.last = now
+
+
+class _NullClock:
+    """Stands in for `PhaseClock` when a translator has no metrics."""
+
+    __slots__ = ()
+
+    def reset(self):
+        pass
+
+    def mark(self, phase: str):
+        pass
+
+
+NULL_CLOCK = _NullClock()
+
+
+class Metrics(MetricsSink):
+    """Thread-safe counters and phase histograms per engine.
+
+    Pass one instance as `metrics=` to any number of translators, read it back with
+    `snapshot()` or `prometheus_text()`. Extra `sinks` get every event as well.
+    """
+
+    def __init__(self, sinks: Optional[list[MetricsSink]] = None, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.sinks = list(sinks or [])
+        self.buckets = tuple(sorted(buckets))
+        self._counters: dict[tuple[str, str], int] = {}
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def clock(self, engine: str) -> PhaseClock:
+        return PhaseClock(self, engine)
+
+    def count(self, engine: str, name: str, value: int = 1):
+        with self._lock:
+            self._counters[engine, name] = self._counters.get((engine, name), 0) + value
+        for sink in self.sinks:
+            sink.count(engine, name, value)
+
+    def observe(self, engine: str, phase: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get((engine, phase))
+            if histogram is None:
+                histogram = self._histograms[engine, phase] = Histogram(self.buckets)
+            histogram.observe(seconds)
+        for sink in self.sinks:
+            sink.observe(engine, phase, seconds)
+
+    def counter(self, engine: str, name: str) -> int:
+        return self._counters.get((engine, name), 0)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Returns `{engine: {"counters": {...}, "phases": {phase: {count, sum, mean}}}}`."""
+        snapshot: dict[str, dict] = {}
+        with self._lock:
+            for (engine, name), value in self._counters.items():
+                snapshot.setdefault(engine, {"counters": {}, "phases": {}})["counters"][name] = value
+            for (engine, phase), histogram in self._histograms.items():
+                snapshot.setdefault(engine, {"counters": {}, "phases": {}})["phases"][phase] = histogram.as_dict()
+        return snapshot
+
+    def prometheus_text(self, prefix: str = "mintrans") -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+            for name in sorted({name for (_, name), _ in counters}):
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                for (engine, counter_name), value in counters:
+                    if counter_name == name:
+                        lines.append(f'{prefix}_{name}_total{{engine="{engine}"}} {value}')
+            if histograms:
+                lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+            for (engine, phase), histogram in histograms:
+                labels = f'engine="{engine}",phase="{phase}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_phase_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{prefix}_phase_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{prefix}_phase_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
@@ -1,30 +1,116 @@
 import httpx
 from pydantic import ValidationError
-import re
+import asyncio
+import json
 import time
 import random
-from typing import Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
 from urllib.parse import quote
 from pathlib import Path
 
-from tools import google_text_response_formatter, google_file_response_formatter
-from constants import user_agents
-from exceptions import RateLimitException
-from models import TranslationRequest, TranslationResponse, DetectedLanguageResponse, FileRequest, FileResponse
+from .tools import google_text_response_formatter, google_batch_text_response_formatter, google_file_response_formatter, pack_batches, split_text, strip_chunk
+from .constants import user_agents
+from .cache import BaseCache, make_cache_key
+from .exceptions import RateLimitException, CaptchaException
+from .transport import SharedTransport
+from .ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .batchexecute import decode_entries, rpc_payloads
+from .models import (
+    MAX_TEXT_LENGTH,
+    TRANSLATION_RESULT_TYPES,
+    AnyTranslationRequest,
+    DetectedLanguageResponse,
+    FileResponse,
+    TranslationRequest,
+    TranslationRequestData,
+    TranslationResponse,
+    TranslationResult,
+)
+
+if TYPE_CHECKING:
+    # Documents, detection, memory, markup, images, sessions and metrics are imported where
+    # they are used, `from mintrans import GoogleTranslator` does not pay for them.
+    from .detection import LanguageDetector
+    from .documents import DocumentStats
+    from .images import FormBody, ImageData, ImageSource
+    from .memory import TranslationMemory
+    from .metrics import Metrics
+    from .session import BingSession, BingSessionManager
 
 class BaseTranslator:
-    def __init__(self):
+    engine = "base"
+    auto_language = "auto"
+    supports_batch = False
+    batch_char_limit = 1500
+    batch_size_limit = 1
+    batch_separator_length = 0
+    max_text_length = 1500
+    # Whether every text of a batch comes back with a source language of its own.
+    batch_detection = False
+    # Whether one batch can hold requests for different target languages.
+    batch_mixed_targets = False
+    # Engine spellings of the codes the local detector answers with.
+    detected_language_codes: dict[str, str] = {}
+
+    def __init__(
+        self,
+        cache: Optional[BaseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[SharedTransport] = None,
+        validate: bool = False,
+        metrics: Optional["Metrics"] = None,
+        detector: Optional["LanguageDetector"] = None,
+        coalesce: bool = True,
+        memory: Optional["TranslationMemory"] = None,):
         self.client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.transport = transport
+        self.metrics = metrics
+        self._detector = detector
+        self.memory = memory
+        # Identical translate_text calls running at the same time share one request.
+        self.coalesce = coalesce
+        self._in_flight = self._create_single_flight()
+        # Strict pydantic models are opt-in, the default path builds slotted objects.
+        self.validate = validate
+
+    @property
+    def detector(self) -> "LanguageDetector":
+        """The local language detector, a default one is built on first use."""
+        if self._detector is None:
+            from .detection import LanguageDetector
+
+            self._detector = LanguageDetector()
+        return self._detector
+
+    @detector.setter
+    def detector(self, detector: "LanguageDetector"):
+        self._detector = detector
+
+    def _create_single_flight(self):
+        return SingleFlight()
 
     def _create_client(self):
-        """Initializes the HTTPX client."""
+        """Initializes the HTTPX client, taken from the shared transport when there is one."""
         if not self.client:
-            self.client = httpx.Client()
+            with self._client_lock:
+                if not self.client:
+                    self.client = self.transport.get_client() if self.transport else httpx.Client()
+        return self.client
 
     def close(self):
-        """Closes the client."""
+        """Closes the client, a shared transport stays open for its other translators."""
         if self.client:
-            self.client.close()
+            if not self.transport:
+                self.client.close()
             self.client = None
 
     def __enter__(self):
@@ -37,70 +123,785 @@ class BaseTranslator:
     def get_headers(self):
         return {"user-agent": random.choice(user_agents)}
 
-class BingTranslator(BaseTranslator):
-    def __init__(self):
-        super().__init__()
-        self.session = None
-
-    def _get_session(self):
-        self._create_client()
-        session = self.client
-        headers = self.get_headers()
-        headers.update({
-            "Referer": "https://www.bing.com/translator"
-        })
-        session.headers.update(headers)
-        response = session.get("https://www.bing.com/translator")
-        content = response.text
-        params_pattern = re.compile(r"params_AbusePreventionHelper\s*=\s*(\[.*?\]);", re.DOTALL)
-        match = params_pattern.search(content)
-        if match:
-            params = match.group(1)
-            key, token, time = [p.strip("\"").replace("[", "").replace("]", "") for p in params.split(",")]
-            session.headers.update({"key": key, "token": token})
-        match = re.search(r'IG:"(\w+)"', content)
-        if match:
-            ig_value = match.group(1)
-            session.headers.update({"IG": ig_value})
-        return session
-
-    def translate_text(self, text: str, target_language: str, source_language: str = "auto-detect"):
-        if not self.session:
-            self.session = self._get_session()
-
+    def _validate_request(self, text: str, target_language: str, source_language: Optional[str] = None) -> AnyTranslationRequest:
+        if not self.validate:
+            if not isinstance(text, str) or not isinstance(target_language, str) or not isinstance(source_language, (str, type(None))):
+                raise ValueError("Invalid input: text and languages must be strings")
+            if len(text) > MAX_TEXT_LENGTH:
+                raise ValueError(f"Invalid input: Text must not exceed {MAX_TEXT_LENGTH} characters")
+            return TranslationRequestData(text, source_language or self.auto_language, target_language)
         try:
-            translation_request = TranslationRequest(
+            return TranslationRequest(
                 text=text,
-                source_language=source_language,
+                source_language=source_language or self.auto_language,
                 target_language=target_language,
             )
         except ValidationError as e:
             raise ValueError(f"Invalid input: {e}")
-        
-        url = f"https://www.bing.com/ttranslatev3?isVertical=1&&IG={self.session.headers.get('IG')}&IID=translator.{random.randint(5019, 5026)}.{random.randint(1, 3)}"
+
+    def _make_result(self, text: str, source_language: str, target_language: str) -> Union[TranslationResponse, TranslationResult]:
+        if self.validate:
+            return TranslationResponse(text=text, source_language=source_language, target_language=target_language)
+        return TranslationResult(text, source_language, target_language)
+
+    def _cache_key(self, translation_request: AnyTranslationRequest) -> str:
+        return make_cache_key(
+            self.engine,
+            translation_request.text,
+            translation_request.source_language,
+            translation_request.target_language,
+        )
+
+    def _cache_get(self, translation_request: AnyTranslationRequest) -> Optional[TranslationResponse]:
+        if self.cache is None:
+            return None
+        value = self.cache.get(self._cache_key(translation_request))
+        return self._make_result(**value) if value is not None else None
+
+    def _cache_set(self, translation_request: AnyTranslationRequest, result):
+        # Error payloads (e.g. Bing's statusCode dict) are never cached or remembered.
+        if not isinstance(result, TRANSLATION_RESULT_TYPES):
+            return
+        if self.cache is not None:
+            self.cache.set(self._cache_key(translation_request), result.model_dump())
+        if self.memory is not None:
+            self.memory.add(
+                translation_request.text,
+                result.text,
+                translation_request.target_language,
+                self._memory_source_language(translation_request),
+                self.engine,
+                result.source_language,
+            )
+
+    def _memory_source_language(self, translation_request: AnyTranslationRequest) -> Optional[str]:
+        if translation_request.source_language == self.auto_language:
+            return None
+        return translation_request.source_language
+
+    def _memory_get(self, translation_request: AnyTranslationRequest):
+        """Returns a translation adapted from the translation memory, or None."""
+        if self.memory is None:
+            return None
+        match = self.memory.lookup(
+            translation_request.text,
+            translation_request.target_language,
+            self._memory_source_language(translation_request),
+            self.engine,
+        )
+        if match is None:
+            return None
+        if self.metrics is not None:
+            self.metrics.count(self.engine, "memory_hits")
+        return self._make_result(
+            text=match.text,
+            source_language=match.source_language or translation_request.source_language,
+            target_language=translation_request.target_language,
+        )
+
+    def _stored_get(self, translation_request: AnyTranslationRequest):
+        cached = self._cache_get(translation_request)
+        return cached if cached is not None else self._memory_get(translation_request)
+
+    def _detect_cache_key(self, text: str) -> str:
+        return make_cache_key(self.engine, text, self.auto_language, "detect")
+
+    def _detect_local(self, text: str) -> Optional[DetectedLanguageResponse]:
+        """Answers from the detector, then from the cache, None when the engine has to."""
+        detected = self.detector.detect(text, self.engine)
+        if detected is not None:
+            if self.metrics is not None:
+                self.metrics.count(self.engine, "local_detections")
+            return detected
+        if self.cache is not None:
+            cached = self.cache.get(self._detect_cache_key(text))
+            if cached is not None:
+                self.detector.remember(text, cached["language"], self.engine)
+                return DetectedLanguageResponse(**cached)
+        return None
+
+    def _detected(self, text: str, language: str) -> DetectedLanguageResponse:
+        response = DetectedLanguageResponse(language=language)
+        self.detector.remember(text, response.language, self.engine)
+        if self.cache is not None:
+            self.cache.set(self._detect_cache_key(text), response.model_dump())
+        return response
+
+    def _pending_detections(self, texts: list[str], results: list) -> dict[str, list[int]]:
+        """Indexes of the texts left for the engine, grouped by text."""
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            if results[index] is None:
+                pending.setdefault(text, []).append(index)
+        return pending
+
+    def _fan_out_source(self, text: str, source_language: Optional[str]) -> Optional[str]:
+        """The given source language, else a local or remembered detection of the text, else None."""
+        if source_language and source_language != self.auto_language:
+            return source_language
+        detected = self._detect_local(text)
+        if detected is None:
+            return None
+        return self.detected_language_codes.get(detected.language, detected.language)
+
+    def _fan_out_requests(self, text: str, target_languages: Iterable[str], source_language: Optional[str]) -> tuple[dict, dict]:
+        """Requests and stored results by target language, None for the targets left to translate."""
+        translation_requests = {
+            target_language: self._validate_request(text, target_language, source_language)
+            for target_language in dict.fromkeys(target_languages)
+        }
+        results = {
+            target_language: self._stored_get(translation_request)
+            for target_language, translation_request in translation_requests.items()
+        }
+        return translation_requests, results
+
+    def _fan_out_groups(self, translation_requests: dict, results: dict) -> list[list[str]]:
+        """Target languages of the pending requests, grouped into upstream requests."""
+        pending = [target_language for target_language, result in results.items() if result is None]
+        if not self.batch_mixed_targets:
+            return [[target_language] for target_language in pending]
+        return [
+            [pending[index] for index in group]
+            for group in self._pack_batch_requests([translation_requests[target_language] for target_language in pending])
+        ]
+
+    def _build_translate_request(self, translation_request: AnyTranslationRequest) -> dict:
+        """Returns the keyword arguments of the upstream `client.request` call."""
+        raise NotImplementedError
+
+    def _parse_translate_response(self, response: httpx.Response, translation_request: AnyTranslationRequest):
+        raise NotImplementedError
+
+    def _send(self, request: dict) -> httpx.Response:
+        if self.transport is not None:
+            return self.transport.send(request)
+        self._create_client()
+        return self.client.request(**request)
+
+    def _ensure_session(self, refresh: bool = False):
+        """Makes sure the engine has the session it needs, `refresh=True` replaces it."""
+
+    def _clock(self):
+        """Phase timer of one call, a no-op when the translator has no metrics."""
+        if self.metrics is None:
+            from .metrics import NULL_CLOCK
+
+            return NULL_CLOCK
+        return self.metrics.clock(self.engine)
+
+    def _record_response(self, response: httpx.Response):
+        if self.metrics is not None:
+            self.metrics.count(self.engine, "requests")
+            # Streamed bodies (images) can not be read back, their length is in the header.
+            self.metrics.count(self.engine, "bytes_sent", int(response.request.headers.get("content-length", 0)))
+            self.metrics.count(self.engine, "bytes_received", len(response.content))
+
+    def _record_error(self, error: Exception, retried: bool):
+        if self.metrics is None:
+            return
+        if isinstance(error, CaptchaException):
+            self.metrics.count(self.engine, "captchas")
+        elif isinstance(error, RateLimitException):
+            self.metrics.count(self.engine, "rate_limits")
+        else:
+            self.metrics.count(self.engine, "errors")
+        if retried:
+            self.metrics.count(self.engine, "retries")
+
+    def _check_status(self, response: httpx.Response):
+        if response.status_code == 429 or (response.status_code == 503 and "retry-after" in response.headers):
+            raise RateLimitException(
+                "Rate limit error!", retry_after=parse_retry_after(response.headers.get("retry-after"))
+            )
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Returns how long to wait before the next attempt, or None when `error` must be raised.
+
+        A `Retry-After` blocks the rate limiter even when this call gives up, other callers share it.
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None and self.rate_limiter is not None:
+            self.rate_limiter.block(retry_after)
+        if not self.retry_policy.should_retry(error, attempt):
+            return None
+        return self.retry_policy.delay(attempt, retry_after)
+
+    def _execute(self, build: Callable[[], dict], parse: Callable[[httpx.Response], Any]):
+        """Sends the request made by `build` and parses it, retrying by the retry policy.
+
+        A captcha refreshes the session before the next attempt.
+        """
+        attempt, refresh = 0, False
+        clock = self._clock()
+        while True:
+            attempt += 1
+            try:
+                clock.reset()
+                self._ensure_session(refresh=refresh)
+                clock.mark("session")
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                    clock.mark("rate_limit")
+                request = build()
+                clock.mark("build")
+                response = self._send(request)
+                clock.mark("network")
+                self._record_response(response)
+                self._check_status(response)
+                result = parse(response)
+                clock.mark("decode")
+                return result
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                self._record_error(e, retried=delay is not None)
+                if delay is None:
+                    raise
+                refresh = isinstance(e, CaptchaException)
+                time.sleep(delay)
+
+    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResponse:
+        clock = self._clock()
+        translation_request = self._validate_request(text, target_language, source_language)
+        clock.mark("validate")
+        cached = self._cache_get(translation_request)
+        if cached is not None:
+            if self.metrics is not None:
+                self.metrics.count(self.engine, "cache_hits")
+        else:
+            cached = self._memory_get(translation_request)
+        if self.cache is not None or self.memory is not None:
+            clock.mark("cache")
+        if cached is not None:
+            return cached
+        if not self.coalesce:
+            return self._translate_uncached(translation_request)
+        result, shared = self._in_flight.do(
+            self._cache_key(translation_request), partial(self._translate_uncached, translation_request)
+        )
+        if shared and self.metrics is not None:
+            self.metrics.count(self.engine, "coalesced")
+        return result
+
+    def _translate_uncached(self, translation_request: AnyTranslationRequest):
+        result = self._execute(
+            partial(self._build_translate_request, translation_request),
+            partial(self._parse_translate_response, translation_request=translation_request),
+        )
+        self._cache_set(translation_request, result)
+        return result
+
+    def _pack_batch_requests(self, translation_requests: list[AnyTranslationRequest]) -> list[list[int]]:
+        """Groups the indexes of `translation_requests` into upstream requests."""
+        if not self.supports_batch:
+            return [[index] for index in range(len(translation_requests))]
+        return pack_batches(
+            [len(translation_request.text) for translation_request in translation_requests],
+            self.batch_char_limit,
+            self.batch_size_limit,
+            self.batch_separator_length,
+        )
+
+    def _build_batch_request(self, translation_requests: list[AnyTranslationRequest]) -> dict:
+        raise NotImplementedError
+
+    def _parse_batch_response(self, response: httpx.Response, translation_requests: list[AnyTranslationRequest]) -> list:
+        """Returns one result per request, or an empty list when the batch could not be split back."""
+        raise NotImplementedError
+
+    def _translate_group(self, translation_requests: list[AnyTranslationRequest]) -> list:
+        if len(translation_requests) > 1:
+            results = self._execute(
+                partial(self._build_batch_request, translation_requests),
+                partial(self._parse_batch_response, translation_requests=translation_requests),
+            )
+            if len(results) == len(translation_requests):
+                return results
+        return [
+            self._execute(
+                partial(self._build_translate_request, translation_request),
+                partial(self._parse_translate_response, translation_request=translation_request),
+            )
+            for translation_request in translation_requests
+        ]
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResponse]:
+        """Translates many texts with as few upstream requests as the engine limits allow.
+
+        Results are returned in the order of `texts`.
+        """
+        translation_requests = [self._validate_request(text, target_language, source_language) for text in texts]
+        results = [self._stored_get(translation_request) for translation_request in translation_requests]
+        pending = [index for index, result in enumerate(results) if result is None]
+        for group in self._pack_batch_requests([translation_requests[index] for index in pending]):
+            group = [pending[index] for index in group]
+            group_results = self._translate_group([translation_requests[index] for index in group])
+            for index, result in zip(group, group_results):
+                results[index] = result
+                self._cache_set(translation_requests[index], result)
+        return results
+
+    def translate_to_many(
+        self,
+        text: str,
+        target_languages: Iterable[str],
+        source_language: Optional[str] = None,
+        max_concurrency: int = 4,) -> dict[str, TranslationResponse]:
+        """Translates one text into many languages, results are keyed by target language.
+
+        An unknown source language is detected once for all targets. Engines that take
+        several language pairs in one request get the targets in as few requests as their
+        limits allow, the others get one request per target on up to `max_concurrency`
+        threads.
+        """
+        target_languages = list(dict.fromkeys(target_languages))
+        source_language = self._fan_out_source(text, source_language)
+        if source_language is None and not self.batch_mixed_targets and len(target_languages) > 1:
+            source_language = self.detect_language(text).language
+        translation_requests, results = self._fan_out_requests(text, target_languages, source_language)
+        groups = self._fan_out_groups(translation_requests, results)
+        if not groups:
+            return results
+        self._ensure_session()
+        if self.batch_mixed_targets:
+            call = lambda group: self._translate_group([translation_requests[target_language] for target_language in group])
+        else:
+            call = lambda group: [self.translate_text(text, group[0], source_language)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(groups)))) as executor:
+            for group, group_results in zip(groups, executor.map(call, groups)):
+                for target_language, result in zip(group, group_results):
+                    results[target_language] = result
+                    if self.batch_mixed_targets:
+                        self._cache_set(translation_requests[target_language], result)
+        return results
+
+    def _split_long_text(self, text: str) -> tuple[list[tuple[str, str, str]], list[str]]:
+        chunks = [strip_chunk(chunk) for chunk in split_text(text, self.max_text_length)]
+        return chunks, [content for _, content, _ in chunks if content]
+
+    def _join_long_text(self, chunks: list[tuple[str, str, str]], results: list, target_language: str, source_language: Optional[str]):
+        for result in results:
+            if not isinstance(result, TRANSLATION_RESULT_TYPES):
+                return result
+        translated = iter(results)
+        text = "".join(
+            leading + (next(translated).text if content else "") + trailing
+            for leading, content, trailing in chunks
+        )
+        return self._make_result(
+            text=text,
+            source_language=results[0].source_language if results else (source_language or self.auto_language),
+            target_language=results[0].target_language if results else target_language,
+        )
+
+    def translate_long_text(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        max_concurrency: int = 4,) -> TranslationResponse:
+        """Translates a text of any length by splitting it at paragraph and sentence boundaries.
+
+        Chunks are sent on up to `max_concurrency` threads and joined back in order,
+        whitespace and newlines between them are kept as they are.
+        """
+        chunks, contents = self._split_long_text(text)
+        if contents:
+            self._ensure_session()
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            results = list(executor.map(
+                lambda content: self.translate_text(content, target_language, source_language), contents
+            ))
+        return self._join_long_text(chunks, results, target_language, source_language)
+
+    def translate_document(
+        self,
+        document_path: Union[str, Path],
+        target_language: str,
+        source_language: Optional[str] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        file_format: Optional[str] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        window_size: int = 200,
+        json_keys: Optional[Iterable[str]] = None,) -> "DocumentStats":
+        """Translates a text, SRT/VTT, PO or JSON file in a streaming way, see `DocumentPipeline`.
+
+        The output goes to `output_path`, by default next to the input as `name.<target>.ext`.
+        `json_keys` limits JSON files to the values of those keys.
+        """
+        from .documents import DocumentPipeline, default_output_path
+
+        pipeline = DocumentPipeline(
+            self,
+            target_language,
+            source_language,
+            file_format=file_format,
+            window_size=window_size,
+            checkpoint_path=checkpoint_path,
+            json_keys=json_keys,
+        )
+        return pipeline.translate_file(document_path, output_path or default_output_path(document_path, target_language))
+
+    def translate_markup(self, markup: str, target_language: str, source_language: Optional[str] = None) -> str:
+        """Translates the text nodes of HTML, XML or a templated string, see `markup`."""
+        return self.translate_markups([markup], target_language, source_language)[0]
+
+    def translate_markups(self, documents: list[str], target_language: str, source_language: Optional[str] = None) -> list[str]:
+        """Translates the text nodes of many documents, a text repeated within or across them is sent once."""
+        from .markup import MarkupBatch
+
+        batch = MarkupBatch(documents, self.max_text_length)
+        if batch.texts:
+            retry = batch.store(self.translate_batch(batch.texts, target_language, source_language))
+            if retry:
+                batch.store_parts(self.translate_batch(retry, target_language, source_language))
+        return batch.render()
+
+    def detect_language(self, text: str) -> DetectedLanguageResponse:
+        """Detects the language of a text locally, the engine only answers short or ambiguous texts."""
+        detected = self._detect_local(text)
+        if detected is not None:
+            return detected
+        result = self.translate_text(text, source_language=self.auto_language, target_language="tr")
+        return self._detected(text, result.source_language)
+
+    def detect_languages(self, texts: list[str]) -> list[DetectedLanguageResponse]:
+        """Detects the languages of many texts, in order.
+
+        Texts the detector is not sure of are sent once each, in batches on engines that
+        detect every text of a batch on its own.
+        """
+        results = [self._detect_local(text) for text in texts]
+        pending = self._pending_detections(texts, results)
+        if self.batch_detection:
+            translations = self.translate_batch(list(pending), source_language=self.auto_language, target_language="tr")
+        else:
+            translations = [
+                self.translate_text(text, source_language=self.auto_language, target_language="tr") for text in pending
+            ]
+        for (text, indexes), translation in zip(pending.items(), translations):
+            detected = self._detected(text, translation.source_language)
+            for index in indexes:
+                results[index] = detected
+        return results
+
+
+class AsyncBaseTranslator(BaseTranslator):
+    """Asyncio flavour of `BaseTranslator` running on a shared `httpx.AsyncClient`.
+
+    Engines reuse the request builders and response parsers of their sync class,
+    only the I/O is awaited.
+    """
+
+    def _create_single_flight(self):
+        return AsyncSingleFlight()
+
+    def _create_client(self):
+        """Initializes the HTTPX async client."""
+        if not self.client:
+            with self._client_lock:
+                if not self.client:
+                    self.client = self.transport.get_async_client() if self.transport else httpx.AsyncClient()
+        return self.client
+
+    async def aclose(self):
+        """Closes the async client."""
+        if self.client:
+            if not self.transport:
+                await self.client.aclose()
+            self.client = None
+
+    async def __aenter__(self):
+        self._create_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _send(self, request: dict) -> httpx.Response:
+        if self.transport is not None:
+            return await self.transport.send_async(request)
+        self._create_client()
+        return await self.client.request(**request)
+
+    async def _ensure_session(self, refresh: bool = False):
+        pass
+
+    async def _execute(self, build: Callable[[], dict], parse: Callable[[httpx.Response], Any]):
+        attempt, refresh = 0, False
+        clock = self._clock()
+        while True:
+            attempt += 1
+            try:
+                clock.reset()
+                await self._ensure_session(refresh=refresh)
+                clock.mark("session")
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                    clock.mark("rate_limit")
+                request = build()
+                clock.mark("build")
+                response = await self._send(request)
+                clock.mark("network")
+                self._record_response(response)
+                self._check_status(response)
+                result = parse(response)
+                clock.mark("decode")
+                return result
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                self._record_error(e, retried=delay is not None)
+                if delay is None:
+                    raise
+                refresh = isinstance(e, CaptchaException)
+                await asyncio.sleep(delay)
+
+    async def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResponse:
+        clock = self._clock()
+        translation_request = self._validate_request(text, target_language, source_language)
+        clock.mark("validate")
+        cached = self._cache_get(translation_request)
+        if cached is not None:
+            if self.metrics is not None:
+                self.metrics.count(self.engine, "cache_hits")
+        else:
+            cached = self._memory_get(translation_request)
+        if self.cache is not None or self.memory is not None:
+            clock.mark("cache")
+        if cached is not None:
+            return cached
+        if not self.coalesce:
+            return await self._translate_uncached(translation_request)
+        result, shared = await self._in_flight.do(
+            self._cache_key(translation_request), partial(self._translate_uncached, translation_request)
+        )
+        if shared and self.metrics is not None:
+            self.metrics.count(self.engine, "coalesced")
+        return result
+
+    async def _translate_uncached(self, translation_request: AnyTranslationRequest):
+        result = await self._execute(
+            partial(self._build_translate_request, translation_request),
+            partial(self._parse_translate_response, translation_request=translation_request),
+        )
+        self._cache_set(translation_request, result)
+        return result
+
+    async def _translate_group(self, translation_requests: list[AnyTranslationRequest]) -> list:
+        if len(translation_requests) > 1:
+            results = await self._execute(
+                partial(self._build_batch_request, translation_requests),
+                partial(self._parse_batch_response, translation_requests=translation_requests),
+            )
+            if len(results) == len(translation_requests):
+                return results
+        return list(await asyncio.gather(*[
+            self._execute(
+                partial(self._build_translate_request, translation_request),
+                partial(self._parse_translate_response, translation_request=translation_request),
+            )
+            for translation_request in translation_requests
+        ]))
+
+    async def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResponse]:
+        """Translates many texts, sending every packed group concurrently."""
+        translation_requests = [self._validate_request(text, target_language, source_language) for text in texts]
+        results = [self._stored_get(translation_request) for translation_request in translation_requests]
+        pending = [index for index, result in enumerate(results) if result is None]
+        groups = [
+            [pending[index] for index in group]
+            for group in self._pack_batch_requests([translation_requests[index] for index in pending])
+        ]
+        if groups:
+            await self._ensure_session()
+        group_results = await asyncio.gather(*[
+            self._translate_group([translation_requests[index] for index in group]) for group in groups
+        ])
+        for group, group_result in zip(groups, group_results):
+            for index, result in zip(group, group_result):
+                results[index] = result
+                self._cache_set(translation_requests[index], result)
+        return results
+
+    async def translate_to_many(
+        self,
+        text: str,
+        target_languages: Iterable[str],
+        source_language: Optional[str] = None,
+        max_concurrency: int = 4,) -> dict[str, TranslationResponse]:
+        """Translates one text into many languages, at most `max_concurrency` requests are in flight at once."""
+        target_languages = list(dict.fromkeys(target_languages))
+        source_language = self._fan_out_source(text, source_language)
+        if source_language is None and not self.batch_mixed_targets and len(target_languages) > 1:
+            source_language = (await self.detect_language(text)).language
+        translation_requests, results = self._fan_out_requests(text, target_languages, source_language)
+        groups = self._fan_out_groups(translation_requests, results)
+        if not groups:
+            return results
+        await self._ensure_session()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def translate_group(group: list[str]) -> list:
+            async with semaphore:
+                if self.batch_mixed_targets:
+                    return await self._translate_group([translation_requests[target_language] for target_language in group])
+                return [await self.translate_text(text, group[0], source_language)]
+
+        group_results = await asyncio.gather(*[translate_group(group) for group in groups])
+        for group, group_result in zip(groups, group_results):
+            for target_language, result in zip(group, group_result):
+                results[target_language] = result
+                if self.batch_mixed_targets:
+                    self._cache_set(translation_requests[target_language], result)
+        return results
+
+    async def translate_long_text(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        max_concurrency: int = 4,) -> TranslationResponse:
+        """Translates a text of any length, at most `max_concurrency` chunks are in flight at once."""
+        chunks, contents = self._split_long_text(text)
+        if contents:
+            await self._ensure_session()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def translate_chunk(content: str):
+            async with semaphore:
+                return await self.translate_text(content, target_language, source_language)
+
+        results = await asyncio.gather(*[translate_chunk(content) for content in contents])
+        return self._join_long_text(chunks, list(results), target_language, source_language)
+
+    async def translate_document(
+        self,
+        document_path: Union[str, Path],
+        target_language: str,
+        source_language: Optional[str] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        file_format: Optional[str] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        window_size: int = 200,
+        json_keys: Optional[Iterable[str]] = None,) -> "DocumentStats":
+        from .documents import DocumentPipeline, default_output_path
+
+        pipeline = DocumentPipeline(
+            self,
+            target_language,
+            source_language,
+            file_format=file_format,
+            window_size=window_size,
+            checkpoint_path=checkpoint_path,
+            json_keys=json_keys,
+        )
+        return await pipeline.translate_file_async(document_path, output_path or default_output_path(document_path, target_language))
+
+    async def translate_markup(self, markup: str, target_language: str, source_language: Optional[str] = None) -> str:
+        return (await self.translate_markups([markup], target_language, source_language))[0]
+
+    async def translate_markups(self, documents: list[str], target_language: str, source_language: Optional[str] = None) -> list[str]:
+        from .markup import MarkupBatch
+
+        batch = MarkupBatch(documents, self.max_text_length)
+        if batch.texts:
+            retry = batch.store(await self.translate_batch(batch.texts, target_language, source_language))
+            if retry:
+                batch.store_parts(await self.translate_batch(retry, target_language, source_language))
+        return batch.render()
+
+    async def detect_language(self, text: str) -> DetectedLanguageResponse:
+        detected = self._detect_local(text)
+        if detected is not None:
+            return detected
+        result = await self.translate_text(text, source_language=self.auto_language, target_language="tr")
+        return self._detected(text, result.source_language)
+
+    async def detect_languages(self, texts: list[str]) -> list[DetectedLanguageResponse]:
+        results = [self._detect_local(text) for text in texts]
+        pending = self._pending_detections(texts, results)
+        if self.batch_detection:
+            translations = await self.translate_batch(list(pending), source_language=self.auto_language, target_language="tr")
+        else:
+            translations = await asyncio.gather(*(
+                self.translate_text(text, source_language=self.auto_language, target_language="tr") for text in pending
+            ))
+        for (text, indexes), translation in zip(pending.items(), translations):
+            detected = self._detected(text, translation.source_language)
+            for index in indexes:
+                results[index] = detected
+        return results
+
+
+class BingTranslator(BaseTranslator):
+    engine = "bing"
+    auto_language = "auto-detect"
+    # Texts are joined with newlines into a single `text` field.
+    supports_batch = True
+    batch_char_limit = 1000
+    batch_size_limit = 100
+    batch_separator_length = 1
+    max_text_length = 1000
+    detected_language_codes = {"zh": "zh-Hans"}
+
+    def __init__(self, session_manager: Optional["BingSessionManager"] = None, **kwargs):
+        super().__init__(**kwargs)
+        # Share one manager between translators to share the token and its refreshes.
+        if session_manager is None:
+            from .session import BingSessionManager
+
+            session_manager = BingSessionManager()
+        self.session_manager = session_manager
+        self._local = threading.local()
+
+    @property
+    def session(self) -> Optional["BingSession"]:
+        """The session the calling thread's requests use, threads swap theirs on their own."""
+        return getattr(self._local, "session", None)
+
+    @session.setter
+    def session(self, session: Optional["BingSession"]):
+        self._local.session = session
+
+    def _fetch_session(self) -> "BingSession":
+        from .session import build_session_request, parse_bing_session
+
+        response = self._send(build_session_request())
+        self._record_response(response)
+        return parse_bing_session(response)
+
+    def _ensure_session(self, refresh: bool = False):
+        self.session = self.session_manager.get(self._fetch_session, refresh=refresh, stale=self.session)
+
+    def _get_session(self):
+        self._ensure_session(refresh=True)
+        return self.session
+
+    def _build_translate_request(self, translation_request: AnyTranslationRequest) -> dict:
+        # Read once, key, token and IG must come from the same session.
+        session = self.session
+        url = f"https://www.bing.com/ttranslatev3?isVertical=1&&IG={session.ig}&IID=translator.{random.randint(5019, 5026)}.{random.randint(1, 3)}"
         data = {
             "": "",
-            "fromLang": source_language,
-            "text": text,
-            "to": target_language,
-            "token": self.session.headers.get("token"),
-            "key": self.session.headers.get("key")
+            "fromLang": translation_request.source_language,
+            "text": translation_request.text,
+            "to": translation_request.target_language,
+            "token": session.token,
+            "key": session.key
         }
-        response = self.session.post(url, data=data).json()
+        return {"method": "POST", "url": url, "data": data, "headers": session.headers()}
+
+    def _parse_translate_response(self, response: httpx.Response, translation_request: AnyTranslationRequest):
+        response = response.json()
         if isinstance(response, dict):
             if "ShowCaptcha" in response.keys():
-                self.session = self._get_session()
-                return self.translate_text(
-                    translation_request.text,
-                    translation_request.source_language,
-                    translation_request.target_language,
-                )
+                raise CaptchaException("Bing asked for a captcha!")
             elif "statusCode" in response.keys():
                 if response["statusCode"] == 400:
-                    response["errorMessage"] = f"1000 characters limit! You send {len(text)} characters."
+                    response["errorMessage"] = f"1000 characters limit! You send {len(translation_request.text)} characters."
         else:
             response = response[0]
-            return TranslationResponse(
+            return self._make_result(
                 text=response["translations"][0]["text"],
                 source_language=response["detectedLanguage"]["language"],
                 target_language=response["translations"][0]["to"],
@@ -108,30 +909,53 @@ class BingTranslator(BaseTranslator):
 
         return response
 
-    def detect_language(self, text: str):
-        return DetectedLanguageResponse(language=self.translate_text(text=text, source_language="auto-detect", target_language="tr").source_language)
+    def _pack_batch_requests(self, translation_requests: list[AnyTranslationRequest]) -> list[list[int]]:
+        groups = []
+        for group in super()._pack_batch_requests(translation_requests):
+            # Multi-line texts can not be told apart once joined, they go alone.
+            joinable = [index for index in group if "\n" not in translation_requests[index].text]
+            groups.extend([index] for index in group if "\n" in translation_requests[index].text)
+            if joinable:
+                groups.append(joinable)
+        return groups
+
+    def _build_batch_request(self, translation_requests: list[AnyTranslationRequest]) -> dict:
+        joined_request = translation_requests[0].model_copy(
+            update={"text": "\n".join(translation_request.text for translation_request in translation_requests)}
+        )
+        return self._build_translate_request(joined_request)
+
+    def _parse_batch_response(self, response: httpx.Response, translation_requests: list[AnyTranslationRequest]) -> list:
+        response = response.json()
+        if isinstance(response, dict):
+            if "ShowCaptcha" in response.keys():
+                raise CaptchaException("Bing asked for a captcha!")
+            return []
+        response = response[0]
+        lines = response["translations"][0]["text"].split("\n")
+        if len(lines) != len(translation_requests):
+            return []
+        return [
+            self._make_result(
+                text=line,
+                source_language=response["detectedLanguage"]["language"],
+                target_language=response["translations"][0]["to"],
+            )
+            for line in lines
+        ]
 
 
 class DeepLTranslator(BaseTranslator):
-    def __init__(self) -> None:
-        super().__init__()
-        self.client = self._create_client()
+    engine = "deepl"
+    supports_batch = True
+    batch_char_limit = 1500
+    batch_size_limit = 50
 
-    def translate_text(
-        self,
-        text: str,
-        target_language: str,
-        source_language: str = "auto",
-    ) -> TranslationResponse:
-        try:
-            translation_request = TranslationRequest(
-                text=text,
-                source_language=source_language,
-                target_language=target_language,
-            )
-        except ValidationError as e:
-            raise ValueError(f"Invalid input: {e}")
+    def _build_translate_request(self, translation_request: AnyTranslationRequest) -> dict:
+        return self._build_batch_request([translation_request])
 
+    def _build_batch_request(self, translation_requests: list[AnyTranslationRequest]) -> dict:
+        translation_request = translation_requests[0]
         json = {
             "jsonrpc": "2.0",
             "method": "LMT_handle_jobs",
@@ -140,10 +964,11 @@ class DeepLTranslator(BaseTranslator):
                     {
                         "kind": "default",
                         "sentences": [
-                            {"text": translation_request.text, "id": 1, "prefix": ""}
+                            {"text": job_request.text, "id": index + 1, "prefix": ""}
                         ],
                         "preferred_num_beams": 1,  # translation_request.num_beams,
                     }
+                    for index, job_request in enumerate(translation_requests)
                 ],
                 "lang": {
                     "target_lang": translation_request.target_language,
@@ -163,12 +988,18 @@ class DeepLTranslator(BaseTranslator):
         headers = self.get_headers()
         headers.update({"content-type": "application/json"})
 
-        response = self.client.post(
-            "https://www2.deepl.com/jsonrpc", json=json, params=params, headers=headers
-        ).json()
+        return {
+            "method": "POST",
+            "url": "https://www2.deepl.com/jsonrpc",
+            "json": json,
+            "params": params,
+            "headers": headers,
+        }
 
+    def _parse_translate_response(self, response: httpx.Response, translation_request: AnyTranslationRequest) -> TranslationResponse:
+        response = response.json()
         try:
-            return TranslationResponse(
+            return self._make_result(
                 text=response["result"]["translations"][0]["beams"][0]["sentences"][0][
                     "text"
                 ],
@@ -178,56 +1009,69 @@ class DeepLTranslator(BaseTranslator):
         except KeyError:
             raise RateLimitException("Rate limit error!")
 
-    def close(self):
-        self.client.close()
-
-    def detect_language(self, text: str) -> str:
-        return DetectedLanguageResponse(
-            language=self.translate_text(
-                text, source_language="auto", target_language="tr"
-            ).source_language
-        )
-
+    def _parse_batch_response(self, response: httpx.Response, translation_requests: list[AnyTranslationRequest]) -> list:
+        response = response.json()
+        try:
+            return [
+                self._make_result(
+                    text=" ".join(sentence["text"] for sentence in translation["beams"][0]["sentences"]),
+                    source_language=response["result"]["source_lang"],
+                    target_language=response["result"]["target_lang"],
+                )
+                for translation in response["result"]["translations"]
+            ]
+        except KeyError:
+            raise RateLimitException("Rate limit error!")
 
 class GoogleTranslator(BaseTranslator):
-    def __init__(self):
-        super().__init__()
-        self.client = self._create_client()
+    engine = "google"
+    # batchexecute accepts several MkEWBc envelopes in one `f.req`.
+    supports_batch = True
+    batch_char_limit = 5000
+    batch_size_limit = 50
+    batch_detection = True
+    # Every envelope carries its own language pair.
+    batch_mixed_targets = True
+    detected_language_codes = {"zh": "zh-CN"}
 
-    def translate_text(
-        self,
-        text: str,
-        target_language: str,
-        source_language: str = "auto",) -> TranslationResponse:
-        try:
-            translation_request = TranslationRequest(
-                text=text,
-                source_language=source_language,
-                target_language=target_language,
-            )
-        except ValidationError as e:
-            raise ValueError(f"Invalid input: {e}")
+    def _build_translate_request(self, translation_request: AnyTranslationRequest) -> dict:
+        return self._build_batch_request([translation_request], envelope_ids=["generic"])
 
+    def _build_batch_request(self, translation_requests: list[AnyTranslationRequest], envelope_ids: Optional[list[str]] = None) -> dict:
         url = "https://translate.google.com/_/TranslateWebserverUi/data/batchexecute"
 
         params = {"rpcids": "MkEWBc"}
 
-        payload = "f.req=" + quote(
-            f'[[["MkEWBc","[[\\"{translation_request.text}\\",\\"{translation_request.source_language}\\",\\"{translation_request.target_language}\\",true],[]]",null,"generic"]]]'
-        )
+        envelope_ids = envelope_ids or [str(index + 1) for index in range(len(translation_requests))]
+        envelopes = [
+            [
+                "MkEWBc",
+                json.dumps(
+                    [[translation_request.text, translation_request.source_language, translation_request.target_language, True], []],
+                    separators=(",", ":"),
+                ),
+                None,
+                envelope_id,
+            ]
+            for translation_request, envelope_id in zip(translation_requests, envelope_ids)
+        ]
+        payload = "f.req=" + quote(json.dumps([envelopes], separators=(",", ":")))
 
         headers = self.get_headers()
         headers.update({
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
         })
 
-        response = self.client.post(url, params=params, data=payload, headers=headers)
-        # print(response.text)
+        return {"method": "POST", "url": url, "params": params, "content": payload, "headers": headers}
 
+    def _parse_translate_response(self, response: httpx.Response, translation_request: AnyTranslationRequest) -> TranslationResponse:
+        started = time.perf_counter()
         response = google_text_response_formatter(response.text)
+        if self.metrics is not None:
+            self.metrics.observe(self.engine, "format", time.perf_counter() - started)
 
         try:
-            return TranslationResponse(
+            return self._make_result(
                 text=response["text"],
                 source_language=response["source_language"],
                 target_language=response["target_language"],
@@ -235,49 +1079,129 @@ class GoogleTranslator(BaseTranslator):
         except KeyError:
             raise RateLimitException("Rate limit error!")
 
-    def translate_image(
-        self,
-        image_path: Path,
-        target_language: str,
-        source_language: str = "auto",) -> FileResponse:
-        raise NotImplementedError("Image translation is not implemented yet!")
+    def _parse_batch_response(self, response: httpx.Response, translation_requests: list[AnyTranslationRequest]) -> list:
+        started = time.perf_counter()
         try:
-            file_request = FileRequest(
-                file_path=image_path,
-                source_language=source_language,
-                target_language=target_language,
-            )
-        except ValidationError as e:
-            raise ValueError(f"Invalid input: {e}")
+            results = google_batch_text_response_formatter(response.text)
+        except (ValueError, IndexError, TypeError):
+            raise RateLimitException("Rate limit error!")
+        if self.metrics is not None:
+            self.metrics.observe(self.engine, "format", time.perf_counter() - started)
+        return [
+            self._make_result(**results[str(index + 1)])
+            for index in range(len(translation_requests))
+            if str(index + 1) in results
+        ]
+
+    def _image_content(self, body: "FormBody"):
+        return body
+
+    def _build_image_request(self, image: "ImageData", target_language: str, source_language: str) -> dict:
+        from .images import FormBody
 
         url = "https://translate.google.com/_/TranslateWebserverUi/data/batchexecute"
 
         params = {"rpcids": "WqWDPb"}
 
-        f_req_data = f'[[["WqWDPb", "[[\\"{file_request.file_data_encoded}\\",\\"image/jpeg\\"],\\"{file_request.source_language}\\",\\"{file_request.target_language}\\"]", null, "generic"]]]'
-
-        payload = {
-            'f.req': f_req_data,
-        }
+        # The base64 is streamed in place of the placeholder instead of being built into a string.
+        placeholder = "IMAGEDATA"
+        arguments = json.dumps([[placeholder, image.mime_type], source_language, target_language], separators=(",", ":"))
+        payload = "f.req=" + quote(json.dumps([[["WqWDPb", arguments, None, "generic"]]], separators=(",", ":")), safe="")
+        prefix, _, suffix = payload.partition(placeholder)
+        body = FormBody(prefix, image, suffix)
 
         headers = self.get_headers()
         headers.update({
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
-            # "X-Goog-BatchExecute-Bgr": '[";zNK40orQAAYE3UGHJN1fI9NznCOeFGUmADQBEArZ1C5Mchj3qFijBIVo1JYBSjJDNxZAxhreKoF_Dd4dHOBFVjaLRC75KBOAjZZkvjZwHwAAAfdPAAAAHHUBB2MAQLQLssYzf3Wu0yWZ7Y2P0SmQTnn-x_zhnRfraTk9luQz_kA_2SRKOm2IpB3VlPVXlYE1KHpljaD3yKvzpZC5LIwXAGJbP6dVZiy-MX_Rb5yofs1OVKmxaP174zaEqZwyMo6fia6nrCruTQ4bL0342KMBsb5Er9yr5VxPwkGf_dZwIvkeljFYrDT7mw4OZxv0QvXJoyVxYKmkrjo4j4ujrfgvh0F8JIQCxJF-8EE3IZAwDwNlDSj-fiNR1iPXU_JMNapRSEf9FPf7zv-MMO0e56F49yG4OEYWSCPUh-Sg1tZSh4aOGBmZa7gCPc_-ZTZbnMXqTrhqTUBs4e-tvbq2N-XFA-ocAZHz8pKD0KyTyFUMX8xoajJ_gU48zjg3b3pYGT80_8ZqlY6TVNAQXOyEpwvcIu6FhzD3_ZlzJA9C_hi6zprjQQ0rXKMIraXAH0e5dnts3TN0E3qr1rtLG5c68JKgptcFMvsh-HXrsYSpmLeWsyizkFO0AODYladyCzEnD-_Zrx5Lkkr9ovw7vMIO0P6BnTj_RguubxnH5gWgrNu8ALrcy00yylOjBYyjWZpnYNk4X_OYh0jnMPQHA2z_vggxLb0xZhWjV8hZfBldyojlSUZQMix3c3ibKuoa9nAXF0G42thaWlFJOuT3WCw4NkZ_odHlTvzHSwlid4vGtyjM6HjPcYrTOzN21Z_7I0gwCdjSPFJ_vSbB20wmZXc9VKn8E_QG3XPsCYBEIMVKjZun0orn0jLM6-rdc84LfGA7l-HGAg3E6IL630hMTer6donE5YJ7nNVWYuErqjS35egpG4fiDT-bIsJbfRNSS2JhHu3lREXZjE-LFjacktOCMkvEMp8qNmR3qk3aeOeJOeOxlE_hmB-HqzqM3RZ_CbyafmkTJqRXMtb2Rr76AjAYAMsiO1PS_jnOw3xuTdXgl66Y8rpHN-GlPQcbire7m_xDI85aa1pLSUcQ0cq1_jiYPZxHI3fzzxlwHw_mlMv9dnekVgVyzIijh5jSh9YgS0yKp6hq_0TZr2jJnsrx8TapHQOa43Y3uMRewh1S8IkS2Ht7zxwwqhtL0yb7spSt11kaO800G9FoxAFZLQXwAKy-eW5LBvl-DnN14B1Rci6_e0EFDevbnrq-905L_kclsdWen7OIHo5DlrsrZCPBvQ",null,null,1148,38,null,null,0,"2"]'
-            })
+            "content-length": str(len(body)),
+        })
 
-        response = self.client.post(url, params=params, data=payload, headers=headers)
+        return {"method": "POST", "url": url, "params": params, "content": self._image_content(body), "headers": headers}
 
-        # response = google_file_response_formatter(response.text)
+    def _parse_image_response(self, response: httpx.Response, target_language: str, source_language: str) -> FileResponse:
+        from .images import parse_image_payload
+
+        try:
+            payloads = rpc_payloads(decode_entries(response.text), "WqWDPb")
+        except ValueError:
+            raise RateLimitException("Rate limit error!")
+        if not payloads:
+            raise RateLimitException("Rate limit error!")
+        return FileResponse(**parse_image_payload(next(iter(payloads.values())), source_language, target_language))
 
-        print(response)
+    def _image_call(self, image: "ImageData", target_language: str, source_language: Optional[str]):
+        target_language = target_language.lower()
+        source_language = (source_language or self.auto_language).lower()
+        return (
+            partial(self._build_image_request, image, target_language, source_language),
+            partial(self._parse_image_response, target_language=target_language, source_language=source_language),
+        )
 
-    def translate_document(
+    def translate_image(
+        self,
+        image: Union["ImageSource", "ImageData"],
+        target_language: str,
+        source_language: str = "auto",) -> FileResponse:
+        """Translates the text in an image given as a path, bytes or a memoryview.
+
+        The result holds the rendered image and the recognized text.
+        """
+        from .images import ImageData
+
+        image_data = image if isinstance(image, ImageData) else ImageData(image)
+        try:
+            return self._execute(*self._image_call(image_data, target_language, source_language))
+        finally:
+            if image_data is not image:
+                image_data.close()
+
+    def translate_images(
         self,
-        document: str,
+        images: Union[str, Path, Iterable[Union["ImageSource", "ImageData"]]],
         target_language: str,
-        source_language: str = "auto",) -> TranslationResponse:
-        raise NotImplementedError("Document translation is not implemented yet!")
+        source_language: str = "auto",
+        output_dir: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 4,
+        recursive: bool = False,) -> Iterator[tuple[Any, Union[FileResponse, Exception]]]:
+        """Translates a directory (or any iterable) of images, yielding `(image, result)` as they finish.
+
+        At most `max_concurrency` images are in flight and only a few more are queued, so
+        directories of any size are walked lazily. A failed image yields its exception
+        instead of stopping the others. With `output_dir` every result is saved there too,
+        at the image's path below the input directory.
+        """
+        from .images import image_output_path, iter_image_paths
+
+        root = Path(images) if isinstance(images, (str, Path)) else None
+        if root is not None:
+            images = iter_image_paths(root, recursive)
+        max_concurrency = max(1, max_concurrency)
+
+        def translate(index: int, image):
+            result = self.translate_image(image, target_language, source_language)
+            if output_dir is not None:
+                path = image_output_path(output_dir, image, index, result.mime_type, root)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                result.save(path)
+            return result
+
+        def finished(futures):
+            for future in futures:
+                image = pending.pop(future)
+                error = future.exception()
+                yield image, error if error is not None else future.result()
+
+        self._create_client()
+        pending: dict[Future, Any] = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for index, image in enumerate(images):
+                if len(pending) >= 2 * max_concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished(done)
+                pending[executor.submit(translate, index, image)] = image
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
 
     def translate_text_legacy(
         self,
@@ -306,10 +1230,10 @@ class GoogleTranslator(BaseTranslator):
             "q": translation_request.text,
         }
 
-        response = self.client.get(url, params=params).json()
+        response = self._send({"method": "GET", "url": url, "params": params}).json()
 
         try:
-            return TranslationResponse(
+            return self._make_result(
                 text=response["sentences"][0]["trans"],
                 source_language=response["src"],
                 target_language=translation_request.target_language,
@@ -317,19 +1241,82 @@ class GoogleTranslator(BaseTranslator):
         except KeyError:
             raise RateLimitException("Rate limit error!")
 
-    def detect_language(self, text: str) -> str:
-        return DetectedLanguageResponse(
-            language=self.translate_text(
-                text, source_language="auto", target_language="tr"
-            ).source_language
-        )
+class AsyncBingTranslator(AsyncBaseTranslator, BingTranslator):
+    async def _fetch_session(self) -> "BingSession":
+        from .session import build_session_request, parse_bing_session
 
-    def close(self):
-        self.client.close()
+        response = await self._send(build_session_request())
+        self._record_response(response)
+        return parse_bing_session(response)
+
+    async def _ensure_session(self, refresh: bool = False):
+        self.session = await self.session_manager.get_async(self._fetch_session, refresh=refresh, stale=self.session)
+
+
+class AsyncDeepLTranslator(AsyncBaseTranslator, DeepLTranslator):
+    pass
 
 
-if __name__ == "__main__":
-    with GoogleTranslator() as t:
-        t.translate_image("image.jpg", "tr")
-        # print(t.detect_language("Merhaba Kanka Naber!").json())
-        # print(t.translate_text("Hello Brother!", target_language="tr", source_language="auto-detect").json())
+class AsyncGoogleTranslator(AsyncBaseTranslator, GoogleTranslator):
+    def _image_content(self, body: "FormBody"):
+        return body.__aiter__()
+
+    async def translate_image(
+        self,
+        image: Union["ImageSource", "ImageData"],
+        target_language: str,
+        source_language: str = "auto",) -> FileResponse:
+        from .images import ImageData
+
+        image_data = image if isinstance(image, ImageData) else ImageData(image)
+        try:
+            return await self._execute(*self._image_call(image_data, target_language, source_language))
+        finally:
+            if image_data is not image:
+                image_data.close()
+
+    async def translate_images(
+        self,
+        images: Union[str, Path, Iterable[Union["ImageSource", "ImageData"]]],
+        target_language: str,
+        source_language: str = "auto",
+        output_dir: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 4,
+        recursive: bool = False,) -> AsyncIterator[tuple[Any, Union[FileResponse, Exception]]]:
+        from .images import image_output_path, iter_image_paths
+
+        root = Path(images) if isinstance(images, (str, Path)) else None
+        if root is not None:
+            images = iter_image_paths(root, recursive)
+        max_concurrency = max(1, max_concurrency)
+
+        async def translate(index: int, image):
+            result = await self.translate_image(image, target_language, source_language)
+            if output_dir is not None:
+                path = image_output_path(output_dir, image, index, result.mime_type, root)
+                await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+                await asyncio.to_thread(result.save, path)
+            return result
+
+        pending: dict[asyncio.Task, Any] = {}
+
+        def finished(tasks):
+            for task in tasks:
+                image = pending.pop(task)
+                error = task.exception()
+                yield image, error if error is not None else task.result()
+
+        try:
+            for index, image in enumerate(images):
+                if len(pending) >= max_concurrency:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for item in finished(done):
+                        yield item
+                pending[asyncio.ensure_future(translate(index, image))] = image
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for item in finished(done):
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,17 +1,20 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 import json
 from pathlib import Path
-from tools import base642data, data2base64
+from typing import Optional, Union
+from .tools import base642data, data2base64
+
+MAX_TEXT_LENGTH = 1500
 
 class TranslationRequest(BaseModel):
-    text: str = Field(..., max_length=1500)
+    text: str = Field(..., max_length=MAX_TEXT_LENGTH)
     source_language: str = "auto"
     target_language: str = "en"
 
     @field_validator("text")
     def check_text_length(cls, value):
-        if len(value) > 1500:
-            raise ValueError("Text must not exceed 1500 characters")
+        if len(value) > MAX_TEXT_LENGTH:
+            raise ValueError(f"Text must not exceed {MAX_TEXT_LENGTH} characters")
         return value
 
     @field_validator("source_language", "target_language")
@@ -26,7 +29,13 @@ class TranslationResponse(BaseModel):
     source_language: str
     target_language: str
 
-    @field_validator("text", "source_language", "target_language")
+    @field_validator("text")
+    def validate_text(cls, value):
+        if not isinstance(value, str):
+            raise TypeError("Field must be a string")
+        return value
+
+    @field_validator("source_language", "target_language")
     def validate_fields(cls, value):
         if not isinstance(value, str):
             raise TypeError("Field must be a string")
@@ -42,8 +51,69 @@ class TranslationResponse(BaseModel):
         )
 
 
+class TranslationRequestData:
+    """Unvalidated counterpart of `TranslationRequest` for trusted, high-volume callers."""
+
+    __slots__ = ("text", "source_language", "target_language")
+
+    def __init__(self, text: str, source_language: str = "auto", target_language: str = "en"):
+        self.text = text
+        self.source_language = source_language.lower()
+        self.target_language = target_language.lower()
+
+    def model_copy(self, update: dict) -> "TranslationRequestData":
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(update)
+        return TranslationRequestData(**values)
+
+
+class TranslationResult:
+    """Slotted counterpart of `TranslationResponse` built without pydantic validation.
+
+    Results compare and hash by value, so they can go in sets and be used as keys as
+    long as nobody changes their fields.
+    """
+
+    __slots__ = ("text", "source_language", "target_language")
+
+    def __init__(self, text: str, source_language: str, target_language: str):
+        self.text = text
+        self.source_language = source_language.lower()
+        self.target_language = target_language.lower()
+
+    def model_dump(self) -> dict:
+        return {
+            "text": self.text,
+            "source_language": self.source_language,
+            "target_language": self.target_language,
+        }
+
+    def json(self):
+        return json.dumps(self.model_dump())
+
+    def __eq__(self, other):
+        if not isinstance(other, (TranslationResult, TranslationResponse)):
+            return NotImplemented
+        return (self.text, self.source_language, self.target_language) == (
+            other.text, other.source_language, other.target_language
+        )
+
+    def __hash__(self):
+        return hash((self.text, self.source_language, self.target_language))
+
+    def __repr__(self):
+        return f"TranslationResult(text={self.text!r}, source_language={self.source_language!r}, target_language={self.target_language!r})"
+
+
+# Anything a translator may hand back as a successful translation.
+TRANSLATION_RESULT_TYPES = (TranslationResponse, TranslationResult)
+AnyTranslationRequest = Union[TranslationRequest, TranslationRequestData]
+
+
 class DetectedLanguageResponse(BaseModel):
     language: str
+    # Posterior of a local detection, None when the engine detected the language.
+    confidence: Optional[float] = None
 
     @field_validator("language")
     def validate_language(cls, value):
@@ -52,7 +122,9 @@ class DetectedLanguageResponse(BaseModel):
         return value.lower()
 
     def json(self):
-        return json.dumps({"language": self.language})
+        if self.confidence is None:
+            return json.dumps({"language": self.language})
+        return json.dumps({"language": self.language, "confidence": self.confidence})
 
 
 class FileRequest(TranslationRequest):
@@ -65,21 +137,24 @@ class FileRequest(TranslationRequest):
             raise TypeError("File path must be a Path")
         return value
 
+    _file_data_encoded: Optional[str] = PrivateAttr(default=None)
+
     @property
     def file_data_encoded(self):
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
-    
-        with self.file_path.open("rb") as f:
-            file_data = f.read()
-
-        encoded_data = data2base64(file_data)
-        return encoded_data
+        """Base64 of the file, read and encoded on first access only."""
+        if self._file_data_encoded is None:
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"File not found: {self.file_path}")
+            with self.file_path.open("rb") as f:
+                self._file_data_encoded = data2base64(f.read())
+        return self._file_data_encoded
 
 class FileResponse(BaseModel):
     file: bytes
     source_language: str
     target_language: str
+    mime_type: str = "image/jpeg"
+    text: str = ""
 
     @field_validator("file")
     def validate_file(cls, value):
@@ -96,14 +171,21 @@ class FileResponse(BaseModel):
     def json(self):
         return json.dumps(
             {
-                "file": self.file.decode("utf-8"),
+                "file": data2base64(self.file),
                 "source_language": self.source_language,
                 "target_language": self.target_language,
+                "mime_type": self.mime_type,
+                "text": self.text,
             }
         )
 
-    def save(self):
-        print("saving")
+    def save(self, path: Union[str, Path]) -> Path:
+        """Writes the file to `path`, a directory gets a file named after the mime type."""
+        path = Path(path)
+        if path.is_dir():
+            path = path / f"translated.{self.mime_type.rpartition('/')[2]}"
+        path.write_bytes(self.file)
+        return path
 
 if __name__ == "__main__":
     t = FileRequest(file_path="./mintrans/mintrans.py", source_language="en", target_language="tr")
@@ -0,0 +1,109 @@
+"""Runs the translations of one shared translator on a bounded thread pool.
+
+Translators are safe to share between threads, a pool gives many threads (or a
+web server's request handlers) one translator, one connection pool and one Bing
+session instead of one of each per caller.
+"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Optional
+
+import httpx
+
+from .mintrans import AsyncBaseTranslator, BaseTranslator, GoogleTranslator
+
+
+class TranslatorPool:
+    """Translates on up to `max_workers` threads with one translator, `GoogleTranslator()` by default.
+
+    A translator without a client or shared transport gets one that keeps a pooled
+    connection per worker. The default translator is closed with the pool, a given one
+    stays open. Async translators run on their event loop and are refused.
+    """
+
+    def __init__(self, translator: Optional[BaseTranslator] = None, max_workers: int = 8):
+        if isinstance(translator, AsyncBaseTranslator):
+            raise TypeError("TranslatorPool runs sync translators, await an async translator's methods instead")
+        self.translator = translator if translator is not None else GoogleTranslator()
+        self._owns_translator = translator is None
+        self.max_workers = max(1, max_workers)
+        if isinstance(self.translator, BaseTranslator) and self.translator.client is None and self.translator.transport is None:
+            limits = httpx.Limits(max_connections=None, max_keepalive_connections=max(20, self.max_workers))
+            self.translator.client = httpx.Client(limits=limits)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mintrans")
+
+    def submit(self, text: str, target_language: str, source_language: Optional[str] = None) -> Future:
+        """Queues one translation, the future holds its result."""
+        return self._executor.submit(self.translator.translate_text, text, target_language, source_language)
+
+    def translate_many(
+        self,
+        texts: Iterable[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,) -> Iterator[Any]:
+        """Translates texts on the pool, yielding results in the order of `texts`.
+
+        With `ordered=False` `(index, result)` pairs are yielded as they finish. At most
+        `2 * max_workers` texts are queued ahead, so iterables of any size are read
+        lazily. A failed text raises its exception, or yields it with `return_exceptions`.
+        """
+        def result(future: Future, outstanding: Iterable[Future]):
+            error = future.exception()
+            if error is None:
+                return future.result()
+            if not return_exceptions:
+                for other in outstanding:
+                    other.cancel()
+                raise error
+            return error
+
+        if ordered:
+            queue: deque[Future] = deque()
+            for text in texts:
+                if len(queue) >= 2 * self.max_workers:
+                    yield result(queue.popleft(), queue)
+                queue.append(self.submit(text, target_language, source_language))
+            while queue:
+                yield result(queue.popleft(), queue)
+            return
+
+        pending: dict[Future, int] = {}
+
+        def finished(futures):
+            for future in futures:
+                yield pending.pop(future), result(future, pending)
+
+        for index, text in enumerate(texts):
+            if len(pending) >= 2 * self.max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+            pending[self.submit(text, target_language, source_language)] = index
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finished(done)
+
+    def close(self):
+        """Waits for the queued translations and stops the threads, closes the translator the pool created."""
+        self._executor.shutdown(wait=True)
+        if self._owns_translator:
+            self.translator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def translate_many(
+    texts: Iterable[str],
+    target_language: str,
+    source_language: Optional[str] = None,
+    translator: Optional[BaseTranslator] = None,
+    max_workers: int = 8,
+    ordered: bool = True,) -> list:
+    """Translates texts on a temporary `TranslatorPool`, see `TranslatorPool.translate_many`."""
+    with TranslatorPool(translator, max_workers) as pool:
+        return list(pool.translate_many(texts, target_language, source_language, ordered))
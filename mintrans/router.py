@@ -0,0 +1,363 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Optional
+
+import httpx
+
+from .exceptions import CaptchaException, EngineUnavailableException, RateLimitException
+from .mintrans import (
+    AsyncBingTranslator,
+    AsyncDeepLTranslator,
+    AsyncGoogleTranslator,
+    BaseTranslator,
+    BingTranslator,
+    DeepLTranslator,
+    GoogleTranslator,
+)
+from .models import TRANSLATION_RESULT_TYPES, DetectedLanguageResponse, TranslationResponse
+
+# Errors after which the router moves on to the next engine, requests are validated before
+# dispatching so a ValueError here comes from a payload the engine could not parse.
+FAILOVER_EXCEPTIONS = (RateLimitException, CaptchaException, httpx.HTTPError, KeyError, IndexError, ValueError)
+# Routing weight of an engine whose error rate reached 1, it can still be picked.
+MIN_WEIGHT = 1e-6
+
+
+class TranslationBatch(list):
+    """Results of one `translate_batch` call, checked as a whole by the router."""
+
+
+class EngineHealth:
+    """Rolling latency and error statistics of one engine."""
+
+    def __init__(
+        self,
+        window: int = 100,
+        initial_latency: float = 0.5,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        decay: float = 0.2,):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.initial_latency = initial_latency
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.decay = decay
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self.latencies.append(latency)
+            self.error_rate *= 1 - self.decay
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.error_rate = self.error_rate * (1 - self.decay) + self.decay
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self.cooldown_until = time.monotonic() + self.cooldown
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.cooldown_until
+
+    def percentile(self, fraction: float) -> float:
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return self.initial_latency
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def score(self) -> float:
+        """Higher is better, favours fast engines that rarely fail."""
+        return (1 - self.error_rate) ** 2 / max(self.percentile(0.5), 1e-3)
+
+    def __repr__(self):
+        return f"EngineHealth(p50={self.percentile(0.5):.3f}, p95={self.p95:.3f}, error_rate={self.error_rate:.2f}, available={self.available})"
+
+
+class BaseRouterTranslator:
+    def __init__(
+        self,
+        translators: list[BaseTranslator],
+        hedge: bool = False,
+        hedge_delay: Optional[float] = None,):
+        if not translators:
+            raise ValueError("At least one translator is required")
+        self.translators = translators
+        # By translator, two translators of one engine (e.g. behind different proxies) fail on their own.
+        self.health = {translator: EngineHealth() for translator in translators}
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+
+    def _route(self) -> list[BaseTranslator]:
+        """Returns the engines to try, the first one is picked at random weighted by health."""
+        healthy = [translator for translator in self.translators if self.health[translator].available]
+        if not healthy:
+            # Everything is cooling down, try the least bad engines anyway.
+            healthy = list(self.translators)
+        weights = [max(self.health[translator].score, MIN_WEIGHT) for translator in healthy]
+        first = random.choices(healthy, weights=weights)[0]
+        rest = sorted(
+            (translator for translator in healthy if translator is not first),
+            key=lambda translator: self.health[translator].score,
+            reverse=True,
+        )
+        return [first] + rest
+
+    def _hedge_delay(self, translator: BaseTranslator) -> float:
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        return self.health[translator].p95
+
+    @staticmethod
+    def _source_language(source_language: Optional[str]) -> Optional[str]:
+        # Every engine spells auto detection its own way, None lets them pick.
+        if source_language in ("auto", "auto-detect"):
+            return None
+        return source_language
+
+    def _validate(self, texts: Iterable[str], target_languages: Iterable[str], source_language: Optional[str] = None):
+        """Raises ValueError for a bad request once, instead of counting it against every engine."""
+        translator = self.translators[0]
+        for text in texts:
+            for target_language in target_languages:
+                translator._validate_request(text, target_language, source_language)
+
+    @staticmethod
+    def _check_result(result: Any):
+        if not isinstance(result, (*TRANSLATION_RESULT_TYPES, DetectedLanguageResponse, TranslationBatch)):
+            raise ValueError(f"Unexpected response: {result}")
+        return result
+
+
+class RouterTranslator(BaseRouterTranslator):
+    """Spreads translations over several engines by health, failing over and optionally hedging.
+
+    With `hedge=True` a duplicate request goes to the next engine when the first one
+    has not answered within its p95 latency (or `hedge_delay`), the first answer wins.
+    """
+
+    def __init__(
+        self,
+        translators: Optional[list[BaseTranslator]] = None,
+        hedge: bool = False,
+        hedge_delay: Optional[float] = None,):
+        super().__init__(
+            translators if translators is not None else [GoogleTranslator(), BingTranslator(), DeepLTranslator()],
+            hedge,
+            hedge_delay,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=2 * len(self.translators)) if hedge else None
+
+    def close(self):
+        for translator in self.translators:
+            translator.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _call(self, translator: BaseTranslator, call: Callable[[BaseTranslator], Any]):
+        health = self.health[translator]
+        started = time.monotonic()
+        try:
+            result = self._check_result(call(translator))
+        except FAILOVER_EXCEPTIONS:
+            health.record_failure()
+            raise
+        health.record_success(time.monotonic() - started)
+        return result
+
+    def _dispatch(self, call: Callable[[BaseTranslator], Any]):
+        engines = self._route()
+        errors = []
+        if not self.hedge:
+            for translator in engines:
+                try:
+                    return self._call(translator, call)
+                except FAILOVER_EXCEPTIONS as e:
+                    errors.append(e)
+            raise EngineUnavailableException(f"All engines failed: {errors}")
+
+        pending = {}
+        while engines or pending:
+            if engines and len(pending) < 2:
+                translator = engines.pop(0)
+                pending[self._executor.submit(self._call, translator, call)] = translator
+            timeout = self._hedge_delay(translator) if engines and len(pending) < 2 else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                try:
+                    result = future.result()
+                except FAILOVER_EXCEPTIONS as e:
+                    errors.append(e)
+                    continue
+                for other in pending:
+                    other.cancel()
+                return result
+        raise EngineUnavailableException(f"All engines failed: {errors}")
+
+    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResponse:
+        source_language = self._source_language(source_language)
+        self._validate([text], [target_language], source_language)
+        return self._dispatch(lambda translator: translator.translate_text(text, target_language, source_language))
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResponse]:
+        source_language = self._source_language(source_language)
+        self._validate(texts, [target_language], source_language)
+
+        def call(translator: BaseTranslator):
+            results = translator.translate_batch(texts, target_language, source_language)
+            for result in results:
+                self._check_result(result)
+            return TranslationBatch(results)
+
+        return list(self._dispatch(call))
+
+    def translate_to_many(self, text: str, target_languages: Iterable[str], source_language: Optional[str] = None) -> dict[str, TranslationResponse]:
+        source_language = self._source_language(source_language)
+        target_languages = list(dict.fromkeys(target_languages))
+        self._validate([text], target_languages, source_language)
+
+        def call(translator: BaseTranslator):
+            results = translator.translate_to_many(text, target_languages, source_language)
+            for result in results.values():
+                self._check_result(result)
+            return TranslationBatch(results[target_language] for target_language in target_languages)
+
+        return dict(zip(target_languages, self._dispatch(call)))
+
+    def detect_language(self, text: str) -> DetectedLanguageResponse:
+        self._validate([text], ["tr"])
+        return self._dispatch(lambda translator: translator.detect_language(text))
+
+    def detect_languages(self, texts: list[str]) -> list[DetectedLanguageResponse]:
+        self._validate(texts, ["tr"])
+
+        def call(translator: BaseTranslator):
+            results = translator.detect_languages(texts)
+            for result in results:
+                self._check_result(result)
+            return TranslationBatch(results)
+
+        return list(self._dispatch(call))
+
+
+class AsyncRouterTranslator(BaseRouterTranslator):
+    """Asyncio flavour of `RouterTranslator`."""
+
+    def __init__(
+        self,
+        translators: Optional[list[BaseTranslator]] = None,
+        hedge: bool = False,
+        hedge_delay: Optional[float] = None,):
+        super().__init__(
+            translators if translators is not None else [AsyncGoogleTranslator(), AsyncBingTranslator(), AsyncDeepLTranslator()],
+            hedge,
+            hedge_delay,
+        )
+
+    async def aclose(self):
+        for translator in self.translators:
+            await translator.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _call(self, translator: BaseTranslator, call: Callable[[BaseTranslator], Any]):
+        health = self.health[translator]
+        started = time.monotonic()
+        try:
+            result = self._check_result(await call(translator))
+        except FAILOVER_EXCEPTIONS:
+            health.record_failure()
+            raise
+        health.record_success(time.monotonic() - started)
+        return result
+
+    async def _dispatch(self, call: Callable[[BaseTranslator], Any]):
+        engines = self._route()
+        errors = []
+        pending = {}
+        try:
+            while engines or pending:
+                hedging = self.hedge or not pending
+                if engines and hedging and len(pending) < 2:
+                    translator = engines.pop(0)
+                    pending[asyncio.ensure_future(self._call(translator, call))] = translator
+                can_hedge = self.hedge and engines and len(pending) < 2
+                timeout = self._hedge_delay(translator) if can_hedge else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del pending[task]
+                    try:
+                        return task.result()
+                    except FAILOVER_EXCEPTIONS as e:
+                        errors.append(e)
+        finally:
+            for task in pending:
+                task.cancel()
+        raise EngineUnavailableException(f"All engines failed: {errors}")
+
+    async def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResponse:
+        source_language = self._source_language(source_language)
+        self._validate([text], [target_language], source_language)
+        return await self._dispatch(lambda translator: translator.translate_text(text, target_language, source_language))
+
+    async def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResponse]:
+        source_language = self._source_language(source_language)
+
+        async def call(translator: BaseTranslator):
+            results = await translator.translate_batch(texts, target_language, source_language)
+            for result in results:
+                self._check_result(result)
+            return TranslationBatch(results)
+
+        return list(await self._dispatch(call))
+
+    async def translate_to_many(self, text: str, target_languages: Iterable[str], source_language: Optional[str] = None) -> dict[str, TranslationResponse]:
+        source_language = self._source_language(source_language)
+        target_languages = list(dict.fromkeys(target_languages))
+        self._validate([text], target_languages, source_language)
+
+        async def call(translator: BaseTranslator):
+            results = await translator.translate_to_many(text, target_languages, source_language)
+            for result in results.values():
+                self._check_result(result)
+            return TranslationBatch(results[target_language] for target_language in target_languages)
+
+        return dict(zip(target_languages, await self._dispatch(call)))
+
+    async def detect_language(self, text: str) -> DetectedLanguageResponse:
+        self._validate([text], ["tr"])
+        return await self._dispatch(lambda translator: translator.detect_language(text))
+
+    async def detect_languages(self, texts: list[str]) -> list[DetectedLanguageResponse]:
+        async def call(translator: BaseTranslator):
+            results = await translator.detect_languages(texts)
+            for result in results:
+                self._check_result(result)
+            return TranslationBatch(results)
+
+        return list(await self._dispatch(call))
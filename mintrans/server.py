@@ -0,0 +1,440 @@
+"""Local translation server that batches the single translations of many processes.
+
+Clients send one text per request (HTTP/JSON over localhost or a Unix socket). Texts for
+the same engine and language pair that arrive within `window` seconds are translated
+with one `translate_batch` call of a shared async translator, so its session, rate
+budget and cache serve every client. `TranslationClient` has the `translate_text`
+interface of the translators.
+
+    python -m mintrans.server --engines google bing --window-ms 10 --unix /tmp/mintrans.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+from collections import Counter
+from http import HTTPStatus
+from typing import Optional
+
+import httpx
+
+from .exceptions import CaptchaException, EngineUnavailableException, RateLimitException
+from .models import TRANSLATION_RESULT_TYPES, TranslationResult
+
+DEFAULT_PORT = 8765
+MAX_BODY_SIZE = 16 * 1024 * 1024
+ENGINES = ("google", "bing", "deepl")
+_CLIENT_ERRORS = {"RateLimitException": RateLimitException, "CaptchaException": CaptchaException}
+
+
+class _Batch:
+    __slots__ = ("futures", "requests", "timer")
+
+    def __init__(self):
+        # One future per distinct text, callers sending the same text share it.
+        self.futures: dict[str, asyncio.Future] = {}
+        self.requests = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """Groups texts by engine and language pair for `window` seconds, then translates each group at once.
+
+    A group is sent early once it holds `max_batch` distinct texts. The translators are
+    async ones and are only used from the loop the batcher runs on.
+    """
+
+    def __init__(self, translators: dict, window: float = 0.01, max_batch: int = 128):
+        self.translators = translators
+        self.window = window
+        self.max_batch = max_batch
+        self.stats: dict[str, Counter] = {engine: Counter() for engine in translators}
+        self._pending: dict[tuple[str, str, str], _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def translate(self, engine: str, text: str, target_language: str, source_language: Optional[str] = None):
+        translator = self.translators.get(engine)
+        if translator is None:
+            raise ValueError(f"Invalid input: unknown engine {engine!r}")
+        translation_request = translator._validate_request(text, target_language, source_language)
+        key = (engine, translation_request.source_language, translation_request.target_language)
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch()
+            batch.timer = loop.call_later(self.window, self._flush, key, batch)
+        future = batch.futures.get(text)
+        if future is None:
+            future = batch.futures[text] = loop.create_future()
+        batch.requests += 1
+        if len(batch.futures) >= self.max_batch:
+            batch.timer.cancel()
+            self._flush(key, batch)
+        # A caller that goes away must not cancel the result the others wait for.
+        return await asyncio.shield(future)
+
+    def _flush(self, key: tuple[str, str, str], batch: _Batch):
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        task = asyncio.ensure_future(self._send(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: tuple[str, str, str], batch: _Batch):
+        engine, source_language, target_language = key
+        texts = list(batch.futures)
+        stats = self.stats[engine]
+        stats["requests"] += batch.requests
+        stats["batches"] += 1
+        stats["texts"] += len(texts)
+        try:
+            results = await self.translators[engine].translate_batch(texts, target_language, source_language)
+        except Exception as e:
+            stats["errors"] += 1
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Retrieved here, every caller of the text may have gone away.
+                    future.exception()
+            return
+        for text, result in zip(texts, results):
+            future = batch.futures[text]
+            if not future.done():
+                future.set_result(result)
+
+    async def drain(self):
+        """Sends the open groups now and waits for every group in flight."""
+        for key, batch in list(self._pending.items()):
+            batch.timer.cancel()
+            self._flush(key, batch)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def _error_payload(error: Exception) -> tuple[int, dict]:
+    if isinstance(error, ValueError):
+        return HTTPStatus.BAD_REQUEST, {"error": "ValueError", "message": str(error)}
+    payload = {"error": type(error).__name__, "message": str(error)}
+    if isinstance(error, RateLimitException):
+        payload["retry_after"] = error.retry_after
+        return HTTPStatus.TOO_MANY_REQUESTS, payload
+    return HTTPStatus.BAD_GATEWAY, payload
+
+
+def _result_payload(result) -> dict:
+    if isinstance(result, TRANSLATION_RESULT_TYPES):
+        return result.model_dump()
+    # Engine error payloads, e.g. Bing's statusCode dict, are passed on as they are.
+    raise EngineUnavailableException(json.dumps(result, ensure_ascii=False))
+
+
+class TranslationServer:
+    """Serves the translators of `engines` (or the given async `translators`) to local clients.
+
+    Listens on `host`:`port`, or on the Unix socket `path` when it is given. `run()`
+    blocks, `start()` serves from a background thread until `stop()`. The translators
+    are closed when the server stops.
+    """
+
+    def __init__(
+        self,
+        translators: Optional[dict] = None,
+        engines: tuple[str, ...] = ("google",),
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        path: Optional[str] = None,
+        window: float = 0.01,
+        max_batch: int = 128,):
+        self.translators = dict(translators) if translators is not None else _create_translators(engines)
+        self.batcher = MicroBatcher(self.translators, window, max_batch)
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> tuple[int, dict]:
+        if method == "GET" and target == "/stats":
+            return HTTPStatus.OK, {engine: dict(stats) for engine, stats in self.batcher.stats.items()}
+        if method != "POST" or target not in ("/translate", "/translate_batch"):
+            return HTTPStatus.NOT_FOUND, {"error": "NotFound", "message": f"{method} {target}"}
+        try:
+            request = json.loads(body)
+            engine = request.get("engine") or next(iter(self.translators))
+            target_language, source_language = request["target_language"], request.get("source_language")
+            if target == "/translate":
+                result = await self.batcher.translate(engine, request["text"], target_language, source_language)
+                return HTTPStatus.OK, _result_payload(result)
+            results = await asyncio.gather(*[
+                self.batcher.translate(engine, text, target_language, source_language) for text in request["texts"]
+            ])
+            return HTTPStatus.OK, {"results": [_result_payload(result) for result in results]}
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            return HTTPStatus.BAD_REQUEST, {"error": "ValueError", "message": f"Invalid request: {e!r}"}
+        except Exception as e:
+            return _error_payload(e)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.1 with keep-alive, enough for the JSON requests of the clients."""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_SIZE:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "ValueError", "message": "Request body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    status, payload = await self._dispatch(method, target.split("?", 1)[0], body)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                head = (
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def start_serving(self):
+        """Binds the socket, `port` holds the bound port afterwards."""
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path, backlog=1024)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve(self):
+        """Serves until `stop()`, then sends the open groups and closes the translators."""
+        await self.start_serving()
+        self._ready.set()
+        try:
+            await self._stopping.wait()
+        finally:
+            self._server.close()
+            await self.batcher.drain()
+            # Idle keep-alive connections see the end of their stream and return.
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            for translator in self.translators.values():
+                await translator.aclose()
+            if self.path is not None and os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def run(self):
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
+    def _serve_in_thread(self):
+        try:
+            asyncio.run(self.serve())
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._ready.set()
+
+    def start(self) -> "TranslationServer":
+        self._error = None
+        self._thread = threading.Thread(target=self._serve_in_thread, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+class TranslationClient:
+    """Translates through a `TranslationServer` with the interface of the translators.
+
+    `path` connects to the server's Unix socket instead of `url`.
+    """
+
+    def __init__(
+        self,
+        url: str = f"http://127.0.0.1:{DEFAULT_PORT}",
+        path: Optional[str] = None,
+        engine: Optional[str] = None,
+        timeout: float = 60.0,):
+        self.url = url if path is None else "http://mintrans"
+        self.path = path
+        self.engine = engine
+        self.timeout = timeout
+        self.client = None
+
+    def _create_client(self):
+        if not self.client:
+            transport = httpx.HTTPTransport(uds=self.path) if self.path else None
+            self.client = httpx.Client(base_url=self.url, transport=transport, timeout=self.timeout)
+        return self.client
+
+    def close(self):
+        if self.client:
+            self.client.close()
+            self.client = None
+
+    def __enter__(self):
+        self._create_client()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _payload(self, target_language: str, source_language: Optional[str], **fields) -> dict:
+        return {"engine": self.engine, "target_language": target_language, "source_language": source_language, **fields}
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> dict:
+        payload = response.json()
+        if response.status_code == HTTPStatus.OK:
+            return payload
+        message = payload.get("message", response.reason_phrase)
+        if response.status_code == HTTPStatus.BAD_REQUEST:
+            raise ValueError(message)
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            raise RateLimitException(message, payload.get("retry_after"))
+        raise _CLIENT_ERRORS.get(payload.get("error"), EngineUnavailableException)(message)
+
+    @staticmethod
+    def _result(payload: dict) -> TranslationResult:
+        return TranslationResult(payload["text"], payload["source_language"], payload["target_language"])
+
+    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResult:
+        response = self._create_client().post("/translate", json=self._payload(target_language, source_language, text=text))
+        return self._result(self._parse(response))
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResult]:
+        response = self._create_client().post("/translate_batch", json=self._payload(target_language, source_language, texts=texts))
+        return [self._result(payload) for payload in self._parse(response)["results"]]
+
+    def stats(self) -> dict:
+        return self._parse(self._create_client().get("/stats"))
+
+
+class AsyncTranslationClient(TranslationClient):
+    """Asyncio flavour of `TranslationClient`."""
+
+    def _create_client(self):
+        if not self.client:
+            transport = httpx.AsyncHTTPTransport(uds=self.path) if self.path else None
+            self.client = httpx.AsyncClient(base_url=self.url, transport=transport, timeout=self.timeout)
+        return self.client
+
+    async def aclose(self):
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def __aenter__(self):
+        self._create_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResult:
+        response = await self._create_client().post("/translate", json=self._payload(target_language, source_language, text=text))
+        return self._result(self._parse(response))
+
+    async def translate_batch(self, texts: list[str], target_language: str, source_language: Optional[str] = None) -> list[TranslationResult]:
+        response = await self._create_client().post("/translate_batch", json=self._payload(target_language, source_language, texts=texts))
+        return [self._result(payload) for payload in self._parse(response)["results"]]
+
+    async def stats(self) -> dict:
+        return self._parse(await self._create_client().get("/stats"))
+
+
+def _create_translators(
+    engines: tuple[str, ...],
+    rate: Optional[float] = None,
+    burst: int = 1,
+    cache_path: Optional[str] = None,
+    memory_path: Optional[str] = None,) -> dict:
+    from .cache import SQLiteCache
+    from .memory import TranslationMemory
+    from .mintrans import AsyncBingTranslator, AsyncDeepLTranslator, AsyncGoogleTranslator
+    from .ratelimit import TokenBucket
+
+    classes = {"google": AsyncGoogleTranslator, "bing": AsyncBingTranslator, "deepl": AsyncDeepLTranslator}
+    cache = SQLiteCache(cache_path) if cache_path else None
+    memory = TranslationMemory(memory_path) if memory_path else None
+    return {
+        engine: classes[engine](cache=cache, memory=memory, rate_limiter=TokenBucket(rate, burst) if rate else None)
+        for engine in engines
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mintrans-server", description="Serve batched translations to local clients.")
+    parser.add_argument("-e", "--engines", nargs="+", choices=ENGINES, default=["google"], help="the first one is the default")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, help="Unix socket path, replaces host and port")
+    parser.add_argument("--window-ms", type=float, default=10.0, help="how long texts are collected before a batch is sent")
+    parser.add_argument("--max-batch", type=int, default=128, help="distinct texts that send a batch early")
+    parser.add_argument("--rate", type=float, default=None, help="requests per second per engine")
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--cache", default=None, help="SQLite cache file")
+    parser.add_argument("--memory", default=None, help="translation memory file to reuse translations from")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    translators = _create_translators(tuple(args.engines), args.rate, args.burst, args.cache, args.memory)
+    server = TranslationServer(
+        translators,
+        host=args.host,
+        port=args.port,
+        path=args.unix,
+        window=args.window_ms / 1000,
+        max_batch=args.max_batch,
+    )
+    server.run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import os
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, Union
+
+import httpx
+
+from .constants import user_agents
+from .exceptions import CaptchaException
+from .singleflight import AsyncSingleFlight
+from .transport import SharedTransport
+
+BING_TRANSLATOR_URL = "https://www.bing.com/translator"
+# Used when the page does not say how long the token lives (it is usually an hour).
+DEFAULT_TOKEN_LIFETIME = 3600.0
+
+
+class BingSession:
+    """Key, token and IG of a Bing translator page, with the time they expire at."""
+
+    def __init__(
+        self,
+        key: Optional[str],
+        token: Optional[str],
+        ig: Optional[str],
+        expires_at: float,
+        user_agent: Optional[str] = None,
+        cookie: Optional[str] = None,):
+        self.key = key
+        self.token = token
+        self.ig = ig
+        self.expires_at = expires_at
+        self.user_agent = user_agent
+        self.cookie = cookie
+
+    def expires_in(self) -> float:
+        return self.expires_at - time.time()
+
+    def is_complete(self) -> bool:
+        return bool(self.key and self.token and self.ig)
+
+    def is_fresh(self, margin: float = 0.0) -> bool:
+        return self.expires_in() > margin
+
+    def headers(self) -> dict[str, str]:
+        headers = {"Referer": BING_TRANSLATOR_URL}
+        if self.user_agent:
+            headers["user-agent"] = self.user_agent
+        if self.cookie:
+            headers["cookie"] = self.cookie
+        return headers
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "token": self.token,
+            "ig": self.ig,
+            "expires_at": self.expires_at,
+            "user_agent": self.user_agent,
+            "cookie": self.cookie,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BingSession":
+        return cls(**data)
+
+    def __repr__(self):
+        return f"BingSession(ig={self.ig!r}, expires_in={self.expires_in():.0f}s)"
+
+
+def build_session_request() -> dict:
+    return {
+        "method": "GET",
+        "url": BING_TRANSLATOR_URL,
+        "headers": {"user-agent": random.choice(user_agents), "Referer": BING_TRANSLATOR_URL},
+    }
+
+
+def parse_bing_session(response: httpx.Response) -> BingSession:
+    """Pulls `params_AbusePreventionHelper` and `IG` out of the translator page.
+
+    A page without them (a captcha, a changed layout) raises `CaptchaException`.
+    """
+    content = response.text
+    key = token = ig = None
+    lifetime = DEFAULT_TOKEN_LIFETIME
+    match = re.search(r"params_AbusePreventionHelper\s*=\s*(\[.*?\]);", content, re.DOTALL)
+    if match:
+        params = [p.strip().strip("\"") for p in match.group(1).strip("[]").split(",")]
+        key, token = params[0], params[1]
+        if len(params) > 2 and params[2].isdigit():
+            # The third field is the token lifetime in milliseconds.
+            lifetime = int(params[2]) / 1000
+    match = re.search(r'IG:"(\w+)"', content)
+    if match:
+        ig = match.group(1)
+    if not (key and token and ig):
+        raise CaptchaException("Bing returned a translator page without key, token or IG!")
+    cookie = "; ".join(f"{name}={value}" for name, value in response.cookies.items()) or None
+    return BingSession(
+        key=key,
+        token=token,
+        ig=ig,
+        expires_at=time.time() + lifetime,
+        user_agent=response.request.headers.get("user-agent"),
+        cookie=cookie,
+    )
+
+
+class BingSessionManager:
+    """Keeps one Bing session fresh for any number of translators.
+
+    Sessions are refreshed `refresh_margin` seconds before they expire, either on the
+    next call or by a background timer with `background_refresh=True`. With `store_path`
+    the session is also written to a JSON file so other processes can pick it up.
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = 60.0,
+        store_path: Optional[Union[str, Path]] = None,
+        transport: Optional[SharedTransport] = None,
+        background_refresh: bool = False,):
+        self.refresh_margin = refresh_margin
+        self.store_path = Path(store_path) if store_path else None
+        self.transport = transport
+        self.background_refresh = background_refresh
+        self.session: Optional[BingSession] = None
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        # Coroutines that all find the session stale wait for one download.
+        self._async_fetch = AsyncSingleFlight()
+
+    def fetch(self) -> BingSession:
+        """Downloads a new session with the manager's own client."""
+        request = build_session_request()
+        if self.transport is not None:
+            response = self.transport.send(request)
+        else:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client()
+            response = self._client.request(**request)
+        return parse_bing_session(response)
+
+    def _usable(self, session: Optional[BingSession], refresh: bool, stale: Optional[BingSession]) -> bool:
+        if session is None or not session.is_complete() or not session.is_fresh(self.refresh_margin):
+            return False
+        # A refresh is only needed when the caller still holds the session that failed.
+        return not refresh or (stale is not None and session.token != stale.token)
+
+    def _current(self, refresh: bool, stale: Optional[BingSession]) -> Optional[BingSession]:
+        if self._usable(self.session, refresh, stale):
+            return self.session
+        stored = self._load()
+        if self._usable(stored, refresh, stale):
+            self.session = stored
+            return stored
+        return None
+
+    def _store(self, session: BingSession):
+        if not session.is_complete():
+            raise CaptchaException("Bing session without key, token or IG!")
+        self.session = session
+        self._save(session)
+        self._schedule()
+
+    def get(
+        self,
+        fetch: Optional[Callable[[], BingSession]] = None,
+        refresh: bool = False,
+        stale: Optional[BingSession] = None,) -> BingSession:
+        """Returns a fresh session, downloading one with `fetch` (or `self.fetch`) when needed.
+
+        `refresh=True` forces a new session unless another caller already replaced `stale`.
+        """
+        session = self.session
+        if not refresh and session is not None and session.is_fresh(self.refresh_margin):
+            return session
+        with self._lock:
+            session = self._current(refresh, stale)
+            if session is None:
+                session = (fetch or self.fetch)()
+                self._store(session)
+            return session
+
+    async def get_async(
+        self,
+        fetch: Optional[Callable[[], Awaitable[BingSession]]] = None,
+        refresh: bool = False,
+        stale: Optional[BingSession] = None,) -> BingSession:
+        session = self.session
+        if not refresh and session is not None and session.is_fresh(self.refresh_margin):
+            return session
+        with self._lock:
+            session = self._current(refresh, stale)
+        if session is not None:
+            return session
+        if fetch is None:
+            return await asyncio.to_thread(self.get, None, refresh, stale)
+
+        async def fetch_and_store() -> BingSession:
+            session = await fetch()
+            with self._lock:
+                self._store(session)
+            return session
+
+        session, _ = await self._async_fetch.do("session", fetch_and_store)
+        return session
+
+    def _load(self) -> Optional[BingSession]:
+        if self.store_path is None or not self.store_path.exists():
+            return None
+        try:
+            return BingSession.from_dict(json.loads(self.store_path.read_text(encoding="utf-8")))
+        except (ValueError, TypeError, OSError):
+            return None
+
+    def _save(self, session: BingSession):
+        if self.store_path is None:
+            return
+        temporary_path = self.store_path.with_name(f"{self.store_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(session.to_dict()), encoding="utf-8")
+        os.replace(temporary_path, self.store_path)
+
+    def _schedule(self, delay: Optional[float] = None):
+        if not self.background_refresh or self._closed:
+            return
+        if delay is None:
+            delay = max(1.0, self.session.expires_in() - self.refresh_margin - 1.0)
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self):
+        try:
+            with self._lock:
+                stored = self._load()
+                if stored is not None and stored.is_complete() and stored.is_fresh(2 * self.refresh_margin):
+                    # Another process refreshed already.
+                    self.session = stored
+                    self._schedule()
+                    return
+                self._store(self.fetch())
+        except (httpx.HTTPError, OSError, CaptchaException):
+            self._schedule(delay=30.0)
+
+    def close(self):
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -0,0 +1,70 @@
+"""In-flight deduplication of identical calls.
+
+While a call for a key runs, other callers with the same key wait for it and get its
+result (or its exception) instead of starting their own.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Single-flight for threads sharing one translator."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> tuple[Any, bool]:
+        """Returns the result of `function` and whether it came from another caller's call."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(), True
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def __len__(self):
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Single-flight for coroutines, calls of different event loops are kept apart.
+
+    The shared call runs as a task of its own, so a waiter that is cancelled leaves it
+    running for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        key = (asyncio.get_running_loop(), key)
+        task = self._calls.get(key)
+        shared = task is not None
+        if not shared:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda task: self._finished(key, task))
+        return await asyncio.shield(task), shared
+
+    def _finished(self, key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task):
+        del self._calls[key]
+        # Marks the exception retrieved, every waiter may have been cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self):
+        return len(self._calls)
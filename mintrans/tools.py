@@ -1,25 +1,101 @@
-from urllib.parse import unquote
-import json
 import base64
+import re
+
+from .batchexecute import decode_entries, parse_translation, rpc_payloads
+
+# Boundaries tried in order when a text is too long, from paragraphs down to words.
+TEXT_BOUNDARIES = [
+    re.compile(r"\n[ \t]*\n\s*"),
+    re.compile(r"\n\s*"),
+    re.compile(r"(?<=[.!?;:\u3002\uff01\uff1f])\s+"),
+    re.compile(r"\s+"),
+]
 
 def google_text_response_formatter(data: str) -> dict[str, str]:
-    cleaned_data = json.loads(unquote(data)[5:].strip())
-    cleaned_data = json.loads(cleaned_data[0][2])[1]
-    # Some magic happens here for extracting the data we need
-    source_language = cleaned_data[3]
-    target_language = cleaned_data[1]
-    translated_text = cleaned_data[0][0][5][0][0]
-
-    return {
-        "text": translated_text,
-        "target_language": target_language,
-        "source_language": source_language,
-    }
-
-def google_file_response_formatter(data: str) -> dict[str, str]:
-    cleaned_data = json.loads(unquote(data)[5:].strip().replace('"[["', '[["').replace('"]]"', '"]]'))
-    cleaned_data = cleaned_data[0]
-    return cleaned_data
+    """Returns the first MkEWBc result of a batchexecute response, or an empty dict when there is none."""
+    for payload in rpc_payloads(decode_entries(data), "MkEWBc").values():
+        return parse_translation(payload) or {}
+    return {}
+
+def google_batch_text_response_formatter(data: str) -> dict[str, dict[str, str]]:
+    """Returns the MkEWBc results of a batchexecute response keyed by their envelope id."""
+    results = {}
+    for envelope_id, payload in rpc_payloads(decode_entries(data), "MkEWBc").items():
+        result = parse_translation(payload)
+        if result is not None:
+            results[envelope_id] = result
+    return results
+
+def pack_batches(lengths: list[int], char_limit: int, size_limit: int, separator_length: int = 0) -> list[list[int]]:
+    """Groups indexes so every group stays under `char_limit` characters and `size_limit` items.
+
+    Items that are longer than the limit on their own get a group of their own.
+    """
+    batches = []
+    batch, batch_length = [], 0
+    for index, length in enumerate(lengths):
+        extra = length + (separator_length if batch else 0)
+        if batch and (batch_length + extra > char_limit or len(batch) >= size_limit):
+            batches.append(batch)
+            batch, batch_length, extra = [], 0, length
+        batch.append(index)
+        batch_length += extra
+    if batch:
+        batches.append(batch)
+    return batches
+
+def split_text(text: str, limit: int) -> list[str]:
+    """Splits a text into chunks of at most `limit` characters at the widest boundary possible.
+
+    Whitespace stays attached to the chunks so `"".join(chunks) == text`.
+    """
+    if not text:
+        return []
+    return _split_text(text, limit, 0)
+
+def _split_text(text: str, limit: int, level: int) -> list[str]:
+    if len(text) <= limit:
+        return [text]
+    if level == len(TEXT_BOUNDARIES):
+        return [text[index:index + limit] for index in range(0, len(text), limit)]
+
+    pieces, start = [], 0
+    for match in TEXT_BOUNDARIES[level].finditer(text):
+        if match.end() > start:
+            pieces.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+
+    chunks, current = [], ""
+    for piece in pieces:
+        if len(piece) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(_split_text(piece, limit, level + 1))
+        elif len(current) + len(piece) > limit:
+            chunks.append(current)
+            current = piece
+        else:
+            current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def strip_chunk(chunk: str) -> tuple[str, str, str]:
+    """Returns the leading whitespace, the content and the trailing whitespace of a chunk."""
+    content = chunk.strip()
+    if not content:
+        return chunk, "", ""
+    start = chunk.index(content)
+    return chunk[:start], content, chunk[start + len(content):]
+
+def google_file_response_formatter(data: str) -> list:
+    """Returns the decoded payload of the first WqWDPb (image) result of a batchexecute response."""
+    for payload in rpc_payloads(decode_entries(data), "WqWDPb").values():
+        return payload
+    raise ValueError("No WqWDPb result in the response")
 
 def data2base64(data: bytes) -> str:
     """Binary veriyi base64 url-safe olarak encode eder."""
@@ -28,21 +104,3 @@ def data2base64(data: bytes) -> str:
 def base642data(data: str) -> bytes:
     """base64 url-safe olarak encode edilmiş veriyi binary veriye decode eder."""
     return base64.b64decode(data.encode("utf-8"))
-
-if __name__ == "__main__":
-    from constants import data_encoded, response_image_text
-    # print(response_formatter(html_text1))
-    for index, i in enumerate(google_file_response_formatter(response_image_text)):
-        print(f"{index}) {i}")
-
-    # print(google_file_response_formatter(response_image_text))
-    # with open("image.png", "wb") as f:
-    #     f.write(base642data(data=data_encoded))
-    
-    # with open("image.png", "rb") as f:
-    #     data = data2base64(f.read())
-    #     print(data == data_encoded)
-    
-    # with open("image2.png", "wb") as f:
-    #     f.write(base642data(data=data))
-
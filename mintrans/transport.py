@@ -0,0 +1,174 @@
+import itertools
+import threading
+import time
+from typing import Optional, Union
+
+import httpx
+
+
+class TransportConfig:
+    """Connection settings of the HTTPX clients, `http2=True` needs `pip install httpx[http2]`."""
+
+    def __init__(
+        self,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        connect_timeout: Optional[float] = None,
+        verify: bool = True,):
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.verify = verify
+
+    def client_kwargs(self, proxy: Optional[str] = None) -> dict:
+        kwargs = {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(
+                self.timeout,
+                connect=self.connect_timeout if self.connect_timeout is not None else self.timeout,
+            ),
+            "verify": self.verify,
+        }
+        if proxy:
+            kwargs["proxy"] = proxy
+        return kwargs
+
+
+class ProxyHealth:
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def __repr__(self):
+        return f"ProxyHealth(successes={self.successes}, failures={self.failures}, cooldown_until={self.cooldown_until:.0f})"
+
+
+class ProxyPool:
+    """Round-robin over proxies, skipping the ones cooling down after repeated failures."""
+
+    def __init__(self, proxies: list[str], failure_threshold: int = 3, cooldown: float = 60.0):
+        if not proxies:
+            raise ValueError("At least one proxy is required")
+        self.proxies = list(proxies)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.health = {proxy: ProxyHealth() for proxy in self.proxies}
+        self._cycle = itertools.cycle(self.proxies)
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.proxies)):
+                proxy = next(self._cycle)
+                if self.health[proxy].cooldown_until <= now:
+                    return proxy
+            # Every proxy is cooling down, use the one that recovers first.
+            return min(self.proxies, key=lambda proxy: self.health[proxy].cooldown_until)
+
+    def record_success(self, proxy: str):
+        with self._lock:
+            health = self.health[proxy]
+            health.successes += 1
+            health.consecutive_failures = 0
+
+    def record_failure(self, proxy: str):
+        with self._lock:
+            health = self.health[proxy]
+            health.failures += 1
+            health.consecutive_failures += 1
+            if health.consecutive_failures >= self.failure_threshold:
+                health.cooldown_until = time.monotonic() + self.cooldown
+                health.consecutive_failures = 0
+
+
+class SharedTransport:
+    """Long-lived connection pools shared by any number of translators.
+
+    One HTTPX client is kept per proxy (or a single one without proxies), requests
+    rotate over the healthy proxies and connections are reused across translators.
+    """
+
+    # Responses that count against the health of the proxy that got them.
+    FAILURE_STATUS_CODES = {403, 407, 429}
+
+    def __init__(
+        self,
+        config: Optional[TransportConfig] = None,
+        proxies: Optional[Union[list[str], ProxyPool]] = None,):
+        self.config = config if config is not None else TransportConfig()
+        if isinstance(proxies, ProxyPool) or proxies is None:
+            self.proxy_pool = proxies
+        else:
+            self.proxy_pool = ProxyPool(proxies)
+        self._clients: dict[Optional[str], httpx.Client] = {}
+        self._async_clients: dict[Optional[str], httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def _pick_proxy(self) -> Optional[str]:
+        return self.proxy_pool.next() if self.proxy_pool is not None else None
+
+    def get_client(self, proxy: Optional[str] = None) -> httpx.Client:
+        with self._lock:
+            if proxy not in self._clients:
+                self._clients[proxy] = httpx.Client(**self.config.client_kwargs(proxy))
+            return self._clients[proxy]
+
+    def get_async_client(self, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        with self._lock:
+            if proxy not in self._async_clients:
+                self._async_clients[proxy] = httpx.AsyncClient(**self.config.client_kwargs(proxy))
+            return self._async_clients[proxy]
+
+    def _report(self, proxy: Optional[str], response: Optional[httpx.Response]):
+        if proxy is None:
+            return
+        if response is None or response.status_code in self.FAILURE_STATUS_CODES:
+            self.proxy_pool.record_failure(proxy)
+        else:
+            self.proxy_pool.record_success(proxy)
+
+    def send(self, request: dict) -> httpx.Response:
+        proxy = self._pick_proxy()
+        try:
+            response = self.get_client(proxy).request(**request)
+        except httpx.TransportError:
+            self._report(proxy, None)
+            raise
+        self._report(proxy, response)
+        return response
+
+    async def send_async(self, request: dict) -> httpx.Response:
+        proxy = self._pick_proxy()
+        try:
+            response = await self.get_async_client(proxy).request(**request)
+        except httpx.TransportError:
+            self._report(proxy, None)
+            raise
+        self._report(proxy, response)
+        return response
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    async def aclose(self):
+        with self._lock:
+            clients, self._async_clients = self._async_clients, {}
+        for client in clients.values():
+            await client.aclose()
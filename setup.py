@@ -1,6 +1,6 @@
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as f:
+with open("README.MD", "r", encoding="utf-8") as f:
     long_description = f.read()
 
 setup(
@@ -23,6 +23,12 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=find_packages(),
-    install_requires=["httpx"],
-    python_requires=">=3.6",
+    install_requires=["httpx", "pydantic>=2"],
+    extras_require={
+        "http2": ["httpx[http2]"],
+    },
+    entry_points={
+        "console_scripts": ["mintrans=mintrans.cli:main", "mintrans-server=mintrans.server:main"],
+    },
+    python_requires=">=3.9",
 )
@@ -0,0 +1,25 @@
+import httpx
+import pytest
+
+from benchmarks.mock_server import AsyncLocalTransport, LocalTransport, MockServer
+from mintrans.mintrans import AsyncBaseTranslator
+
+
+@pytest.fixture
+def mock_server():
+    with MockServer() as server:
+        yield server
+
+
+@pytest.fixture
+def connect(mock_server):
+    """Points a translator at the mock server, returns it."""
+
+    def connect(translator):
+        if isinstance(translator, AsyncBaseTranslator):
+            translator.client = httpx.AsyncClient(transport=AsyncLocalTransport(mock_server.port))
+        else:
+            translator.client = httpx.Client(transport=LocalTransport(mock_server.port))
+        return translator
+
+    return connect
@@ -0,0 +1,7 @@
+"""Sample payloads used by the debug blocks and benchmarks, kept out of the runtime package."""
+
+data_encoded = "/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxASEhUQDxIQFRAVEBAQEA8QFRAQDxUQFRUWFhURFRUYHiggGBsnGxUVIj0hJSkrLjouGB8zODMsNygtLisBCgoKDg0OGxAQGi0iHyYtLS8tLS0tLSstLy0tLTAtLS0rLS0tLS0tLS0tLS0tKy4tLS0tLS0tLS0tLS0tLS0tLf/AABEIAQIAxAMBIgACEQEDEQH/xAAbAAABBQEBAAAAAAAAAAAAAAAFAAIDBAYBB//EAEwQAAIBAwMBBQQECgYJAgcAAAECAwAEEQUSITEGEyJBUQcyYXEUgZGhIyVCUmJzdLGyswgVJDM0chY1Y4KSo7TB8NHSU1RVZJOUov/EABoBAAIDAQEAAAAAAAAAAAAAAAMEAQIFAAb/xAA0EQACAgEDAgQEAwcFAAAAAAAAAQIDEQQhMRJBBRMUUSJxofAyYYEGFSMzkbHBNEJi0eH/2gAMAwEAAhEDEQA/AMGRTGSpsVwivRtHnFIpSQVWeKipFRPGKo4hoWtAh4geoqtJajyos8Pp91VivpQ2huFj7Al4SKjIosy1BJADQpVJjMbvcH0qmkgIqIigSraDJpiBqeC4K9DVejel9mLiaMTkww27MUS4u5Y7eJ3HVU3HL48yoIGOSK6NvRyc4pj7W8DfOrgNV+0fZK+0/Y1zHiN/7qeNllgfjIw6n05wcHg1Us73PBp2u1SWwhdp8bxCddpqtmnUYUFSpUqkgcpqve2+4VNWhs+xmpSgFLSYggEFgsYIPQ+MiqylGPLwWh1ZzFHnbqQcGm0Y1zT2jd0YYdHaN14OGUlWGRwcEHpQerrfc0659SyKlSpVJcWa7XKVccbClXaVQYAkQsQqgliQFUAliScAADqc1vZ+z1rpdus9+iz3sn9xZsfwCYHLSY9/GRnyyQB+dUXsh0pZr0yuMrBH3gH+1Y7UP1DefmBVH2n6gZtQlBPhi2wIPQKMt/8A2z/dSk5Odvlrhbv/AKG4RUKvMfL2QMuu1l+/u3EkSj3YrY/RolHoFjxx88mp7LtUXIj1SJLy3PhYyqv0qMHq8Uww+fgT9YrPkVwiiumDWMA43zTzkPdvewotES8s3M2ny7SknV49/KBj5qc8Nx6HnBOGZa969lu2802exn8SK7xY8xFKu4Y+IfeR9VeVRdjr+UsIYHk2SPG5jKHxoxVuM5HINLV2YbjN8Dz3SlFcmWIqGSAGjmsaDc2uBcxGMkkAMULZGM5AJI6jrU0XY/UHjEyWzmIgN3gaLZgjIyd3HBHBojlHGclo9WdjPabpplnig6d7NFDuHlvcLn769B/pAKI7y1tYgFgh0+Puo14VcySKcD5Rp9lBOwui3NxdQSwQvJHFd2jzOuMIveq2Tk+ik/VW49t/ZS+u7+OW1t5JIxZxRl127d4lmJXkjyYfbSlqXmJZGYSbW55xrPbe5uLC201gqwW4HIyXkZdwQsT0AVsYHz9MZpWq/quh3NtKsFxE6TMFZYzhnIYlVwFz1IIxRGTsTfoF79IYGddyR3dzZ2srD9XLIrD6wKhNVl+ShZXuODRaNwaFa1oN3ZsFu4XiLDKM2DG49Udcq3UdCetGuzXZrUblA9tbtKh3bSHhUnacHhmB605XfHGWxO7T53iMpUZ0rsrf3EkkMNuzSQuY5xujVUkBIKFy20nI6AmqGpafNbyNDcI0cq+8jdR5g5HBHxHFMKcW8JiThJLLRVr0T2GjF9Ljzs3zj9bFWRt+zd48YlELLEfdkmaO3RvirSsoYfLNbz2PaTcQX0hnidFazfY/DRN+Fi92Rcq31Gl9TOLqkshqIyVieDz3tIu65ufjdXB/5jVkLqLa2K2GtH+03H7TcfzGoFqkGRkUzXwjqbOmxpgalSNKrj4qVKlXHGvDU7NCI7upku6ErEYzokj172HyjvLpPyjHAw+StID/ABLWM7axlb+6B6/SZW+pjuH3EVX7Edp/oV3HO2THzHMByTE2NxA8yCA2P0cVrPa1pYMkepQEPbXCIGlTxJ3gACNn0ZdoHxU+opZPp1Db4kvqMSi5adJcpmBrmK4GFOUZ4AJJOAByST0AFOCJ6x7DoiEun/JLwKPmocn+IVgTrT22pS3lueRd3DAZwrxNKxMZ+BH/AGPlXoS3I0bShGxAvp97iP8AKWVwBuPwRQo9Mj415NaWryOsUSlpGYIiL1LHoKSpipynN8PYetk4RhBcrc9E9oXZdNRjh1XTgpMoRLgHCjHuiWQ/klMbWPoAfya847R30ZVLK1/wcDFg2MG4uSMSXbj44woPRQB5kV6P2K7Q29pN/VjFJLaTdHNOctG12+FbaDx3OAE6c+90NY72g9lDYXJRQTA+ZLdzz4M8xk/nKSB8ip86pVtLol+geU8x6l+pm+zSD6baH/720/nJWy9v6g6lHkD/AAEP86esp2cT+22n7bafzkrXe3wfjKP9gh/nXFWmv4y+TCQl/DZb9jekQw213rMyBmt1mWAEcL3cXeSSL8TuVc/BvWvJNWuZppXnnYvLIxd3PJLH9w8segFe1ey6T6TomoWKY78LdBV8ys0PgP1uHH1V4wDkUOEeqcshXLCWD1b2OBdSsLvSLvxRIEktmPLRF9wymem1gGH+Zh0NAPYpbtFraxPw6JdRuB+cqkEfaK0n9Hu37tr25c7YUiiVnbhR77tz8FUH6xQH2R3Ym18zgYErX0oB6gOHYD76WkulyS4Cp5WR3bftLPa6nLBaSyRJBcSSjYdoe5mYyyyyDo/L7MHI2oB5mtV7P4W1O4m1TUiJFt0VUUqoj3AM4G0cYQc4Pm4PlXmPtSP42vP2g/wrXpvsBukms72zJxIX3n/JLEIww+RQ/aPWjuSVOVyCdeZ5MH2g1qW9na4nJJYnYpOVjj/JjUeQA+05PU1uPYbcuLqaEM3dG2aQx58HeLJGofHrhiM/+grzq5tnidopVKyIxR1PUMpwRXoHsP8A8dL+xv8AzYqb1CXkNLjAhS35yyYnXP8AE3H7TcfzGqlKuRV3XP8AE3H7TcfzGqotHj+FAJ/ibM5cx7SahonqsPnQ2iI06p9UUxUqVKpCCglxxVwNQtTVy2k8jWbVPqRWyHctiQ1o+zfbS5tEaACOa0fIls7gb4SG94r5oflxnkg0AsoFd1Rm2BiFDbS/JOBwPjRTVdDitpmt5rnEibQxWF2jG5Qw53Z6MPKiSSezALZ7BJ9Q0lzu7rUICesUT29zEPgrSbXx8yav6d2ps7Q77K1d5x7lzfOshT4pDGAoPxJJrLX+iSxRLcKY5bZjtFxCWZA35jhgGRvgwFV4LGZopJ1QmGIoJZMqApc4UcnJyT5ZqOnbDf1IaXKSDd/rEtxIZriRpJG6u2OnkABwB8BgUY0XXLaCNwLeUzSRmJrhbhEdFb3+6XuSEyOMnJwTgjNYdZqnjuaJlNdL4F3XKL6lyGV2buVYx7uVDKH2Z93dtIzjz2/V5VstX7cw3Vslpc2ckioF2Ttcj6QGUY37u5wWxweOa8/t5yxCjkkgADqSegFXruB4naKVdsi4DKSDjIBHI46EVaUYTab7AVKdeUu5Lpd1bwTLO8M0hjmjlhVZ0iUbG3ASHumLchem3zol2v7W2moyie4splkESxBobtQNiszDIaAjOXagRGaqzxVEqot9Xf5hKr2l0j+z2vXNjOLm1YK4BVlYbo3Q9UdfMcD0PAxirup6jpdzI08lveW8jsXkitZIJLcueWZO8UFMnnHIGeKCOtQstUlWs57jULHjBpNT7Y/2T+rrCH6NZklpsv3tzcMcZaaQADnA4A6ADpxUPYrtJb6bMt2LWWa4CyLn6QkUOH44j7ktnHHvfVWcIrgqjqjjAVTechXthr9peyy3K2s8NzKwdm+kpLBngH8GYQ3QfndaHdme0FxYzrc2r7ZFyCDyjofejdfNTgfYCMEA1Unh8xVWh9Cht2DqWT1299oOnX4El7pYa4AAMkVw8RbHTLKoOPgc4p3ZftvDZTNJFYxJEYmQRo7NMWLIQXnk3MQNp8IAHPTgV5TaTbT8K1nZ+yNzKkION2SzYzhFBZjjzOBR4VVuOO3zYlfKcJZRNrV3DLI0sMcse95JHEkqTDc7bvDtjXaBk9c+XpzRFW51tzErxmUS94VaJyrju8AiQMFXHJxjnoap0zFYWBKTy8shvo8rQBhg4rTSDIrPXaYarIb0kuxDSpUquOlcU9GxTaVYkE4sIw1pTZkjP+1j/iFHvaIv4xuP80X8mOs3oJ/DIMoAHRiXdI1ADAk7mIFa3thCJ72aaGS3aJzHtfv7dRxGingvnqD5U4txGxdM/v8AIl9mx7x7mzfmCa0kZ1PQMpVQ49Dhzz8B6UFtNNR7Ga5Dyh4nt1eM7e6YyNgHjngE9fWiMF7FZwSxwSCW7nTupJY93cww+aoxALufUcDj05Zp23+rrqIvCJJJbZ442liV2WNssdpbIx6Hk+Wa4qnvn5A2506OBIjcGQySxrMsMRVCkLE7WdmByzYJ2gcDqecUc7KaZa/T1TvO/j7kzwsoXaG2bwsy54ZfzRnnGcdKbrkcd8sNzDNbrMtvHDcW08scDho8+NC5AZTn19PPOIOxhjgvkEs0O0xTIZQ34FXZGAUuQAfLkZHPU1xLeYsEWwt2kjRTcd221SWEYkDMcAgAkY5FG5dCIu7mEyt3VsrSz3Djc+0KDwufE5JwBmgkFiYpolaS3JDozMk0bRqFYZJkzs8jwCTWpvNTgN3qEZli7q8iCw3AdXiEiL4N5XO1SSQSenHlzXZOnHP38gdp1slwsvcGQSxRtN3Um1u8iXG4qygYYZHhwc+tW5tPtxBBcNJKFl74bAis+Y2C+HkDHXkn04PNUezdwLIzXEzR7vo0kUEKSRSvJLJjB/BscIADlj68Zp2ozr9As4xJEZI2uzKiSxO6iSQFMhWJOR6dPPFWUmBnTvsN1zSUjjinhdnhmEm3eoSRXjIDIwBIPJ6iu22iQvciy7xjK3gE8ZR4O927tu3qy58O7d8ceVXLuaI2dnG8keUmmM6pJE8iRySDDbQSSduTxn40SsJI4dQQpLZx2SyeBo5ICWTaQu8gmQncRkvwOfKpzk5ZSMzouhxzicSO0ckEbylsK0QVWCtu8+Mk8eQqXTNFsLmeOCG4uAZIyV7yNFImUE90TnHIHBGcdOc8XNH2J9PDS2+ZbSeKM97GFeVyGCqWIyP0unHWstFK8UiuhAkjcOrAhhvU5ByOCMjyquAyb3LVjZxM0wl75EiR3PubwVYII2B43F2VfmT6UIa0LuFjBLOwRF8yzHCj7SK1vbW4hLB7fj6WIr2ZfzDtKiP/AIzKx+O2s/pt13UscuM93LFLt9djhsfdUYCxk1uizf6TaW8/0SeSUyKVSa4j2dzHIQCQqHxSKucE7lPBwK1PYuwNtqD2s5PexxyhSmDGyGMnfk88qVI+vNAe0WnJcXjzxTwfRppBKZXliRow/Lh42IYMDngA54xmjum6/DPq8l33kcdssLwo8zpEWHdFFOGOTkgnpwCM4qsXjYixOUP0+oGm7rjujJjHPeBQfhjaTUVNjUjg7c4Huski9PzlJB+2nU4uDOksMetBNTTmjSUN1VasuQuneJgmlSpVc08kNKu1ysrpLjkbHNGbWQMOopnZrW7i1lH0eTYHeMSAqjhgG4BDA+p+2vavbRqUlm9otp3cQkW5Mm2KAlihi28sp6bm6etSrGpKOOQV0FKOTx0geopGFtu/B2btm8A7N+M7N3TOOcVpY+19+ORP/wAq3P70q7ruvS3enRrcOjTR3z42rHGxiMIwxVAB1yM49KM+pNZX1/8ABKLjvuYdkphWrbJUbJVsHKZWIrlTMtMK1UIpEeK4TTyK5iuLZNGnYjVO7aX6JKIkRnd3aJAEUbmJDMD0HTGazLz7a9Y9mfGh6vj/AOHc/wDS15HMucZOBkZJyQB68c0KubbafYL0R2/MsxzhqtWC25Y/STMIwpP4AIZC3kvjOFHXnnp0op7Q+z2n2Jt10+8+ku8bNPh4pFXG3YwKe6Gy3hOTx1rMw3GeDRIWKayis6scFu/n7xy4G1fCqJnO2NFCoufPCqOfM5NXNF7M3t2C1pbySqGKFl2hdwAJXLEDOCD9dDjWn9lg/G9mfPvX/lSVE21FtHQ3eGANZ0ma3ka3uU2TJt3xkoxXcodeVJHusD186DEEGt57Wm/HF3/ngH2W8VY24izyK6DzFNl0+mWAjp8mRV6hGmN5UXFNRM++OJjlqlqa8VdWquojirFKniaARFdrpFKiGoV6VKlWc0EJrH+8T9Yn8Qr3P+kBp9xK9kbeGaXat1v7mN5NuTDjO0HHQ/ZXhll/eJ+sT+IV7d/SI1CaJrLuZZY9y3e7u3ePODDjO089T9tLzyrI4JxlGM0HszeSyxRva3io8saO5gmQKjMAzFmXAwCTk8VQvIAkjoM4V3UE9cBiBml2W7TXMc8MklzclEmidx3srZRXBZcFsHIB4qS8kDyO69GkdhnrgsSKeh1N7mVfGMePcL9nexc19xbz2m8IHeN3mWRVJx4sRkfYTVOx7KTSKskklrbRuN0T3sy2/eL+cinLEfHGPjW29h4/tM/7OP4xXnV5IzuzyMzOzEs7EsxPqSetDTm7JRzxgn4YwjLHOQh2l7E3dnGs8ndSW74C3Fu/exc+7k4BGfXGPjQTTNKnuZVgto2klb3UXHQdWJPAA9TxXqHY4mTQdRiflI+/aMHopESyDH++N3zJqL2NQ/g9QaP/ABIt0WL84AiU+H5sE+wUJ2SUZZ5TDqCco44aMK/ZqISfR21CyFwG2Ff7UbcSZxsNwI9oOeM9AfOn3vs+1SJZnltiscKu8kpeEIVRdxMfiy/HoPh14oAUGPhj7q9M9q0YbTdJkn/xXcIG3e/tMMZkJ/3tn21M3KLSzyWg4yTeOBezf/Uesfqrj/pa8z0/T1mJDT28AAHiuDKqtnyXYjdMeeK9N9nI/Eer/qrj/pa8mmHB+RqkF8Ugre0Qr237E3OltEty8DGVXZO4Z2ACkA7tyr+d5ZqnoHZqe6SSZTHFbQgd/d3DGOBCeiZAJZjkeFQTyPUV6R/SP/v7P9RL/EtO9nsdnqejvopmWC8EzTLnGZDu3q4HG8Y8JAORtB9KXdklFSD4MbYdlGuElewuoLpoI+9lhVbiGfux1eNZEAcfI56ccirPssP42s/1r/ypKh1rsfrOjl5MSLE0bQvdWjM0ZiYjKsRhkBIHvAVz2SSZ1azH+1f+VJR1Z1QlvnYG4bpo0PtC7N3Fxqt5IvdRW4lhVru6kS3tg3cReEO3vN8FBPShl77Or1LdruKSzurdQS72Mxn2hfeOCozjzxk/Cue1+d21a5DszKjRLGrEkIphjYqoPujJJ48zWg/o/XLi9ngz+Cks2kdPIvHJGqnHykcfXXZlGtST7FWouWDzSFcGiqdKgvrdUlkRfdSaRFH6KsQPuFTJ0p6tmfe9yRar3/SrC1XvjxRQUPxICN1rlPYUquaeSpXK6a5SMkGJ7AZljA6mRAB8dwr2n+kfbuzWJRHYAXYJVSwBJhxnHyNePaVrd1a7jazzQlwA5hdoywGcZI9Mn7avf6a6r/8AUL7/APYn/wDdS8oSc1JdiclfTbSfPEUp+SOf+1b3s7o7dzeTzwsFjsnEZljYATO6KrKWHUDd09ayEPbjVcj+33v1zSn95o3/AKUX00Zjmup3jbG5HdmU4IIzn4gUxHzGsbCepUIvqZuvYgf7TP8As4/jFecydT8z++iNtr95GoSK5uERRhUjlkRQPQBTVS9vJZm3zSPI+Nu+Ri7Y54yfmaJGtqyUn3/wIysi61Fdjf8AYX/Uup/5Z/8Ap1rKdinuYpXubWVY+5jDTMySTBondU2d1GCzgsV9MYzkYzUK9pb8cC7ugPICaUL9gOKPdkxLFFcazJPMO7PcbYyvezyuUOx3cMAnKZOCeuMY5FODipN43+8B4WKTilnYqa5daa030kWN00m4vLEf7NYySHktsw7hSeSuRn6zWa7Ta/cX0xmuGBYDYkaeGONB+Qi+XzPNbM+1jU88C2x5AxuePTO/JorpPaWHWO8s9RtoBJ3EskV3ECCjIuc+LJXjnOcHGCOaHiVe8o8fnkL1Rm8Rl9MA72dD8R6vjn8Fc9P2WvJZiNp5HIIHx+Vab/SnUcDF7eDjos0qj7AapLrl4kjzJcTrM4USSq7CRgowMsOTgAVZQkm37lvMi0l7G5/pHD8NZ/qJf41rzmbsjdrYR6qADbPI6ZQkyRlWKh3AHhBYEA59PUVZv+0uoSI0ct5dPGwKskksjqQeoIYmhujdpL2z3C0uJI1bO+MENE2Rglo2yrHAxkil5VyjXj2G4TUj1H2J9sLyV57e+lMunx2sksstz4xEAQMNK3VSpbwsTwvGADWP9l7IdctzEMRG4nMYPUR7JNo+zFZzU+0t5OncyzN3Od3cRqkEBb84xxhVJ+JGaj0vtBeWylLa5nhVm3MIZHjy2AMnafQClllNoua32tH8cXg/ThP/ACIqP+wD/WUnwsJs/wD5oK84v+0F5cBVurieZVOVE0jyYJGMjcaI6f2jvokEUF3cxxrnakUskajJJPCkeZJ+unlFyq6QEsRlkm1L/ETj0uZwfn3jU5RTZ9RnnYPcSySuBtDyszttyTjJ+JNTbacrTwZlz+IaKo6g/FXzQnVG/fRDqVmZTpVwNSq5oYKprldrhpWSDnKVKlQjjqmj+mPxQCi+kvRIC2pjmAZrtIUqYMg5R/QO0fcRS2k8Sz2cxDSQljG6uMYkjcA4PhXy/JHTzA0qrKKksMtGbi8oKSJpucqb8D81ltmP/GGH8NRyasscbw2kRiEimOaaR+9uZIicmLcFVUQ8ZCrk4AJIofTWFV8td9wisfbYqutV5Fq64qvItRJBISKEq0MlHNF5RQu5HNAsXwsfoZXNcrprlZj5Gh6miFm2aHLV7TzzT2nllYBXL4QzbLV/FVbZatVoQ4MW15YwigOqSeLFH26E1lrp8sT8a58jOjjmTZzNKmZpVbKNDB14yOoqOtNNbqfKh8+nDyoMgENTF8gilVqSyYVXaMjqDQmhhST4Y2iOltzQ6runHmpiVuWYM0idKdUcR4p+aZRiPk7SrmaWakg7TTXc0iag4jYVBIKsNUElUkFgUZRQu760VmoVddaXnwaNHJUNKk1crJlsx4cKv6aPFVBaK6VH509pEBveIMOwDiphUcfSpYxWmuDCk9yC/bbGT8KyZrU6yhK7R50Hj00+dUfI9pJxjDLB1KjaaYPSlXYGPUwL71C1TvUD1DM6JEajZBUhphobDoha2U+VTW9qB0pVPBXI6c5Y5CEUPFOMNSw9KkplIznN5KhiNc2GrlLFdg7zGUtprmKulaaVFdglWFFhVeQUSZBUEiCqSQWEwRMKF3SnNaCRBVO5QUvJD9NuGAWFN21dkjHlTEiyaVlp02PqxYGQQljgVoLK22iorK3AomgpymtRRnam/q2Q9FqdFxTYxUgFMmbJkMq5NcCVKyU4R1VySI6sIh2V2rIhpUPzUR5iBj1C9TuKhcVLGokDUw1KRTCKGw6Y2rEFQYqxAK5ETewUh6VLTIhxT6aXBmy5FSrtcNdkg4TTSacaY1Q2Shjmq8hqZxULrQpSQaBVkNUbk0SaKqz2xNLykN1zSBIiJNXrW1q9BYfCiMNl8KhSXcm3VLhFSKLFWFjq9HYn0q7Dpp866WqhHuJOcpcIGpFU0UBPQUZj04VbhswPKlLfE4LghUzfICSzJ8qtw6d60ZEAp+0Cs+zxKUvwhI6ddwetgPSlV0yClS3qbQvlR9jCvCaheE1qW0sVGdJrc9fW+4FKxdjLGCm9wa1H9UUv6oqvrq/cv1T9jLi3NWILetCNIFTR6UKj19a7lZOxrgFJFTu6o4unCnf1ePSpficBfybAF3VLuqP/AEAelOFiPShvxWBKosM93Nc+jn0NaUWY9KcLQelBl4si608vczH0M+hro05j5VqBainC3FLy8U9gi077szSaSalj0atGIRTggpaXiU3wFVKA8OlqPKrSWQ9KIImTgdefQdBkkk8AAAnJ9KuJCkfjlIJV0V4gU7xQySZIVuHwe7YEZUjOaH6i2wJGlAtbTjOPDnG48Ln03HiikGgyFijbVb8GADufxSGTYCVBAB7snd0wV9arXt+rkIi8BmZAq7eWVA4WMZwCyZxnzPrU0VjduMhWUBBHlmK/gxwEIXnHwNSoyb3yw0K1nCWfkNubDZEkxPhcRlQVKgh4hISDnnafCfj9lTT6YUALMVG2VnLoQF7tYycbSdwJlAGPOqjaS3nPag+neJn7yKgfRbkgiN4pBjBEblhjjg448h9gosNPFv4v7hvTWc+Wx+oQyRKGcYVuB73BKhgDkdcHyz0I6gihMt9UGrLdLjv1YAdH2rjoFyzqPEcKoyxJwAKFtLRvLqrHtL4PZe8rgINeH1pULMlKq+oj7G8v2bWDbmMVzuxXO+FLvhWP8R4nB3uhS7sVzvhXO/FT8Zw7uxTggqPvxXe+FdiZGxJtpbRUZuBTDdD1qVXN9iMonxSxVRr1fWoX1FR50Raa19iOuIRrhIoQ+qr61C2rCjR0Fr7FfNiGy4pplFAW1Oomv2pmPhcu5Km3wg+9yBVabUVAyTWflu2PnRns4swSSdYWdVDZmjVhcxDHjlhdlMT4B5Q+LB8hk0deH1x5YeFFs+2AxeT/AEWNZMnexjkilCDG7a+EBJKyRMpYkjBGUyCGAEOkWc96TNIRHAMgycKCF6hM8YHOWPnnOTmhXZ/SDfXW0gCFfHKY0EK92OPCikhGc84XgEsR0oz2v1hWf6DBhYItqyBeAzr0i/yrxx6/KpulVTDZGto/Cp6i1Qey5Za/rSJMx2KKF6G5cbmb4ordR+k3HouMGosGQgylpDnIMhL4P6IPC/IAVT0uBpGCqMkkAAetam87OvDH3hZTjG5RnjPHXzrLc7LcvserjVp9JiuOE/qXrbTHWLvNwzt3bQPycZ6+uKrfSoX8Mixv8HVWOfhmj+jvvgTP5u0/Vx+6s5p+no1yYpOgLcdMkeX/AJ6UWUcdPT3Ea5qTn5nb2FcW46xOR1zHKWkjPwDHLp9pUfmmsrqPZ6Kfd3I7m4XloTju29GGOMH85frGeBvNY0AhS9vnIGTGcnj9Enn6q861PUZFIPR0OUbzB9PiD0IrpTcHia2GNHBz+OiWJL73XdGYnjZGKSKVdThlPUGlXo1glrexrPJFEz42NvAYqw6rk+XOfrpURUZ3THP3/GHw2VvqXPzPPT2hHrTG7RD1rFMJKYUf1NbHpKjwS0VjNp/pKoOWyV8wpCsR8GIOPsNaK6EZaWOJ3R45Y4UErCUSM0Ek2Moi7OI8Z5+/jy+w02SaVIUI3ySJGpc7V3MQBk+Q5ovJoupqQxM2XlQK6zBi8rFoo2BDZOfGobp7wz1qroqXASOia2ka69SSKWKFpoC0kzW7FHDiKZSgZX2kkAGReTg8HgY5tS2ssad7PKkad2Hbh3deY0dCo/KWSVUPxB9Ocxb6FfTKGmaRxHCHjEs29xGe6wiJuJUkSxHZgHBHHTJmx0i/aVQskqyFsCbvzgGZ2LkOG8RLK5IXJyrEjINR0Vr2By0OXx9QnLpjrvWSZRKgLOFDlEjQzb2PhyxxA5AHoPXisLRZHEUU5DGOCUPJwjrPHCY1RcA7t0j8cnAGAx6j9OsLqQd6kkgCq7953jKfwKNLhedxIz5dC46ZzV+HSL7vWYSyiQ70aZpmR2VA3vEtu2nujjdx4fhxHXBF14Wns19QdYW7SxmV5RHgz+BlkZsQRpLKeOnhfgeZGOOotns5LvMbTxBxl+RIF7gXH0cylsYHj52+nOfKnx6JOPCiuVJ2gKSMmTajYQkEg7kQnGOgJqcw3ag+OXaPw399lSQC5kXDeJgFY5XJG05xioepS4D1+Cxft/Uo6howiRWMhZmldcAYUxiOGRXB6H+9HQkehI5NRYaOXFhdnwyd4zFzuR3z+EUKoyWOC+GVQM7vLHlVC4gdApdcBgCvKk8qrDIBypwynBwcEUOWuaNDT+BVye2CsI6TJSMtRtJSstbJmzT4DCPKFtq6upMITb7IdhOSSmZN2c7w2eG8s4zjih5amM1BlfNmpX4TTHlHpvYgC20ya9I8T99Jn9GLKIvy3Bz/AL1ed2zE+InLElmPmWPJP216RbLv7PeD/wCWlB+ayvu+8GvN7Y8VTVPaK/IU8JSdtz79WP0XB6l7M7INvlPVQFX5tnJ+wffVvtzqxQ9wvTAZ/LJPIH7jVf2V3i4kizyQrD/dyD+8VJ7QNJcv36glSAG+DDjn6gK559NmP6iE+l+JtW8dv8ffuc7LdoIUQpKSvO5TgsOmCOPlQfWdRDTNJHwC2R6/OgeCK4FY8DNIu+TiovsakNFXGx2Lv/Q9O7IaobiMh+XTHPmVPTPx4/dWC9pGniO4bbwrAOB/m6/eDW47B6W8URkcYL42g9dozz9efurGe069V7gqv5AVM/EZJ+8kfVT9ufIi5cmboMLxCSq/D9/5MELmRMhHZQTkgHHPTP3ClUUx5rtKqTXc9DKqDeXFf0B/0EeldFiPSr+K7T3qpi68MrK1rAY3SRMbkdJFJ5G5SGHHzFF7bVJFcPshOO5KoVcophdniYeLJILt1JGDzmqNdFVeomy37sqfKC8GtSqqKNgCIEQ4ckY7sqRliFwYkOFAXIJIOTUx7QylgzCNtrI6B+9cI6lyGBZyfy24JI6ccDAPNLNDds33JXhlC/2hC21JkTYFjIAlCswYsneoI5NuCByoHUHpxjnM0uuyM/eMkJk8WXKtuKsHBQ+LhcSEcYPAyTgUI3VzNV65e4X0VOc9IYXtFMGDgR712hX2ncEV1k7vrjaWXPTPLYIBxUdtrkqRiFRHsEbRDIcNsYOCDtYBuJG6g46jB6i80q7ql7l/R0Yx0oMQdo7hN20r4pJJmA3qO8dw5OVYHAI6ZxgkHNVL3VJJURH24T3SN2T4VXzJA90cKFGSTjNUjTa7qbLx01UZdSisnS1czSpVwcVcNKlXHHp/smvUntZ7CQjKF2UesMo5x64fd/xisDe2L20z28gw0bFfmv5LD4EYqHR9Wls50uoeWQ+JCcK8Z95D8CPsOD5V6h2h0mDWLdb6wYd+q4KnAY45MMg8mGf/AAGjuPm147o81c34frHY/wCXPn8n9/3MNoeqPBIsiHBByK9h0TtFb3SBSVDkYaJsYPyz7wrwtlZGKSKyupwyMMMD8RViC6Zehpaq2VLx9B3WeH1a6KnF79mj2257KWjnO1l/yHA+w5xUln2btYjuCZI5y53Y+OOn3V5LbdqrpBhZZAPTc2PsqO87SXMgw8shHozMR9lF9RUt1DczP3PrH8Lt2/U9L7UdsIoFKQsGlwRuHKr8c+Zrx7ULouxYnqepps1wTyTRXst2YlvnBwVtgfHL03foJ6n40NuzUT+9h+unT+GVOUnv9X+SOaB2Pluou/8AdUuwXPmoxz9ufspVtNV7dWFi/wBERJX7pQp7gIUQjjuySR4hxn5+uaVPKFMVh4MKVniNrc4qST3WDyqlSpUie1FilSpVxwqWK5SriB2KaaVKoOOika5SqSTmKcK5SriWI03FdpVxxzFdxSpVBJwitZ7HpmGpFAzBGtpGdASFYqV2kjoSMn7TSpUWn8aMzxf/AEk/kan2xW6COOQIvebgO8wN+M9N3WvNkrlKra7lGZ+zzfRP5okrjUqVInpB1ggaeJWAKlwGUgFSPQjzr2TtWxi064MJMZW1coY/AVIXgqR0+qlSrV038k8X4tvrkn/xPAbcDaKVKlSR7CPB/9k="
+
+response_image_text = r''')]}'
+
+[["wrb.fr","WqWDPb","[[\"encoded_data\",\"image/jpeg\"]]",null,null,null,"generic"],["di",8],["af.httprm",7,"4899313873477571118",0]]'''
\ No newline at end of file
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from mintrans import AsyncBingTranslator, AsyncDeepLTranslator, AsyncGoogleTranslator
+
+ASYNC_TRANSLATORS = [AsyncGoogleTranslator, AsyncBingTranslator, AsyncDeepLTranslator]
+
+
+@pytest.mark.parametrize("translator_class", ASYNC_TRANSLATORS)
+def test_concurrent_translations_share_one_client(translator_class, connect, mock_server):
+    async def main():
+        translator = connect(translator_class())
+        client = translator.client
+        results = await asyncio.gather(*(translator.translate_text(f"Hello number {index}", "de", "en") for index in range(20)))
+        assert translator.client is client
+        await translator.aclose()
+        assert translator.client is None and client.is_closed
+        return results
+
+    results = asyncio.run(main())
+    assert [result.text for result in results] == [f"Hello number {index}" for index in range(20)]
+    assert {(result.source_language, result.target_language) for result in results} == {("en", "de")}
+    assert sum(mock_server.requests.values()) >= 20
+
+
+@pytest.mark.parametrize("translator_class", ASYNC_TRANSLATORS)
+def test_async_batch_and_fan_out(translator_class, connect):
+    async def main():
+        async with connect(translator_class()) as translator:
+            batch = await translator.translate_batch(["one", "two", "three"], "de", "en")
+            many = await translator.translate_to_many("Hello", ["de", "fr", "de", "es"], "en")
+        return batch, many
+
+    batch, many = asyncio.run(main())
+    assert [result.text for result in batch] == ["one", "two", "three"]
+    assert list(many) == ["de", "fr", "es"]
+    assert [result.target_language for result in many.values()] == ["de", "fr", "es"]
+
+
+def test_async_translator_creates_its_client_lazily():
+    async def main():
+        translator = AsyncGoogleTranslator()
+        assert translator.client is None
+        translator._create_client()
+        client = translator.client
+        await translator.aclose()
+        return client
+
+    client = asyncio.run(main())
+    assert client.is_closed
@@ -0,0 +1,49 @@
+import pytest
+
+from mintrans import BingTranslator, DeepLTranslator, GoogleTranslator, MemoryCache
+from mintrans.tools import pack_batches
+
+TEXTS = [f"Sentence number {index}." for index in range(30)]
+
+
+def translation_requests(server) -> int:
+    # Bing fetches its session page with a GET once, the rest are translation requests.
+    return sum(server.requests.values())
+
+
+@pytest.mark.parametrize("lengths, char_limit, size_limit, separator, expected", [
+    ([3, 3, 3], 10, 10, 0, [[0, 1, 2]]),
+    ([3, 3, 3], 10, 2, 0, [[0, 1], [2]]),
+    ([4, 4, 4], 10, 10, 1, [[0, 1], [2]]),
+    ([20, 1, 1], 10, 10, 0, [[0], [1, 2]]),
+    ([], 10, 10, 0, []),
+])
+def test_pack_batches(lengths, char_limit, size_limit, separator, expected):
+    assert pack_batches(lengths, char_limit, size_limit, separator) == expected
+
+
+@pytest.mark.parametrize("translator_class, session_requests", [(GoogleTranslator, 0), (BingTranslator, 1), (DeepLTranslator, 0)])
+def test_one_request_per_batch(translator_class, session_requests, connect, mock_server):
+    translator = connect(translator_class(cache=MemoryCache()))
+    results = translator.translate_batch(TEXTS, "de", "en")
+    assert [result.text for result in results] == TEXTS
+    assert all(result.target_language == "de" for result in results)
+    assert translation_requests(mock_server) == 1 + session_requests
+
+    results = translator.translate_batch(["New one."] + TEXTS, "de", "en")
+    assert [result.text for result in results] == ["New one."] + TEXTS
+    assert translator.cache.stats.hits == len(TEXTS)
+    assert translation_requests(mock_server) == 2 + session_requests
+    translator.close()
+
+
+@pytest.mark.parametrize("translator_class", [BingTranslator, DeepLTranslator])
+def test_batches_are_cut_at_the_engine_limits(translator_class, connect, mock_server):
+    translator = connect(translator_class())
+    texts = [f"{index:03d} " + "x" * 96 for index in range(60)]
+    results = translator.translate_batch(texts, "de", "en")
+    assert [result.text for result in results] == texts
+    groups = pack_batches([len(text) for text in texts], translator.batch_char_limit, translator.batch_size_limit, translator.batch_separator_length)
+    assert mock_server.requests[translator.engine] == len(groups) + (translator_class is BingTranslator)
+    assert len(groups) > 1
+    translator.close()
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from mintrans.batchexecute import BatchExecuteDecoder, decode_entries, iter_entries, parse_translation, rpc_payloads
+
+
+def translation_payload(segments: list, target_language: str = "de", source_language: str = "en", spaced: bool = True) -> list:
+    translation = [None, None, None, 1 if spaced else None, None, [[segment, None] for segment in segments]]
+    return [None, [[translation], target_language, 1, source_language]]
+
+
+def entry(envelope_id: str, payload: list, rpc_id: str = "MkEWBc") -> list:
+    return ["wrb.fr", rpc_id, json.dumps(payload), None, None, None, envelope_id]
+
+
+TRAILER = [["di", 42], ["af.httprm", 41, "-1", 7]]
+IMAGE_BODY = r''')]}'
+
+[["wrb.fr","WqWDPb","[[\"encoded_data\",\"image/jpeg\"]]",null,null,null,"generic"],["di",8],["af.httprm",7,"4899313873477571118",0]]'''
+
+
+def plain_body(entries: list) -> str:
+    return ")]}'\n\n" + json.dumps(entries + TRAILER)
+
+
+def chunked_body(entries: list) -> str:
+    # The length counts UTF-16 code units of the frame and its new line, ensure_ascii=False keeps that honest.
+    frames = [json.dumps([item], ensure_ascii=False) for item in entries] + [json.dumps(TRAILER)]
+    return ")]}'\n\n" + "".join(f"{len(frame.encode('utf-16-le')) // 2 + 1}\n{frame}\n" for frame in frames)
+
+
+ENTRIES = [
+    entry("1", translation_payload(["Guten Morgen.", "Wie geht's? 🙂"])),
+    entry("2", translation_payload(["Straße"], source_language="")),
+    ["wrb.fr", "MkEWBc", None, None, None, [8], "3"],
+]
+
+
+@pytest.mark.parametrize("body", [plain_body(ENTRIES), chunked_body(ENTRIES)])
+def test_decode_whole_body(body):
+    assert decode_entries(body) == ENTRIES + TRAILER
+
+
+@pytest.mark.parametrize("body", [plain_body(ENTRIES), chunked_body(ENTRIES)])
+def test_decode_fed_character_by_character(body):
+    decoder = BatchExecuteDecoder()
+    entries = []
+    for character in body:
+        entries.extend(decoder.feed(character))
+    entries.extend(decoder.close())
+    assert entries == ENTRIES + TRAILER
+
+
+def test_chunked_frames_come_out_as_they_complete():
+    body = chunked_body(ENTRIES)
+    second_frame = body.index("\n", body.index('"1"]]')) + 1
+    decoder = BatchExecuteDecoder()
+    assert decoder.feed(body[:second_frame]) == ENTRIES[:1]
+    assert list(iter_entries([body[:10], body[10:]])) == ENTRIES + TRAILER
+
+
+@pytest.mark.parametrize("body", [plain_body(ENTRIES)[:-5], chunked_body(ENTRIES)[:-20]])
+def test_truncated_body_raises(body):
+    decoder = BatchExecuteDecoder()
+    decoder.feed(body)
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_rpc_payloads_leave_failed_envelopes_out():
+    payloads = rpc_payloads(decode_entries(chunked_body(ENTRIES)), "MkEWBc")
+    assert sorted(payloads) == ["1", "2"]
+    assert rpc_payloads(decode_entries(IMAGE_BODY), "WqWDPb") == {"generic": [["encoded_data", "image/jpeg"]]}
+
+
+def test_parse_translation_joins_every_segment():
+    payloads = rpc_payloads(decode_entries(plain_body(ENTRIES)), "MkEWBc")
+    assert parse_translation(payloads["1"]) == {
+        "text": "Guten Morgen. Wie geht's? 🙂",
+        "target_language": "de",
+        "source_language": "en",
+    }
+
+
+def test_parse_translation_without_separator_and_detected_source():
+    payload = translation_payload(["你好", "世界"], target_language="zh-CN", source_language="", spaced=False)
+    payload.append("en")
+    assert parse_translation(payload) == {"text": "你好世界", "target_language": "zh-CN", "source_language": "en"}
+
+
+@pytest.mark.parametrize("payload", [[], [None, None], [None, [[]]], [None, [[[None]], "de"]]])
+def test_parse_translation_of_unexpected_payloads(payload):
+    assert parse_translation(payload) is None
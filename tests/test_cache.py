@@ -0,0 +1,88 @@
+import pytest
+
+from mintrans import GoogleTranslator
+from mintrans.cache import MemoryCache, SQLiteCache, TieredCache, make_cache_key
+
+VALUE = {"text": "Hallo", "source_language": "en", "target_language": "de"}
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_keys_normalize_without_stripping():
+    assert make_cache_key("google", "Café", "EN", "DE") == make_cache_key("google", "Café", "en", "de")
+    assert make_cache_key("google", " Hello", "en", "de") != make_cache_key("google", "Hello", "en", "de")
+    assert make_cache_key("google", "Hello\n", "en", "de") != make_cache_key("google", "Hello", "en", "de")
+    assert make_cache_key("bing", "Hello", "en", "de") != make_cache_key("google", "Hello", "en", "de")
+
+
+def test_memory_cache_evicts_the_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", VALUE)
+    cache.set("b", VALUE)
+    assert cache.get("a") == VALUE
+    cache.set("c", VALUE)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (VALUE, VALUE)
+    assert cache.stats.as_dict() == {"hits": 3, "misses": 1, "evictions": 1}
+    assert cache.stats.hit_rate == 0.75
+    assert len(cache) == 2
+
+
+def test_memory_cache_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("mintrans.cache.time.monotonic", clock)
+    cache = MemoryCache(ttl=10)
+    cache.set("a", VALUE)
+    clock.now += 9
+    assert cache.get("a") == VALUE
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "evictions": 1}
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists_and_expires(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("mintrans.cache.time.time", clock)
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteCache(path, ttl=10)
+    cache.set("a", VALUE)
+    cache.set("b", VALUE)
+    cache.close()
+
+    reopened = SQLiteCache(path, ttl=10)
+    assert reopened.get("a") == VALUE
+    clock.now += 11
+    assert reopened.get("a") is None
+    assert reopened.purge_expired() == 1
+    assert reopened.stats.as_dict() == {"hits": 1, "misses": 1, "evictions": 2}
+    reopened.close()
+
+
+def test_tiered_cache_warms_the_memory_tier(tmp_path):
+    persistent = SQLiteCache(tmp_path / "cache.sqlite")
+    persistent.set("a", VALUE)
+    cache = TieredCache(MemoryCache(max_size=4), persistent)
+    assert cache.get("a") == VALUE
+    assert cache.memory.stats.as_dict() == {"hits": 0, "misses": 1, "evictions": 0}
+    assert cache.get("a") == VALUE
+    assert cache.memory.stats.hits == 1 and persistent.stats.hits == 1
+    assert cache.get("missing") is None
+    assert cache.stats.as_dict() == {"hits": 2, "misses": 1, "evictions": 0}
+    cache.clear()
+    assert persistent.get("a") is None
+    cache.close()
+
+
+@pytest.mark.parametrize("text", [" Hello", "Hello "])
+def test_translator_cache_keeps_whitespace_apart(text):
+    translator = GoogleTranslator(cache=MemoryCache())
+    request = translator._validate_request("Hello", "de")
+    padded = translator._validate_request(text, "de")
+    assert translator._cache_key(request) != translator._cache_key(padded)
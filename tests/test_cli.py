@@ -0,0 +1,88 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mintrans import GoogleTranslator, cli
+from mintrans.cli import Journal, expand_inputs, main, translate_lines
+
+LINES = [f"Line number {index}." for index in range(5)] + ["", "  Indented line."]
+
+
+@pytest.fixture
+def job(tmp_path, connect, monkeypatch):
+    """Runs the workers on threads with translators connected to the mock server."""
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(cli, "_create_translator", lambda *args: connect(GoogleTranslator()))
+    source = tmp_path / "input.txt"
+    source.write_text("".join(line + "\n" for line in LINES), encoding="utf-8")
+    arguments = [str(source), "-t", "de", "-s", "en", "-q", "-j", "2", "--shard-size", "2"]
+    return tmp_path, arguments
+
+
+def test_translate_lines_keeps_blank_lines_and_splits_long_ones(connect):
+    translator = connect(GoogleTranslator())
+    long_line = " ".join(["A fairly short sentence."] * 100)
+    lines = ["Hello", "", "  World  ", long_line]
+    assert translate_lines(translator, lines, "de", "en") == lines
+    assert translate_lines(translator, [""], "de", "en") == [""]
+
+
+def test_expand_inputs(tmp_path):
+    for name in ("b.txt", "a.txt", "c.md"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    assert expand_inputs([str(tmp_path / "*.txt")]) == [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    assert expand_inputs([]) == ["-"]
+    with pytest.raises(FileNotFoundError):
+        expand_inputs([str(tmp_path / "*.csv")])
+
+
+def test_journal_replay_drops_a_torn_record(tmp_path):
+    path = tmp_path / "job.journal"
+    journal = Journal(path, {"job": 1})
+    journal.open(0)
+    journal.append(0, ["a", "b"])
+    journal.append(1, ["c"])
+    journal.close()
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"shard": 2, "lin')
+    assert list(journal.replay()) == [["a", "b"], ["c"]]
+    # Reopening after one shard drops everything behind it.
+    journal.open(1)
+    journal.close()
+    assert list(journal.replay()) == [["a", "b"]]
+    journal.check()
+    with pytest.raises(ValueError):
+        Journal(path, {"job": 2}).check()
+
+
+def test_job_writes_output_and_journal(job, mock_server):
+    tmp_path, arguments = job
+    assert main(arguments + ["-o", str(tmp_path / "out.txt"), "--journal", str(tmp_path / "job.journal")]) == 0
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8").splitlines() == LINES
+    records = (tmp_path / "job.journal").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(record)["shard"] for record in records[1:]] == [0, 1, 2, 3]
+    assert mock_server.requests["google"] == 4
+
+
+def test_job_resumes_from_the_journal(job, mock_server):
+    tmp_path, arguments = job
+    journal = tmp_path / "job.journal"
+    arguments += ["-o", str(tmp_path / "out.txt"), "--journal", str(journal)]
+    assert main(arguments) == 0
+    # Keep the header and two shards, as if the first run was interrupted while writing the third.
+    records = journal.read_text(encoding="utf-8").splitlines()
+    journal.write_text("\n".join(records[:3]) + "\n" + records[3][:10], encoding="utf-8")
+    assert main(arguments) == 0
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8").splitlines() == LINES
+    assert mock_server.requests["google"] == 4 + 2
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_journal_of_another_job_is_refused(job, mock_server, capsys):
+    tmp_path, arguments = job
+    journal = tmp_path / "job.journal"
+    assert main(arguments + ["-o", str(tmp_path / "out.txt"), "--journal", str(journal)]) == 0
+    assert main(arguments + ["-t", "fr", "-o", str(tmp_path / "out.txt"), "--journal", str(journal)]) == 2
+    assert "belongs to another job" in capsys.readouterr().err
+    assert mock_server.requests["google"] == 4
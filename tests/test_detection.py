@@ -0,0 +1,62 @@
+import pytest
+
+from mintrans import BingTranslator, GoogleTranslator, LanguageDetector
+
+
+@pytest.mark.parametrize("text, language", [
+    ("Καλημέρα, τι κάνεις;", "el"),
+    ("สวัสดีครับ ยินดีที่ได้รู้จัก", "th"),
+    ("こんにちは、元気ですか", "ja"),
+    ("안녕하세요 반갑습니다", "ko"),
+])
+def test_scripts_of_one_language_are_detected_by_default(text, language):
+    detected = LanguageDetector().detect(text)
+    assert (detected.language, detected.confidence) == (language, 1.0)
+    assert LanguageDetector(local=False).detect(text) is None
+
+
+@pytest.mark.parametrize("text, language", [
+    ("माझे नाव राहुल आहे आणि मी पुण्यात राहतो", "mr"),
+    ("मेरो नाम राम हो र म काठमाडौंमा बस्छु", "ne"),
+    ("মোৰ নাম ৰাহুল আৰু মই গুৱাহাটীত থাকো", "as"),
+])
+def test_scripts_of_several_languages_are_left_to_the_engine(text, language):
+    assert LanguageDetector().detect(text) is None
+    assert LanguageDetector(languages=[language, "en"]).detect(text).language == language
+
+
+def test_trigram_detection_is_opt_in():
+    text = "Where is the train station, please?"
+    assert LanguageDetector().detect(text) is None
+    assert LanguageDetector(trigrams=True).detect(text).language == "en"
+
+
+def test_translators_do_not_answer_unknown_languages_locally():
+    translator = GoogleTranslator()
+    assert translator._detect_local("Bu gün hava çox gözəldir, parka gedək.") is None
+    assert translator._detect_local("Saya suka makan nasi lemak pada waktu pagi bersama keluarga.") is None
+
+
+def test_languages_narrow_the_local_answers():
+    detector = LanguageDetector(trigrams=True, languages=["en", "de"])
+    assert detector.detect("Guten Morgen, wie geht es dir heute?").language == "de"
+    assert detector.detect("Bonjour, comment allez-vous aujourd'hui ?") is None
+
+
+def test_remembered_detections_are_kept_per_engine():
+    detector = LanguageDetector()
+    bing, google = BingTranslator(detector=detector), GoogleTranslator(detector=detector)
+    bing._detected("你好，世界", "zh-Hans")
+    assert bing._detect_local("你好，世界").language == "zh-hans"
+    assert google._detect_local("你好，世界") is None
+
+
+def test_translators_get_their_own_detector():
+    assert GoogleTranslator().detector is not GoogleTranslator().detector
+
+
+def test_detect_languages_answers_clear_scripts_without_a_request():
+    translator = GoogleTranslator()
+    results = translator.detect_languages(["Καλημέρα, τι κάνεις;", "สวัสดีครับ ยินดีที่ได้รู้จัก"])
+    assert [result.language for result in results] == ["el", "th"]
+    assert translator.client is None
@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+
+from mintrans.documents import DocumentPipeline, Segment, read_json
+from mintrans.models import TranslationResult
+
+
+class UpperTranslator:
+    """Upper-cases texts, fails on the batch numbered `fail_on` (1-based)."""
+
+    max_text_length = 1000
+
+    def __init__(self, engine: str = "fake", fail_on=None):
+        self.engine = engine
+        self.fail_on = fail_on
+        self.batches = []
+
+    def translate_batch(self, texts, target_language, source_language=None):
+        self.batches.append(list(texts))
+        if len(self.batches) == self.fail_on:
+            raise ConnectionError("connection lost")
+        return [TranslationResult(text.upper(), source_language or "auto", target_language) for text in texts]
+
+
+def write_lines(path, count: int):
+    path.write_text("".join(f"line number {index}\n" for index in range(count)), encoding="utf-8")
+
+
+def test_interrupted_run_resumes_from_the_checkpoint(tmp_path):
+    source, output, checkpoint = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "in.ckpt"
+    write_lines(source, 50)
+
+    crashing = UpperTranslator(fail_on=3)
+    with pytest.raises(ConnectionError):
+        DocumentPipeline(crashing, "de", window_size=10, checkpoint_path=checkpoint).translate_file(source, output)
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert saved["pieces"] == 20 and saved["engine"] == "fake" and saved["target_language"] == "de"
+
+    translator = UpperTranslator()
+    stats = DocumentPipeline(translator, "de", window_size=10, checkpoint_path=checkpoint).translate_file(source, output)
+    assert stats.resumed_pieces == 20
+    assert len(translator.batches) == 3 and translator.batches[0][0] == "line number 20"
+    assert output.read_text(encoding="utf-8") == source.read_text(encoding="utf-8").upper()
+    assert not checkpoint.exists()
+
+
+@pytest.mark.parametrize("change", ["edited input", "engine", "source language", "target language"])
+def test_checkpoint_of_another_run_is_refused(tmp_path, change):
+    source, output, checkpoint = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "in.ckpt"
+    write_lines(source, 30)
+    with pytest.raises(ConnectionError):
+        DocumentPipeline(UpperTranslator(fail_on=2), "de", "en", window_size=10, checkpoint_path=checkpoint).translate_file(source, output)
+
+    engine, source_language, target_language = "fake", "en", "de"
+    if change == "edited input":
+        # Same size, different text.
+        source.write_text(source.read_text(encoding="utf-8").replace("line number 1\n", "LINE NUMBER 1\n"), encoding="utf-8")
+    elif change == "engine":
+        engine = "other"
+    elif change == "source language":
+        source_language = None
+    else:
+        target_language = "fr"
+    pipeline = DocumentPipeline(UpperTranslator(engine), target_language, source_language, window_size=10, checkpoint_path=checkpoint)
+    with pytest.raises(ValueError, match="another run"):
+        pipeline.translate_file(source, output)
+
+
+def test_memo_skips_repeated_segments(tmp_path):
+    source, output = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("hello\nworld\n\nhello\n", encoding="utf-8")
+    translator = UpperTranslator()
+    stats = DocumentPipeline(translator, "de").translate_file(source, output)
+    assert (stats.segments, stats.translated) == (3, 2)
+    assert output.read_text(encoding="utf-8") == "HELLO\nWORLD\n\nHELLO\n"
+
+
+DOCUMENT = '{"id": "abc-1", "url": "https://example.com", "title": "Hello there", "tags": ["red car", {"name": "blue"}], "meta": {"title": "Inner"}}'
+
+
+@pytest.mark.parametrize("keys, expected", [
+    (None, ["abc-1", "https://example.com", "Hello there", "red car", "blue", "Inner"]),
+    (["title", "tags"], ["Hello there", "red car", "Inner"]),
+    ([], []),
+])
+def test_json_keys(keys, expected):
+    pieces = list(read_json(io.StringIO(DOCUMENT), chunk_size=5, keys=keys))
+    assert [piece.text for piece in pieces if isinstance(piece, Segment)] == expected
+    assert "".join(piece.render(piece.text) if isinstance(piece, Segment) else piece for piece in pieces) == DOCUMENT
+
+
+def test_json_keys_in_the_pipeline(tmp_path):
+    source, output = tmp_path / "in.json", tmp_path / "out.json"
+    source.write_text(DOCUMENT, encoding="utf-8")
+    DocumentPipeline(UpperTranslator(), "de", json_keys=["title"]).translate_file(source, output)
+    result = json.loads(output.read_text(encoding="utf-8"))
+    assert (result["id"], result["title"], result["meta"]["title"]) == ("abc-1", "HELLO THERE", "INNER")
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.mock_server import MockConfig
+from mintrans import AsyncDeepLTranslator, BingTranslator, DeepLTranslator, GoogleTranslator, MemoryCache
+
+TARGETS = ["de", "fr", "de", "es", "it"]
+
+
+@pytest.mark.parametrize("translator_class, text, requests", [
+    # Google takes every language pair in one request and detects the source on the way.
+    (GoogleTranslator, "Hello there", 1),
+    (GoogleTranslator, "こんにちは", 1),
+    # The others detect the source once, then send one request per target.
+    (DeepLTranslator, "Hello there", 1 + 4),
+    (BingTranslator, "Hello there", 1 + 1 + 4),
+    # Kana is detected locally, without a request.
+    (DeepLTranslator, "こんにちは", 4),
+    (BingTranslator, "こんにちは", 1 + 4),
+])
+def test_targets_are_translated_with_one_detection(translator_class, text, requests, connect, mock_server):
+    translator = connect(translator_class())
+    results = translator.translate_to_many(text, TARGETS)
+    assert list(results) == ["de", "fr", "es", "it"]
+    assert all(result.text == text and result.target_language == target for target, result in results.items())
+    assert len({result.source_language for result in results.values()}) == 1
+    assert sum(mock_server.requests.values()) == requests
+
+
+@pytest.mark.parametrize("translator_class", [GoogleTranslator, BingTranslator, DeepLTranslator])
+def test_stored_targets_are_not_sent_again(translator_class, connect, mock_server):
+    translator = connect(translator_class(cache=MemoryCache()))
+    translator.translate_to_many("Hello", ["de", "fr"], "en")
+    sent = sum(mock_server.requests.values())
+    results = translator.translate_to_many("Hello", ["fr", "de"], "en")
+    assert list(results) == ["fr", "de"]
+    assert sum(mock_server.requests.values()) == sent
+
+
+def test_targets_are_translated_concurrently(connect, mock_server):
+    mock_server.config = MockConfig(latency=0.1)
+    translator = connect(DeepLTranslator())
+    started = time.monotonic()
+    translator.translate_to_many("Hello", ["de", "fr", "es", "it"], "en")
+    concurrent = time.monotonic() - started
+    started = time.monotonic()
+    translator.translate_to_many("World", ["de", "fr", "es", "it"], "en", max_concurrency=1)
+    assert concurrent < 0.3
+    assert time.monotonic() - started >= 0.4
+
+
+def test_async_targets_are_translated_concurrently(connect, mock_server):
+    mock_server.config = MockConfig(latency=0.1)
+
+    async def main():
+        async with connect(AsyncDeepLTranslator()) as translator:
+            started = time.monotonic()
+            results = await translator.translate_to_many("Hello", ["de", "fr", "es", "it", "fr"], "en")
+            return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(main())
+    assert list(results) == ["de", "fr", "es", "it"]
+    assert elapsed < 0.3
+    assert mock_server.requests["deepl"] == 4
@@ -0,0 +1,69 @@
+import asyncio
+import base64
+
+import httpx
+import pytest
+
+from benchmarks.mock_server import AsyncLocalTransport, LocalTransport, MockServer
+from mintrans import AsyncGoogleTranslator, GoogleTranslator, Metrics
+from mintrans.images import ImageData, image_output_path, iter_image_paths
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+
+
+def form_base64(data: bytes) -> bytes:
+    return base64.b64encode(data).replace(b"+", b"%2B").replace(b"/", b"%2F").replace(b"=", b"%3D")
+
+
+@pytest.mark.parametrize("source", ["bytes", "path"])
+def test_image_is_encoded_once(tmp_path, monkeypatch, source):
+    path = tmp_path / "image.png"
+    path.write_bytes(PNG)
+    image = ImageData(path if source == "path" else PNG)
+    reads = []
+    iter_chunks = ImageData.iter_chunks
+    monkeypatch.setattr(ImageData, "iter_chunks", lambda self, *args: reads.append(1) or iter_chunks(self, *args))
+    assert image.mime_type == "image/png"
+    assert image.form_base64_length() == len(form_base64(PNG))
+    for chunk_size in (None, 100):
+        chunks = image.iter_form_base64(chunk_size) if chunk_size else image.iter_form_base64()
+        assert b"".join(chunks) == form_base64(PNG)
+    assert len(reads) == 1
+    image.close()
+
+
+def test_directory_walk_and_output_paths(tmp_path):
+    for name in ("b/same.jpg", "a/same.jpg", "a/c/same.png", "top.gif", "notes.txt"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(b"")
+    assert [path.relative_to(tmp_path).as_posix() for path in iter_image_paths(tmp_path)] == ["top.gif"]
+    paths = list(iter_image_paths(tmp_path, recursive=True))
+    assert [path.relative_to(tmp_path).as_posix() for path in paths] == ["top.gif", "a/same.jpg", "a/c/same.png", "b/same.jpg"]
+    outputs = {image_output_path("out", path, index, "image/jpeg", tmp_path) for index, path in enumerate(paths)}
+    assert len(outputs) == len(paths)
+    assert image_output_path("out", b"data", 3, "image/png").as_posix() == "out/image-3.png"
+
+
+def test_translate_image_with_metrics():
+    with MockServer() as server:
+        metrics = Metrics()
+        translator = GoogleTranslator(metrics=metrics)
+        translator.client = httpx.Client(transport=LocalTransport(server.port))
+        result = translator.translate_image(PNG, "de")
+        translator.close()
+
+        async_metrics = Metrics()
+
+        async def translate():
+            async_translator = AsyncGoogleTranslator(metrics=async_metrics)
+            async_translator.client = httpx.AsyncClient(transport=AsyncLocalTransport(server.port))
+            try:
+                return await async_translator.translate_image(PNG, "de")
+            finally:
+                await async_translator.aclose()
+
+        async_result = asyncio.run(translate())
+    for translated, counted in ((result, metrics), (async_result, async_metrics)):
+        assert translated.file == PNG and translated.text == "mock recognized text\nmock translated text"
+        assert counted.counter("google", "requests") == 1
+        assert counted.counter("google", "bytes_sent") > len(form_base64(PNG))
@@ -0,0 +1,77 @@
+import io
+
+import pytest
+
+from mintrans.documents import Segment
+from mintrans.markup import MarkupBatch, mask_placeholders, read_markup, unmask_placeholders
+from mintrans.models import TranslationResult
+
+DOCUMENT = (
+    '<!DOCTYPE html><html><head><title>Shop &amp; more</title>'
+    '<script>if (a < b && c > d) { document.write("<b>not text</b>"); }</script>'
+    '<style>p > b { color: red; }</style></head>'
+    '<body><!-- a <b>comment</b> --><p class="intro">Hello <b>dear</b> <a href="/x?a=1&amp;b=2">friend</a>, '
+    'it&#39;s&nbsp;late.</p><p translate="no">Brand name</p><pre>keep   this</pre>'
+    '<textarea>typed <b>text</b></textarea><p>Run <code>ls -l</code> now</p></body></html>'
+)
+
+
+def texts(pieces) -> list[str]:
+    return [piece.text for piece in pieces if isinstance(piece, Segment)]
+
+
+def render(pieces, translate) -> str:
+    return "".join(piece.render(translate(piece.text)) if isinstance(piece, Segment) else piece for piece in pieces)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 65536])
+def test_tags_split_across_chunks(chunk_size):
+    pieces = list(read_markup(io.StringIO(DOCUMENT), chunk_size))
+    assert texts(pieces) == ["Shop & more", "Hello {_1}dear{_2} {_3}friend{_4}, it's\xa0late.", "Run {_1} now"]
+    assert render(pieces, lambda text: text) == DOCUMENT
+
+
+def test_raw_text_skipped_and_no_translate_elements_are_kept():
+    pieces = list(read_markup(io.StringIO(DOCUMENT)))
+    output = render(pieces, str.upper)
+    for kept in ('document.write("<b>not text</b>")', "p > b { color: red; }", "<!-- a <b>comment</b> -->",
+                 '<p translate="no">Brand name</p>', "<pre>keep   this</pre>", "<textarea>typed <b>text</b></textarea>"):
+        assert kept in output
+    assert "<code>ls -l</code>" in output and "RUN <code>ls -l</code> NOW" in output
+
+
+def test_translations_keep_tags_and_entities():
+    pieces = list(read_markup(io.StringIO(DOCUMENT)))
+    output = render(pieces, lambda text: text.upper().replace("{_3}FRIEND{_4}", "{_3}<FRIEND>{_4}"))
+    assert '<p class="intro">HELLO <b>DEAR</b> <a href="/x?a=1&amp;b=2">&lt;FRIEND&gt;</a>, IT&#39;S&nbsp;LATE.</p>' in output
+    assert "<title>SHOP &amp; MORE</title>" in output
+
+
+def test_translation_that_lost_a_tag_keeps_the_source():
+    pieces = list(read_markup(io.StringIO("<p>Hello <b>dear</b> friend</p>")))
+    assert render(pieces, lambda text: "Hallo lieber Freund") == "<p>Hello <b>dear</b> friend</p>"
+
+
+def test_text_spelling_a_tag_token_is_sent_node_by_node():
+    pieces = list(read_markup(io.StringIO("<p>Use {_1} or <b>bold</b> text</p>")))
+    assert texts(pieces) == ["Use {_1} or", "bold", "text"]
+
+
+def test_placeholders_round_trip():
+    masked, placeholders = mask_placeholders("Hello {name}, you have %d new {{ kind }}")
+    assert masked == "Hello {1}, you have {2} new {3}"
+    assert unmask_placeholders("Hallo { 1 }, {3}: {2}", placeholders) == "Hallo {name}, {{ kind }}: %d"
+    assert unmask_placeholders("Hallo {1}, {2}", placeholders) is None
+    assert unmask_placeholders("Hallo {1}, {1}, {2} {3}", placeholders) is None
+
+
+def test_lost_placeholders_fall_back_to_pieces():
+    batch = MarkupBatch(["<p>Hello {name}, welcome <b>back</b>!</p>", "<li>Hello {name}, welcome <i>back</i>!</li>"])
+    assert batch.texts == ["Hello {1}, welcome {2}back{3}!"]
+    retry = batch.store([TranslationResult("Hallo, willkommen zurück!", "en", "de")])
+    assert retry == ["Hello", ", welcome", "back"]
+    batch.store_parts([TranslationResult(text, "en", "de") for text in ["Hallo", ", willkommen", "zurück"]])
+    assert batch.render() == [
+        "<p>Hallo {name}, willkommen <b>zurück</b>!</p>",
+        "<li>Hallo {name}, willkommen <i>zurück</i>!</li>",
+    ]
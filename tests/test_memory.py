@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from mintrans.memory import MemoryEntry, MemoryFile, TranslationMemory, adapt_translation, make_template
+
+
+def adapt(stored: str, query: str, target: str):
+    return adapt_translation(make_template(stored), make_template(query), target)
+
+
+def test_template_sets_tokens_and_suffix_aside():
+    template = make_template("  Order 1234   shipped to jane@example.com! ")
+    assert template.tokens == ["1234", "jane@example.com"]
+    assert template.suffix == "!"
+    assert "1234" not in template.key
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("Order 1234 shipped.", "Commande 1234 expédiée."),
+    ("Order 5 shipped", "Commande 5 expédiée"),
+    ("Order 7 shipped!", "Commande 7 expédiée !"),
+])
+def test_suffix_is_carried_without_a_dangling_space(query, expected):
+    assert adapt("Order 98 shipped!", query, "Commande 98 expédiée !") == expected
+
+
+def test_tokens_are_carried_in_place():
+    assert adapt(
+        "Visit https://a.example/x or call 555 at 10:30",
+        "Visit https://b.example/y or call 777 at 11:45",
+        "Besuchen Sie https://a.example/x oder rufen Sie um 10:30 die 555 an",
+    ) == "Besuchen Sie https://b.example/y oder rufen Sie um 11:45 die 777 an"
+
+
+def test_tokens_that_can_not_be_found_once_are_not_carried():
+    assert adapt("Pay 10 now", "Pay 20 now", "Zahlen Sie jetzt") is None
+    assert adapt("Room 5 of 5", "Room 3 of 6", "Zimmer 5 von 5") is None
+
+
+def test_lookup_fills_a_template():
+    memory = TranslationMemory()
+    memory.add("Order 98 shipped!", "Commande 98 expédiée !", "fr", "en", "google")
+    match = memory.lookup("Order 1234 shipped.", "fr", "en")
+    assert match.text == "Commande 1234 expédiée."
+    assert match.similarity == 1.0
+    assert memory.lookup("Order 1234 shipped.", "de", "en") is None
+
+
+def test_near_duplicate_with_a_carried_edit():
+    memory = TranslationMemory(threshold=0.8)
+    memory.add("Welcome to Paris, we hope you enjoy your stay", "Bienvenue à Paris, nous espérons que vous apprécierez votre séjour", "fr", "en")
+    match = memory.lookup("Welcome to Berlin, we hope you enjoy your stay", "fr", "en")
+    assert match.text == "Bienvenue à Berlin, nous espérons que vous apprécierez votre séjour"
+    assert 0.8 <= match.similarity < 1.0
+
+
+def test_near_duplicates_are_only_reused_when_the_edit_can_be_carried():
+    memory = TranslationMemory(threshold=0.8)
+    memory.add("The quick brown fox jumps over the lazy dog", "Der schnelle braune Fuchs springt über den faulen Hund", "de", "en")
+    assert memory.lookup("The quick brown fox jumps over the lazy cat", "de", "en") is None
+    assert memory.lookup("Something else entirely, nothing alike", "de", "en") is None
+
+
+def test_engine_specific_lookup():
+    memory = TranslationMemory(engine_specific=True)
+    memory.add("Good morning", "Guten Morgen", "de", "en", "bing")
+    assert memory.lookup("Good morning", "de", "en", engine="google") is None
+    assert memory.lookup("Good morning", "de", "en", engine="bing").text == "Guten Morgen"
+
+
+def test_file_round_trip(tmp_path):
+    path = tmp_path / "memory.tm"
+    memory = TranslationMemory(path)
+    entries = [
+        MemoryEntry(f"Invoice {index} is due", f"Rechnung {index} ist fällig", "de", "en", "google")
+        for index in range(50)
+    ]
+    entries.append(MemoryEntry("Hello, world", "Hallo, Welt", "DE", None, "bing", "EN"))
+    assert memory.save(extra=entries) == len(entries)
+    memory.close()
+
+    memory_file = MemoryFile(path)
+    read = list(memory_file)
+    memory_file.close()
+    assert [entry.to_dict() for entry in read] == [entry.to_dict() for entry in entries]
+    assert read[-1].target_language == "de" and read[-1].source_language == "" and read[-1].detected_language == "en"
+
+    with TranslationMemory(path) as reopened:
+        assert len(reopened) == len(entries)
+        assert reopened.lookup("Invoice 999 is due", "de", "en").text == "Rechnung 999 ist fällig"
+
+
+def test_not_a_memory_file(tmp_path):
+    path = tmp_path / "memory.tm"
+    path.write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        MemoryFile(path)
+
+
+def test_save_while_mapped_keeps_old_and_new_entries(tmp_path):
+    path = tmp_path / "memory.tm"
+    memory = TranslationMemory(path)
+    memory.add("Good morning", "Guten Morgen", "de", "en")
+    memory.save()
+    assert memory.lookup("Good morning", "de", "en").text == "Guten Morgen"
+    memory.add("Good night", "Gute Nacht", "de", "en")
+    assert memory.save() == 2
+    assert memory.lookup("Good morning", "de", "en").text == "Guten Morgen"
+    assert memory.lookup("Good night", "de", "en").text == "Gute Nacht"
+    memory.close()
+
+
+def test_jsonl_import_and_export(tmp_path):
+    source = tmp_path / "in.jsonl"
+    lines = [
+        {"source": "Yes", "target": "Ja", "target_language": "de", "source_language": "en"},
+        {"source": "No", "target": "Nein", "target_language": "de", "engine": "deepl"},
+    ]
+    source.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+
+    in_memory = TranslationMemory()
+    assert in_memory.import_jsonl(source) == 2
+    assert in_memory.lookup("Yes", "de", "en").text == "Ja"
+
+    with TranslationMemory(tmp_path / "memory.tm") as on_disk:
+        assert on_disk.import_jsonl(source) == 2
+        assert len(on_disk) == 2
+        exported = tmp_path / "out.jsonl"
+        assert on_disk.export_jsonl(exported) == 2
+    rows = [json.loads(line) for line in exported.read_text(encoding="utf-8").splitlines()]
+    assert [(row["source"], row["target"], row["engine"]) for row in rows] == [("Yes", "Ja", ""), ("No", "Nein", "deepl")]
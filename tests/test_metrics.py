@@ -0,0 +1,98 @@
+import threading
+
+from mintrans import BingTranslator, GoogleTranslator, MemoryCache
+from mintrans.metrics import CallbackSink, Histogram, Metrics, NULL_CLOCK
+
+
+def test_histogram_buckets_include_their_upper_bound():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.as_dict() == {"count": 4, "sum": 5.65, "mean": 5.65 / 4}
+    assert Histogram().as_dict()["mean"] == 0.0
+
+
+def test_counters_from_many_threads():
+    metrics = Metrics()
+
+    def count():
+        for _ in range(1000):
+            metrics.count("google", "requests")
+
+    threads = [threading.Thread(target=count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.counter("google", "requests") == 8000
+    assert metrics.counter("bing", "requests") == 0
+
+
+def test_sinks_get_every_event():
+    counts, observations = [], []
+    metrics = Metrics(sinks=[CallbackSink(lambda *event: counts.append(event), lambda *event: observations.append(event))])
+    metrics.count("bing", "retries", 2)
+    clock = metrics.clock("bing")
+    clock.mark("build")
+    clock.mark("network")
+    assert counts == [("bing", "retries", 2)]
+    assert [phase for _, phase, _ in observations] == ["build", "network"]
+    assert all(seconds >= 0 for _, _, seconds in observations)
+    # A callback sink without callbacks ignores events.
+    Metrics(sinks=[CallbackSink()]).count("bing", "retries")
+
+
+def test_snapshot_and_reset():
+    metrics = Metrics()
+    metrics.count("deepl", "errors")
+    metrics.observe("deepl", "network", 0.25)
+    assert metrics.snapshot() == {"deepl": {"counters": {"errors": 1}, "phases": {"network": {"count": 1, "sum": 0.25, "mean": 0.25}}}}
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_text():
+    metrics = Metrics(buckets=(0.5, 0.1))
+    metrics.count("google", "requests", 3)
+    metrics.count("bing", "requests")
+    metrics.count("bing", "captchas")
+    metrics.observe("google", "network", 0.2)
+    assert metrics.prometheus_text() == (
+        "# TYPE mintrans_captchas_total counter\n"
+        'mintrans_captchas_total{engine="bing"} 1\n'
+        "# TYPE mintrans_requests_total counter\n"
+        'mintrans_requests_total{engine="bing"} 1\n'
+        'mintrans_requests_total{engine="google"} 3\n'
+        "# TYPE mintrans_phase_seconds histogram\n"
+        'mintrans_phase_seconds_bucket{engine="google",phase="network",le="0.1"} 0\n'
+        'mintrans_phase_seconds_bucket{engine="google",phase="network",le="0.5"} 1\n'
+        'mintrans_phase_seconds_bucket{engine="google",phase="network",le="+Inf"} 1\n'
+        'mintrans_phase_seconds_sum{engine="google",phase="network"} 0.2\n'
+        'mintrans_phase_seconds_count{engine="google",phase="network"} 1\n'
+    )
+    assert Metrics().prometheus_text(prefix="other") == "\n"
+
+
+def test_null_clock_ignores_marks():
+    NULL_CLOCK.reset()
+    NULL_CLOCK.mark("network")
+
+
+def test_translators_report_requests_bytes_and_phases(connect):
+    metrics = Metrics()
+    google = connect(GoogleTranslator(cache=MemoryCache(), metrics=metrics))
+    bing = connect(BingTranslator(metrics=metrics))
+    google.translate_text("Hello", "de", "en")
+    google.translate_text("Hello", "de", "en")
+    bing.translate_text("Hello", "de", "en")
+    snapshot = metrics.snapshot()
+    assert snapshot["google"]["counters"]["requests"] == 1
+    assert snapshot["google"]["counters"]["cache_hits"] == 1
+    assert snapshot["google"]["counters"]["bytes_sent"] > 0
+    assert snapshot["google"]["counters"]["bytes_received"] > 0
+    # Bing fetches its session page first.
+    assert snapshot["bing"]["counters"]["requests"] == 2
+    assert {"validate", "cache", "session", "build", "network", "decode"} <= set(snapshot["google"]["phases"])
+    assert snapshot["google"]["phases"]["network"]["count"] == 1
+    assert 'mintrans_requests_total{engine="bing"} 2' in metrics.prometheus_text()
@@ -0,0 +1,81 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from benchmarks.mock_server import LocalTransport, MockConfig, google_body
+from benchmarks.throughput import SCENARIOS, Benchmark, percentile
+from mintrans import BingTranslator, CaptchaException
+from mintrans.ratelimit import RetryPolicy
+
+
+@pytest.fixture
+def client(mock_server):
+    with httpx.Client(transport=LocalTransport(mock_server.port)) as client:
+        yield client
+
+
+def test_every_host_is_sent_to_the_mock(client, mock_server):
+    assert client.get("https://www.bing.com/translator").status_code == 200
+    assert client.get("https://example.com/elsewhere").status_code == 404
+    assert mock_server.requests == {"bing": 1}
+
+
+def test_google_bodies():
+    frames = [["wrb.fr", "MkEWBc", "[]", None, None, None, "1"], ["wrb.fr", "MkEWBc", "[]", None, None, None, "2"]]
+    plain = google_body(frames, [["di", 12]])
+    assert plain.startswith(")]}'\n\n") and len(json.loads(plain[6:])) == 3
+    lines = google_body(frames, [["di", 12]], chunked=True)[6:].split("\n")[:-1]
+    sizes, chunks = lines[0::2], lines[1::2]
+    assert len(chunks) == 3
+    assert all(int(size) == len(chunk) + 1 for size, chunk in zip(sizes, chunks))
+
+
+def test_latency_is_injected(client, mock_server):
+    mock_server.config = MockConfig(latency=0.1)
+    started = time.monotonic()
+    client.get("https://www.bing.com/translator")
+    assert time.monotonic() - started >= 0.1
+
+
+def test_errors_and_rate_limits_are_injected(client, mock_server):
+    mock_server.config = MockConfig(error_rate=1.0)
+    assert client.get("https://www.bing.com/translator").status_code == 500
+    mock_server.config = MockConfig(rate_limit=0.1, burst=1)
+    assert client.get("https://www.bing.com/translator").status_code == 200
+    response = client.get("https://www.bing.com/translator")
+    assert response.status_code == 429 and response.headers["retry-after"] == "1"
+
+
+def test_captchas_refresh_the_bing_session(mock_server):
+    mock_server.config = MockConfig(captcha_rate=1.0)
+    translator = BingTranslator(retry_policy=RetryPolicy(max_attempts=3, base_delay=0))
+    translator.client = httpx.Client(transport=LocalTransport(mock_server.port))
+    with pytest.raises(CaptchaException):
+        translator.translate_text("Hello", "de", "en")
+    # Each attempt fetches a new session page before translating.
+    assert mock_server.requests["bing"] == 6
+
+
+def test_percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 99), percentile(values, 100)) == (51.0, 99.0, 100.0)
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.parametrize("engine", ["bing", "deepl", "google"])
+def test_benchmark_scenarios(engine, mock_server):
+    benchmark = Benchmark(mock_server.port, requests=10, batch_size=5, concurrency=4, retry_policy=RetryPolicy(base_delay=0))
+    for scenario in SCENARIOS:
+        report = benchmark.run(engine, scenario, memory=scenario == "single").as_dict()
+        assert report["errors"] == 0
+        assert report["calls"] == (2 if scenario == "batch" else 10)
+        assert (report["peak_kib"] > 0) == (scenario == "single")
+
+
+def test_benchmark_counts_failed_calls(mock_server):
+    mock_server.config = MockConfig(error_rate=1.0)
+    benchmark = Benchmark(mock_server.port, requests=5, batch_size=5, concurrency=4, retry_policy=RetryPolicy(max_attempts=1))
+    report = benchmark.run("google", "single", memory=False)
+    assert report.errors == 5 and report.latencies == []
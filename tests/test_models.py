@@ -0,0 +1,26 @@
+import pytest
+
+from mintrans import GoogleTranslator
+from mintrans.models import TranslationResponse, TranslationResult
+
+
+def test_results_compare_and_hash_by_value():
+    result = TranslationResult("Hallo", "EN", "de")
+    assert result == TranslationResult("Hallo", "en", "DE")
+    assert result == TranslationResponse(text="Hallo", source_language="en", target_language="de")
+    assert len({result, TranslationResult("Hallo", "en", "de"), TranslationResult("Hi", "en", "de")}) == 2
+    assert {result: 1}[TranslationResult("Hallo", "en", "de")] == 1
+
+
+@pytest.mark.parametrize("validate", [False, True])
+@pytest.mark.parametrize("arguments", [(5, "de", None), ("text", None, None), ("text", "de", 5), ("text", "de", ["en"])])
+def test_invalid_requests_raise_value_error(validate, arguments):
+    translator = GoogleTranslator(validate=validate)
+    with pytest.raises(ValueError):
+        translator._validate_request(*arguments)
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_requests_are_lowered_and_default_to_auto(validate):
+    request = GoogleTranslator(validate=validate)._validate_request("text", "DE")
+    assert (request.text, request.source_language, request.target_language) == ("text", "auto", "de")
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+
+from benchmarks.mock_server import LocalTransport, MockServer
+from mintrans import AsyncGoogleTranslator, GoogleTranslator
+from mintrans.pool import TranslatorPool, translate_many
+
+
+class MockGoogleTranslator(GoogleTranslator):
+    """Sends to the mock server and records whether it was closed."""
+
+    port = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.client = httpx.Client(transport=LocalTransport(self.port))
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def test_the_default_translator_is_closed_with_the_pool(monkeypatch):
+    created = []
+    monkeypatch.setattr("mintrans.pool.GoogleTranslator", lambda: created.append(MockGoogleTranslator()) or created[-1])
+    with MockServer() as server:
+        MockGoogleTranslator.port = server.port
+        results = translate_many([f"text {index}" for index in range(20)], "de", max_workers=4)
+    assert [result.text for result in results] == [f"text {index}" for index in range(20)]
+    assert len(created) == 1 and created[0].closed and created[0].client is None
+
+
+def test_a_given_translator_stays_open():
+    with MockServer() as server:
+        MockGoogleTranslator.port = server.port
+        translator = MockGoogleTranslator()
+        with TranslatorPool(translator, max_workers=2) as pool:
+            assert sorted(index for index, _ in pool.translate_many(["a", "b", "c"], "de", ordered=False)) == [0, 1, 2]
+        assert not translator.closed
+        assert translator.translate_text("still open", "de").text == "still open"
+        translator.close()
+
+
+def test_a_pool_client_is_only_given_to_translators_without_one():
+    translator = GoogleTranslator()
+    with TranslatorPool(translator) as pool:
+        assert isinstance(pool.translator.client, httpx.Client)
+    translator.close()
+
+
+def test_async_translators_are_refused():
+    translator = AsyncGoogleTranslator()
+    with pytest.raises(TypeError):
+        TranslatorPool(translator)
+    assert translator.client is None
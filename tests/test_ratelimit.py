@@ -0,0 +1,103 @@
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from benchmarks.mock_server import MockConfig
+from mintrans import GoogleTranslator, RateLimitException
+from mintrans.metrics import Metrics
+from mintrans.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    # Reservations queue up behind each other.
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_acquire_waits_for_the_token():
+    bucket = TokenBucket(rate=20)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started == pytest.approx(0.1, abs=0.05)
+
+
+def test_blocked_bucket_hands_out_no_tokens():
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.block(0.5)
+    assert bucket.reserve() == pytest.approx(0.6, abs=0.01)
+
+
+def test_bucket_rejects_a_rate_of_zero():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_backoff_doubles_up_to_the_limit():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.0, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+    assert all(0 <= RetryPolicy(base_delay=0.5).delay(3) <= 2.0 for _ in range(100))
+
+
+def test_retry_after_takes_precedence_over_backoff():
+    policy = RetryPolicy(base_delay=0.5, max_delay=10.0, jitter=False)
+    assert policy.delay(1, retry_after=4.0) == 4.0
+    assert policy.delay(1, retry_after=60.0) == 10.0
+
+
+def test_only_listed_errors_are_retried():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(RateLimitException(), 1)
+    assert policy.should_retry(httpx.ConnectError("refused"), 2)
+    assert not policy.should_retry(RateLimitException(), 3)
+    assert not policy.should_retry(ValueError(), 1)
+
+
+@pytest.mark.parametrize("value, expected", [("3", 3.0), ("0.5", 0.5), ("-2", 0.0), ("", None), (None, None), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_as_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_rate_limited_requests_are_retried(connect, mock_server):
+    # The server allows one request and then one every 50ms, replying 429 with Retry-After: 1 in between.
+    mock_server.config = MockConfig(rate_limit=20, burst=1)
+    metrics = Metrics()
+    translator = connect(GoogleTranslator(retry_policy=RetryPolicy(max_attempts=10, max_delay=0.06), metrics=metrics))
+    for index in range(3):
+        assert translator.translate_text(f"Hello {index}", "de", "en").text == f"Hello {index}"
+    rate_limits = metrics.counter("google", "rate_limits")
+    assert rate_limits > 0
+    assert metrics.counter("google", "retries") == rate_limits
+    assert mock_server.requests["google"] == 3 + rate_limits
+
+
+def test_retry_after_blocks_the_shared_bucket(connect, mock_server):
+    mock_server.config = MockConfig(rate_limit=0.1, burst=1)
+    bucket = TokenBucket(rate=100, burst=10)
+    translator = connect(GoogleTranslator(rate_limiter=bucket, retry_policy=RetryPolicy(max_attempts=1)))
+    translator.translate_text("Hello", "de", "en")
+    with pytest.raises(RateLimitException) as raised:
+        translator.translate_text("World", "de", "en")
+    assert raised.value.retry_after == 1.0
+    assert bucket.reserve() > 0.9
+
+
+def test_client_side_bucket_stays_under_the_server_limit(connect, mock_server):
+    mock_server.config = MockConfig(rate_limit=20, burst=1)
+    metrics = Metrics()
+    translator = connect(GoogleTranslator(rate_limiter=TokenBucket(rate=10), retry_policy=RetryPolicy(max_attempts=1), metrics=metrics))
+    for index in range(4):
+        translator.translate_text(f"Hello {index}", "de", "en")
+    assert metrics.counter("google", "rate_limits") == 0
+    assert mock_server.requests["google"] == 4
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+
+from mintrans import AsyncGoogleTranslator, GoogleTranslator, RateLimitException
+from mintrans.exceptions import EngineUnavailableException
+from mintrans.models import TranslationResult
+from mintrans.router import AsyncRouterTranslator, RouterTranslator
+
+
+class FakeTranslator(GoogleTranslator):
+    """Answers with its own name after `delay` seconds, or raises `error`."""
+
+    def __init__(self, name: str, delay: float = 0.0, error=None):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def translate_text(self, text, target_language, source_language=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return TranslationResult(self.name, source_language or "en", target_language)
+
+
+class AsyncFakeTranslator(AsyncGoogleTranslator):
+    def __init__(self, name: str, delay: float = 0.0, error=None):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def translate_text(self, text, target_language, source_language=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return TranslationResult(self.name, source_language or "en", target_language)
+
+
+def test_route_when_every_engine_always_fails():
+    translators = [GoogleTranslator(), GoogleTranslator()]
+    router = RouterTranslator(translators)
+    for health in router.health.values():
+        health.error_rate = 1.0
+    assert sorted(map(id, router._route())) == sorted(map(id, translators))
+
+
+def test_health_is_kept_per_translator():
+    first, second = GoogleTranslator(), GoogleTranslator()
+    router = RouterTranslator([first, second])
+    router.health[first].record_failure()
+    assert router.health[first].consecutive_failures == 1
+    assert router.health[second].consecutive_failures == 0
+
+
+def test_failover_to_the_next_engine():
+    failing, working = FakeTranslator("failing", error=RateLimitException()), FakeTranslator("working")
+    router = RouterTranslator([failing, working])
+    router._route = lambda: [failing, working]
+    for _ in range(5):
+        assert router.translate_text("Hello", "de").text == "working"
+    assert router.health[working].consecutive_failures == 0
+    assert router.health[failing].error_rate > 0
+
+
+def test_failing_engine_cools_down(monkeypatch):
+    # The weighted pick always lands on the first healthy engine.
+    monkeypatch.setattr("mintrans.router.random.choices", lambda population, weights: population[:1])
+    failing, working = FakeTranslator("failing", error=RateLimitException()), FakeTranslator("working")
+    router = RouterTranslator([failing, working])
+    for _ in range(10):
+        router.translate_text("Hello", "de")
+    # Three failures in a row put it aside, it is not called again during the cooldown.
+    assert failing.calls == router.health[failing].failure_threshold
+    assert not router.health[failing].available
+
+
+def test_all_engines_failing():
+    router = RouterTranslator([FakeTranslator("a", error=RateLimitException()), FakeTranslator("b", error=RateLimitException())])
+    with pytest.raises(EngineUnavailableException):
+        router.translate_text("Hello", "de")
+
+
+def test_invalid_input_is_not_an_engine_failure():
+    translators = [FakeTranslator("a"), FakeTranslator("b")]
+    router = RouterTranslator(translators)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            router.translate_text("x" * 2000, "de")
+    with pytest.raises(ValueError):
+        router.translate_to_many(5, ["de", "fr"])
+    assert all(translator.calls == 0 for translator in translators)
+    assert all(health.error_rate == 0 and health.available for health in router.health.values())
+
+
+def test_hedged_request_is_won_by_the_faster_engine():
+    slow, fast = FakeTranslator("slow", delay=1.0), FakeTranslator("fast")
+    with RouterTranslator([slow, fast], hedge=True, hedge_delay=0.05) as router:
+        router._route = lambda: [slow, fast]
+        started = time.monotonic()
+        assert router.translate_text("Hello", "de").text == "fast"
+        assert time.monotonic() - started < 0.5
+
+
+def test_async_failover_and_hedging():
+    async def main():
+        failing = AsyncFakeTranslator("failing", error=RateLimitException())
+        slow, fast = AsyncFakeTranslator("slow", delay=1.0), AsyncFakeTranslator("fast")
+        router = AsyncRouterTranslator([failing, slow, fast], hedge=True, hedge_delay=0.05)
+        router._route = lambda: [failing, slow, fast]
+        started = time.monotonic()
+        result = await router.translate_text("Hello", "de")
+        elapsed = time.monotonic() - started
+        with pytest.raises(ValueError):
+            await router.translate_text("x" * 2000, "de")
+        await router.aclose()
+        return result, elapsed, router.health[failing].consecutive_failures
+
+    result, elapsed, failures = asyncio.run(main())
+    assert result.text == "fast" and elapsed < 0.5
+    assert failures == 1
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.mock_server import MockConfig
+from mintrans import AsyncBingTranslator, AsyncGoogleTranslator, RateLimitException
+from mintrans.models import TranslationResult
+from mintrans.ratelimit import RetryPolicy
+from mintrans.server import AsyncTranslationClient, MicroBatcher, TranslationClient, TranslationServer
+
+
+class RecordingTranslator(AsyncGoogleTranslator):
+    """Echoes texts and records the batches it was given."""
+
+    def __init__(self, error=None):
+        super().__init__()
+        self.batches = []
+        self.error = error
+
+    async def translate_batch(self, texts, target_language, source_language=None):
+        self.batches.append(list(texts))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [TranslationResult(text, source_language, target_language) for text in texts]
+
+
+def test_callers_within_the_window_share_one_batch():
+    async def main():
+        translator = RecordingTranslator()
+        batcher = MicroBatcher({"google": translator}, window=0.05)
+        results = await asyncio.gather(
+            *(batcher.translate("google", text, "de", "en") for text in ["a", "b", "a", "c"]),
+            batcher.translate("google", "a", "fr", "en"),
+        )
+        return translator.batches, results, batcher.stats["google"]
+
+    batches, results, stats = asyncio.run(main())
+    assert sorted(batches) == [["a"], ["a", "b", "c"]]
+    assert [(result.text, result.target_language) for result in results] == [("a", "de"), ("b", "de"), ("a", "de"), ("c", "de"), ("a", "fr")]
+    assert stats == {"requests": 5, "batches": 2, "texts": 4}
+
+
+def test_full_batch_is_sent_before_the_window_ends():
+    async def main():
+        translator = RecordingTranslator()
+        batcher = MicroBatcher({"google": translator}, window=10.0, max_batch=2)
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.translate("google", text, "de") for text in "ab")), 1.0)
+        pending = asyncio.ensure_future(batcher.translate("google", "c", "de"))
+        await asyncio.sleep(0.01)
+        # The third text waits for the window, drain sends it right away.
+        await batcher.drain()
+        return translator.batches, results, await pending
+
+    batches, results, last = asyncio.run(main())
+    assert batches == [["a", "b"], ["c"]]
+    assert [result.text for result in results] == ["a", "b"] and last.text == "c"
+
+
+def test_batch_error_reaches_every_caller():
+    async def main():
+        batcher = MicroBatcher({"google": RecordingTranslator(error=RateLimitException(retry_after=2.0))})
+        results = await asyncio.gather(*(batcher.translate("google", text, "de") for text in "ab"), return_exceptions=True)
+        with pytest.raises(ValueError):
+            await batcher.translate("deepl", "a", "de")
+        with pytest.raises(ValueError):
+            await batcher.translate("google", "x" * 5001, "de")
+        return results, batcher.stats["google"]["errors"]
+
+    results, errors = asyncio.run(main())
+    assert all(isinstance(result, RateLimitException) for result in results)
+    assert errors == 1
+
+
+def test_cancelled_caller_leaves_the_others_their_result():
+    async def main():
+        batcher = MicroBatcher({"google": RecordingTranslator()}, window=0.05)
+        leaving = asyncio.ensure_future(batcher.translate("google", "a", "de"))
+        staying = asyncio.ensure_future(batcher.translate("google", "a", "de"))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        return await staying
+
+    assert asyncio.run(main()).text == "a"
+
+
+@pytest.fixture
+def server(connect):
+    translators = {"google": connect(AsyncGoogleTranslator()), "bing": connect(AsyncBingTranslator())}
+    with TranslationServer(translators, port=0, window=0.1) as server:
+        yield server
+
+
+def test_clients_are_batched_through_the_mock(server, mock_server):
+    clients = [TranslationClient(f"http://127.0.0.1:{server.port}") for _ in range(20)]
+    barrier = threading.Barrier(len(clients))
+
+    def translate(index):
+        barrier.wait()
+        return clients[index].translate_text(f"Hello {index % 10}", "de", "en")
+
+    with ThreadPoolExecutor(len(clients)) as executor:
+        results = list(executor.map(translate, range(len(clients))))
+    assert [result.text for result in results] == [f"Hello {index % 10}" for index in range(20)]
+    stats = clients[0].stats()["google"]
+    for client in clients:
+        client.close()
+    assert stats["requests"] == 20 and stats["batches"] <= 2
+    assert mock_server.requests["google"] == stats["batches"]
+
+
+def test_client_batches_and_engines(server, mock_server):
+    with TranslationClient(f"http://127.0.0.1:{server.port}", engine="bing") as client:
+        results = client.translate_batch(["One", "Two", "One"], "de", "en")
+        assert [result.text for result in results] == ["One", "Two", "One"]
+        with pytest.raises(ValueError):
+            client.translate_text("x" * 5001, "de")
+    assert mock_server.requests["bing"] == 2
+
+
+def test_errors_are_raised_by_the_client(connect, mock_server):
+    mock_server.config = MockConfig(rate_limit=0.1, burst=1)
+    translator = connect(AsyncGoogleTranslator(retry_policy=RetryPolicy(max_attempts=1)))
+    with TranslationServer({"google": translator}, port=0, window=0.01) as server:
+        with TranslationClient(f"http://127.0.0.1:{server.port}") as client:
+            assert client.translate_text("Hello", "de").text == "Hello"
+            with pytest.raises(RateLimitException) as raised:
+                client.translate_text("World", "de")
+            assert raised.value.retry_after == 1.0
+            with pytest.raises(ValueError):
+                client.translate_text("x" * 5001, "de")
+            assert client.client.get("/nothing").status_code == 404
+
+
+def test_async_client_over_a_unix_socket(tmp_path, connect):
+    path = str(tmp_path / "mintrans.sock")
+    with TranslationServer({"google": connect(AsyncGoogleTranslator())}, path=path, window=0.02):
+        async def main():
+            async with AsyncTranslationClient(path=path) as client:
+                return await asyncio.gather(*(client.translate_text(text, "de", "en") for text in ["a", "b", "c"]))
+
+        assert [result.text for result in asyncio.run(main())] == ["a", "b", "c"]
+    assert not (tmp_path / "mintrans.sock").exists()
@@ -0,0 +1,44 @@
+import json
+
+import httpx
+import pytest
+
+from mintrans.exceptions import CaptchaException
+from mintrans.session import BingSession, BingSessionManager, parse_bing_session
+
+PAGE = 'var params_AbusePreventionHelper = [1700000000000,"token-1",3600000];IG:"ABC123";'
+
+
+def page_response(text: str) -> httpx.Response:
+    return httpx.Response(200, text=text, request=httpx.Request("GET", "https://www.bing.com/translator"))
+
+
+def test_parse_session():
+    session = parse_bing_session(page_response(PAGE))
+    assert (session.key, session.token, session.ig) == ("1700000000000", "token-1", "ABC123")
+    assert 3590 < session.expires_in() <= 3600
+
+
+@pytest.mark.parametrize("text", ["<html>captcha</html>", 'IG:"ABC123";', 'var params_AbusePreventionHelper = [1,"t",3600000];'])
+def test_pages_without_credentials_raise(text):
+    with pytest.raises(CaptchaException):
+        parse_bing_session(page_response(text))
+
+
+def test_failed_page_is_never_stored(tmp_path):
+    store_path = tmp_path / "session.json"
+    manager = BingSessionManager(store_path=store_path)
+    with pytest.raises(CaptchaException):
+        manager.get(lambda: parse_bing_session(page_response("<html>captcha</html>")))
+    assert manager.session is None and not store_path.exists()
+    session = manager.get(lambda: parse_bing_session(page_response(PAGE)))
+    assert json.loads(store_path.read_text(encoding="utf-8"))["token"] == session.token
+
+
+def test_incomplete_stored_session_is_not_loaded(tmp_path):
+    store_path = tmp_path / "session.json"
+    incomplete = BingSession(None, None, None, expires_at=4102444800.0)
+    store_path.write_text(json.dumps(incomplete.to_dict()), encoding="utf-8")
+    manager = BingSessionManager(store_path=store_path)
+    session = manager.get(lambda: parse_bing_session(page_response(PAGE)))
+    assert session.token == "token-1"
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mintrans.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_waiters_share_the_leaders_result():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", call)
+        started.wait(5)
+        waiters = [executor.submit(flight.do, "key", call) for _ in range(3)]
+        # The waiters are parked on the leader's future before it finishes.
+        threading.Event().wait(0.1)
+        release.set()
+        assert leader.result() == ("result", False)
+        assert [waiter.result() for waiter in waiters] == [("result", True)] * 3
+    assert len(calls) == 1 and len(flight) == 0
+
+
+def test_leaders_exception_reaches_every_waiter():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+    def call():
+        started.set()
+        release.wait(5)
+        raise ConnectionError("engine down")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", call)
+        started.wait(5)
+        waiters = [executor.submit(flight.do, "key", lambda: "not called") for _ in range(3)]
+        # The waiters are parked on the leader's future before it fails.
+        threading.Event().wait(0.1)
+        release.set()
+        for future in [leader, *waiters]:
+            with pytest.raises(ConnectionError):
+                future.result()
+    assert len(flight) == 0
+    assert flight.do("key", lambda: "fresh") == ("fresh", False)
+    assert len(flight) == 0
+
+
+def test_async_exception_reaches_every_waiter_and_keys_are_cleaned_up():
+    async def main():
+        flight, calls = AsyncSingleFlight(), []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise ConnectionError("engine down")
+
+        results = await asyncio.gather(*(flight.do("key", failing) for _ in range(4)), return_exceptions=True)
+        assert len(calls) == 1 and all(isinstance(result, ConnectionError) for result in results)
+        assert len(flight) == 0
+
+        async def working():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", working) for _ in range(3)))
+        assert results == [("result", False), ("result", True), ("result", True)]
+        assert len(flight) == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    async def main():
+        flight, finished = AsyncSingleFlight(), []
+
+        async def call():
+            await asyncio.sleep(0.05)
+            finished.append(1)
+            return "result"
+
+        leader = asyncio.ensure_future(flight.do("key", call))
+        waiter = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter == ("result", True)
+        assert finished == [1] and leader.cancelled()
+        assert len(flight) == 0
+
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mintrans import AsyncGoogleTranslator, GoogleTranslator
+from mintrans.models import TranslationResult
+from mintrans.tools import split_text, strip_chunk
+
+PARAGRAPHS = "First paragraph. It has two sentences.\n\n  Second one, indented!\nWith a line break?\n\n\nThird."
+TEXTS = [
+    PARAGRAPHS,
+    "word " * 200,
+    "x" * 1000,
+    "  leading and trailing whitespace  \n",
+    "一句话。又一句话！第三句话？" * 20,
+    "\n\n\n",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("limit", [1, 5, 17, 40, 100, 5000])
+def test_chunks_join_back_to_the_text(text, limit):
+    chunks = split_text(text, limit)
+    assert "".join(chunks) == text
+    assert all(0 < len(chunk) <= limit for chunk in chunks)
+    for chunk in chunks:
+        assert "".join(strip_chunk(chunk)) == chunk
+
+
+@pytest.mark.parametrize("limit, expected", [
+    # Every paragraph fits.
+    (45, ["First paragraph. It has two sentences.\n\n  ", "Second one, indented!\nWith a line break?\n\n\n", "Third."]),
+    # The first paragraph goes sentence by sentence (it has no line breaks), the second line by line.
+    (40, ["First paragraph. ", "It has two sentences.\n\n  ", "Second one, indented!\n", "With a line break?\n\n\n", "Third."]),
+    # Sentences and lines that do not fit go word by word.
+    (20, ["First paragraph. ", "It has two ", "sentences.\n\n  ", "Second one, ", "indented!\n", "With a line ", "break?\n\n\n", "Third."]),
+])
+def test_widest_boundary_that_fits(limit, expected):
+    assert split_text(PARAGRAPHS, limit) == expected
+
+
+def test_word_and_hard_cut_fallbacks():
+    assert split_text("alpha beta gamma delta", 11) == ["alpha beta ", "gamma delta"]
+    assert split_text("abcdefghij klm", 4) == ["abcd", "efgh", "ij ", "klm"]
+
+
+def test_strip_chunk():
+    assert strip_chunk("\n  Hello world \t") == ("\n  ", "Hello world", " \t")
+    assert strip_chunk("   ") == ("   ", "", "")
+
+
+class SlowTranslator(GoogleTranslator):
+    max_text_length = 20
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def translate_text(self, text, target_language, source_language=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return TranslationResult(text.upper(), "en", target_language)
+
+
+class AsyncSlowTranslator(AsyncGoogleTranslator):
+    max_text_length = 20
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = self.peak = 0
+
+    async def translate_text(self, text, target_language, source_language=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return TranslationResult(text.upper(), "en", target_language)
+
+
+TEXT = " ".join(f"Sentence number {index}." for index in range(20))
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_long_text_concurrency_limit(max_concurrency):
+    translator = SlowTranslator()
+    result = translator.translate_long_text(TEXT, "de", max_concurrency=max_concurrency)
+    assert result.text == TEXT.upper()
+    assert translator.peak == max_concurrency
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_async_long_text_concurrency_limit(max_concurrency):
+    translator = AsyncSlowTranslator()
+    result = asyncio.run(translator.translate_long_text(TEXT, "de", max_concurrency=max_concurrency))
+    assert result.text == TEXT.upper()
+    assert translator.peak == max_concurrency
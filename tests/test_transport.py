@@ -0,0 +1,123 @@
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.mock_server import AsyncLocalTransport, LocalTransport
+from mintrans import AsyncGoogleTranslator, BingTranslator, GoogleTranslator
+from mintrans.ratelimit import RetryPolicy
+from mintrans.transport import ProxyPool, SharedTransport, TransportConfig
+
+GOOD, BAD = "http://good.proxy:8080", "http://bad.proxy:8080"
+
+
+class LocalSharedTransport(SharedTransport):
+    """Sends through the mock server, except for the `blocked` proxies which always get a 429."""
+
+    def __init__(self, port: int, proxies=None, blocked=()):
+        super().__init__(proxies=proxies)
+        self.port = port
+        self.blocked = set(blocked)
+
+    def _blocked(self, request):
+        return httpx.Response(429, request=request)
+
+    def get_client(self, proxy=None):
+        with self._lock:
+            if proxy not in self._clients:
+                transport = httpx.MockTransport(self._blocked) if proxy in self.blocked else LocalTransport(self.port)
+                self._clients[proxy] = httpx.Client(transport=transport)
+            return self._clients[proxy]
+
+    def get_async_client(self, proxy=None):
+        with self._lock:
+            if proxy not in self._async_clients:
+                transport = httpx.MockTransport(self._blocked) if proxy in self.blocked else AsyncLocalTransport(self.port)
+                self._async_clients[proxy] = httpx.AsyncClient(transport=transport)
+            return self._async_clients[proxy]
+
+
+def test_client_settings():
+    kwargs = TransportConfig(max_connections=7, timeout=4.0, connect_timeout=1.0).client_kwargs("http://proxy:1")
+    assert kwargs["limits"].max_connections == 7
+    assert (kwargs["timeout"].read, kwargs["timeout"].connect) == (4.0, 1.0)
+    assert kwargs["proxy"] == "http://proxy:1"
+    assert "proxy" not in TransportConfig().client_kwargs()
+
+
+def test_proxies_rotate_round_robin():
+    pool = ProxyPool(["a", "b", "c"])
+    assert [pool.next() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+    with pytest.raises(ValueError):
+        ProxyPool([])
+
+
+def test_failing_proxy_cools_down():
+    pool = ProxyPool(["a", "b"], failure_threshold=2, cooldown=60)
+    pool.record_failure("a")
+    pool.record_success("a")
+    pool.record_failure("a")
+    assert pool.health["a"].cooldown_until == 0.0
+    pool.record_failure("a")
+    assert [pool.next() for _ in range(4)] == ["b"] * 4
+    pool.record_failure("b")
+    pool.record_failure("b")
+    # With every proxy cooling down the one recovering first is used.
+    assert pool.next() == "a"
+
+
+def test_clients_are_shared_and_closed():
+    transport = SharedTransport()
+    client = transport.get_client()
+    assert transport.get_client() is client
+    assert transport.get_client("http://proxy:1") is not client
+    transport.close()
+    assert client.is_closed
+    assert transport.get_client() is not client
+    transport.close()
+
+
+def test_translators_share_one_client(mock_server):
+    transport = LocalSharedTransport(mock_server.port)
+    google, bing = GoogleTranslator(transport=transport), BingTranslator(transport=transport)
+    assert google.translate_text("Hello", "de", "en").text == "Hello"
+    assert bing.translate_text("Hello", "de", "en").text == "Hello"
+    client = transport.get_client()
+    assert list(transport._clients) == [None]
+    assert mock_server.requests == {"google": 1, "bing": 2}
+    google.close()
+    bing.close()
+    # The shared client outlives the translators.
+    assert not client.is_closed
+    assert GoogleTranslator(transport=transport).translate_text("World", "de", "en").text == "World"
+    transport.close()
+    assert client.is_closed
+
+
+def test_blocked_proxy_is_put_aside(mock_server):
+    transport = LocalSharedTransport(mock_server.port, proxies=ProxyPool([BAD, GOOD], failure_threshold=2), blocked=[BAD])
+    translator = GoogleTranslator(transport=transport, retry_policy=RetryPolicy(base_delay=0))
+    for index in range(6):
+        assert translator.translate_text(f"Hello {index}", "de", "en").text == f"Hello {index}"
+    health = transport.proxy_pool.health
+    assert health[BAD].failures == 2 and health[BAD].cooldown_until > 0
+    assert health[GOOD].successes == 6
+    assert mock_server.requests["google"] == 6
+    transport.close()
+
+
+def test_async_translators_share_one_client(mock_server):
+    async def main():
+        transport = LocalSharedTransport(mock_server.port, proxies=[BAD, GOOD], blocked=[BAD])
+        translators = [AsyncGoogleTranslator(transport=transport, retry_policy=RetryPolicy(base_delay=0)) for _ in range(3)]
+        results = await asyncio.gather(*(translator.translate_text(f"Hello {index}", "de", "en") for index, translator in enumerate(translators)))
+        for translator in translators:
+            await translator.aclose()
+        client = transport.get_async_client(GOOD)
+        await transport.aclose()
+        return [result.text for result in results], transport.proxy_pool.health, client
+
+    texts, health, client = asyncio.run(main())
+    assert texts == ["Hello 0", "Hello 1", "Hello 2"]
+    assert health[GOOD].successes == 3 and health[BAD].failures > 0
+    assert client.is_closed